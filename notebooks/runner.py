@@ -53,24 +53,9 @@ else:
     }
     os.environ["CATALOG_NAME"] = catalog_mapping.get(environment, "main")
 
-# Set common paths based on environment
-env_paths = {
-    "dev": {
-        "LANDING_ZONE_PATH": "/mnt/landing/dev",
-        "CHECKPOINT_PATH": "/mnt/checkpoints/dev",
-    },
-    "qa": {
-        "LANDING_ZONE_PATH": "/mnt/landing/qa",
-        "CHECKPOINT_PATH": "/mnt/checkpoints/qa",
-    },
-    "prd": {
-        "LANDING_ZONE_PATH": "/mnt/landing/prd",
-        "CHECKPOINT_PATH": "/mnt/checkpoints/prd",
-    },
-}
-
-for key, value in env_paths.get(environment, {}).items():
-    os.environ[key] = value
+# Set common paths based on environment (layout is uniform across environments)
+os.environ["LANDING_ZONE_PATH"] = f"/mnt/landing/{environment}"
+os.environ["CHECKPOINT_PATH"] = f"/mnt/checkpoints/{environment}"
 
 print(f"Catalog: {os.environ.get('CATALOG_NAME')}")
 print(f"Landing Zone: {os.environ.get('LANDING_ZONE_PATH')}")
@@ -225,11 +210,7 @@ if dry_run:
     
     if dry_run_result.get("sample_data"):
         print("\nSample Data Preview:")
-        sample_df = spark.createDataFrame(
-            [dry_run_result["sample_data"]]
-        ) if dry_run_result["sample_data"] else None
-        if sample_df:
-            display(sample_df)
+        display(spark.createDataFrame(dry_run_result["sample_data"]))
     
     # Exit with success for dry run
     dbutils.notebook.exit("DRY_RUN_COMPLETE")
@@ -3,28 +3,43 @@ Datalib - Databricks Data Engineering Library
 
 A reusable, configuration-driven library for data processing on Databricks.
 Supports bronze/silver/gold medallion architecture patterns.
-"""
 
-from datalib._version import __version__, __version_info__, __environment__
+Public classes and functions are imported lazily on first attribute access
+(PEP 562), so lightweight entry points such as ``datalib.cli`` don't pay
+for PyYAML or PySpark imports.
+"""
 
-from datalib.core.config import ConfigLoader, PipelineConfig
-from datalib.core.pipeline import Pipeline, PipelineRunner
-from datalib.core.context import SparkContext, DatabricksContext
+from __future__ import annotations
 
-from datalib.io.reader import DataReader
-from datalib.io.writer import DataWriter
+import importlib
+from typing import Any
 
-from datalib.transformations.base import Transformation
-from datalib.transformations.common import (
-    AddTimestampColumn,
-    CastColumns,
-    RenameColumns,
-    FilterRows,
-    DeduplicateRows,
-)
+from datalib._version import __version__, __version_info__, __environment__
 
-from datalib.utils.logging import get_logger
-from datalib.utils.validators import validate_config, validate_schema
+# Public attribute name -> module that defines it
+_LAZY_IMPORTS = {
+    # Core
+    "ConfigLoader": "datalib.core.config",
+    "PipelineConfig": "datalib.core.config",
+    "Pipeline": "datalib.core.pipeline",
+    "PipelineRunner": "datalib.core.pipeline",
+    "SparkContext": "datalib.core.context",
+    "DatabricksContext": "datalib.core.context",
+    # I/O
+    "DataReader": "datalib.io.reader",
+    "DataWriter": "datalib.io.writer",
+    # Transformations
+    "Transformation": "datalib.transformations.base",
+    "AddTimestampColumn": "datalib.transformations.common",
+    "CastColumns": "datalib.transformations.common",
+    "RenameColumns": "datalib.transformations.common",
+    "FilterRows": "datalib.transformations.common",
+    "DeduplicateRows": "datalib.transformations.common",
+    # Utils
+    "get_logger": "datalib.utils.logging",
+    "validate_config": "datalib.utils.validators",
+    "validate_schema": "datalib.utils.validators",
+}
 
 __all__ = [
     # Version
@@ -53,3 +68,19 @@ __all__ = [
     "validate_config",
     "validate_schema",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes on first access and cache them on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily imported attributes in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
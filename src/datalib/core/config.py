@@ -7,21 +7,135 @@ validation, and hierarchical merging.
 
 from __future__ import annotations
 
+import copy
+import fnmatch
+import hashlib
+import json
 import os
 import re
-from dataclasses import dataclass, field
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings not available
+    # Same loader interface, pure-Python implementation
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Medallion layers accepted by PipelineConfig
+_VALID_LAYERS = frozenset(("bronze", "silver", "gold"))
+
+# Environment names used as override file suffixes: <name>.<env>.yaml
+_ENV_SUFFIXES = frozenset(("dev", "qa", "prd"))
+
+# Upper bounds for the process-wide caches; least recently used entries go first
+_PARSE_CACHE_SIZE = 256
+_CONFIG_CACHE_SIZE = 128
+
+_V = TypeVar("_V")
+
+
+class _LRUCache(Generic[_V]):
+    """Small thread-safe LRU mapping for the module-level config caches."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, _V]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[_V]:
+        """Return the cached value (marking it recently used) or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def put(self, key: Hashable, value: _V) -> None:
+        """Store a value, evicting the least recently used entries over maxsize."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Raw (pre-substitution) parses by path: ((mtime_ns, size) or None, content
+# digest, document, referenced variable names). A changed file replaces its
+# entry rather than adding one.
+_ParseEntry = Tuple[Optional[Tuple[int, int]], bytes, Dict[str, Any], FrozenSet[str]]
+_PARSE_CACHE: _LRUCache[_ParseEntry] = _LRUCache(_PARSE_CACHE_SIZE)
+
+# Fully built PipelineConfigs keyed by file content hashes and substitution inputs
+_CONFIG_CACHE: _LRUCache["PipelineConfig"] = _LRUCache(_CONFIG_CACHE_SIZE)
+
+
+def _content_digest(data: bytes) -> bytes:
+    """Content hash of a file (independent of mtime, which is unreliable on DBFS)."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _glob_configs(search_path: str, pattern: str) -> Tuple[Path, ...]:
+    """
+    Recursive equivalent of `Path.glob(f"**/{pattern}")`.
+    
+    Walks with os.scandir and only builds Path objects for matching files.
+    """
+    match = re.compile(fnmatch.translate(pattern)).match
+    matches = []
+    stack = [search_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif match(entry.name) and entry.is_file():
+                        matches.append(entry.path)
+        except OSError:
+            continue
+    return tuple(Path(p) for p in matches)
+
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or cannot be loaded."""
     pass
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SourceConfig:
     """Configuration for data source."""
     type: str  # jdbc, delta, parquet, csv, json, etc.
@@ -32,19 +146,25 @@ class SourceConfig:
     connection_string: Optional[str] = None
     query: Optional[str] = None
     options: Dict[str, Any] = field(default_factory=dict)
+    read_schema: Optional[str] = None  # DDL schema for CSV/JSON; skips inference
+    partition_column: Optional[str] = None  # Numeric/date column for parallel JDBC reads
+    _fqn: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
-    def get_full_table_name(self) -> Optional[str]:
-        """Get fully qualified table name."""
+    def __post_init__(self):
+        """Precompute the fully qualified table name (table parts are fixed after construction)."""
         if self.catalog and self.schema and self.table:
-            return f"{self.catalog}.{self.schema}.{self.table}"
+            self._fqn = f"{self.catalog}.{self.schema}.{self.table}"
         elif self.schema and self.table:
-            return f"{self.schema}.{self.table}"
+            self._fqn = f"{self.schema}.{self.table}"
         elif self.table:
-            return self.table
-        return None
+            self._fqn = self.table
+    
+    def get_full_table_name(self) -> Optional[str]:
+        """Get fully qualified table name."""
+        return self._fqn
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TargetConfig:
     """Configuration for data target."""
     catalog: str
@@ -56,13 +176,18 @@ class TargetConfig:
     options: Dict[str, Any] = field(default_factory=dict)
     merge_keys: List[str] = field(default_factory=list)
     scd_columns: List[str] = field(default_factory=list)
+    _fqn: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute the fully qualified table name (table parts are fixed after construction)."""
+        self._fqn = f"{self.catalog}.{self.schema}.{self.table}"
     
     def get_full_table_name(self) -> str:
         """Get fully qualified table name."""
-        return f"{self.catalog}.{self.schema}.{self.table}"
+        return self._fqn
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingConfig:
     """Configuration for processing behavior."""
     mode: str = "full"  # full, incremental
@@ -75,7 +200,7 @@ class ProcessingConfig:
     options: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TransformationConfig:
     """Configuration for a transformation step."""
     type: str
@@ -83,7 +208,7 @@ class TransformationConfig:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class QualityConfig:
     """Configuration for data quality checks."""
     enabled: bool = True
@@ -91,7 +216,7 @@ class QualityConfig:
     checks: List[Dict[str, Any]] = field(default_factory=list)
     
     
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PipelineConfig:
     """Complete pipeline configuration."""
     name: str
@@ -112,14 +237,91 @@ class PipelineConfig:
         """Validate configuration after initialization."""
         if not self.name:
             raise ConfigurationError("Pipeline name is required")
-        if self.layer not in ("bronze", "silver", "gold"):
+        if self.layer not in _VALID_LAYERS:
             raise ConfigurationError(f"Invalid layer: {self.layer}. Must be bronze, silver, or gold")
         
         # Handle single source vs multiple sources
         if self.source and not self.sources:
             self.sources = [self.source]
         elif self.sources and not self.source:
-            self.source = self.sources[0] if self.sources else None
+            self.source = self.sources[0]
+
+
+# Constructor field names per config dataclass, computed once
+_INIT_FIELDS: Dict[type, FrozenSet[str]] = {
+    cls: frozenset(f.name for f in fields(cls) if f.init)
+    for cls in (SourceConfig, TargetConfig, ProcessingConfig, TransformationConfig, QualityConfig)
+}
+
+
+def _known_fields(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop keys that are not constructor fields of `cls`.
+    
+    Lets configs carry extra metadata keys without breaking older library versions.
+    """
+    names = _INIT_FIELDS[cls]
+    return {k: v for k, v in data.items() if k in names}
+
+
+# Constructor fields without defaults per config dataclass, computed once
+_REQUIRED_FIELDS: Dict[type, Tuple[str, ...]] = {
+    cls: tuple(
+        f.name for f in fields(cls)
+        if f.init and f.default is MISSING and f.default_factory is MISSING
+    )
+    for cls in _INIT_FIELDS
+}
+
+# Expected container type of each top-level section, and the dataclass built from it
+_SECTION_SPECS: Dict[str, Tuple[type, Optional[type]]] = {
+    "pipeline": (dict, None),
+    "source": (dict, SourceConfig),
+    "sources": (list, SourceConfig),
+    "target": (dict, TargetConfig),
+    "processing": (dict, ProcessingConfig),
+    "transformations": (list, TransformationConfig),
+    "quality": (dict, QualityConfig),
+    "parameters": (dict, None),
+}
+
+
+def _validate_config_dict(config: Any) -> None:
+    """
+    Check section types and required fields before building dataclasses.
+    
+    Raises:
+        ConfigurationError: If the structure is invalid
+    """
+    if not isinstance(config, dict):
+        raise ConfigurationError(
+            f"Configuration must be a mapping, got {type(config).__name__}"
+        )
+    
+    for section, (expected_type, cls) in _SECTION_SPECS.items():
+        value = config.get(section)
+        if value is None:
+            continue
+        if not isinstance(value, expected_type):
+            raise ConfigurationError(
+                f"Section '{section}' must be a {expected_type.__name__}, "
+                f"got {type(value).__name__}"
+            )
+        if cls is None:
+            continue
+        
+        entries = value if isinstance(value, list) else [value]
+        for entry in entries:
+            if not isinstance(entry, dict):
+                raise ConfigurationError(f"Entries in '{section}' must be mappings")
+            # An empty single-entry section means "not configured"
+            if not entry and expected_type is dict:
+                continue
+            missing = [name for name in _REQUIRED_FIELDS[cls] if name not in entry]
+            if missing:
+                raise ConfigurationError(
+                    f"Section '{section}' is missing required fields: {missing}"
+                )
 
 
 class ConfigLoader:
@@ -131,6 +333,7 @@ class ConfigLoader:
     - ${ENV_VAR:default} syntax for defaults
     - Hierarchical configuration merging
     - Widget parameter substitution from Databricks notebooks
+    - Optional JSON sidecar caches for faster warm-start parsing
     """
     
     ENV_PATTERN = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
@@ -139,7 +342,8 @@ class ConfigLoader:
         self,
         base_path: Optional[Union[str, Path]] = None,
         environment: Optional[str] = None,
-        widget_params: Optional[Dict[str, str]] = None
+        widget_params: Optional[Dict[str, str]] = None,
+        sidecar_cache: bool = False
     ):
         """
         Initialize configuration loader.
@@ -148,70 +352,111 @@ class ConfigLoader:
             base_path: Base path for configuration files
             environment: Environment name (dev, qa, prd)
             widget_params: Parameters from Databricks notebook widgets
+            sidecar_cache: Write/read `<name>.<hash>.cache.json` next to each YAML
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
         self.environment = environment or os.getenv("ENVIRONMENT", "dev")
         self.widget_params = widget_params or {}
+        self.sidecar_cache = sidecar_cache
         
     def _substitute_variables(self, value: Any) -> Any:
         """
         Substitute environment variables and widget parameters in value.
         
+        Nested dicts and lists are updated in place, so callers must pass
+        freshly parsed (or copied) data.
+        
         Args:
             value: Value to process (string, dict, or list)
             
         Returns:
             Value with variables substituted
         """
+        replace = self._make_replacer()
+        sub = self.ENV_PATTERN.sub
+        
         if isinstance(value, str):
-            def replace_match(match):
-                var_name = match.group(1)
-                default_value = match.group(2)
-                
-                # Check widget params first, then environment variables
-                if var_name in self.widget_params:
-                    return self.widget_params[var_name]
-                    
-                env_value = os.getenv(var_name)
-                if env_value is not None:
-                    return env_value
-                elif default_value is not None:
-                    return default_value
-                else:
-                    raise ConfigurationError(
-                        f"Environment variable '{var_name}' not found and no default provided"
-                    )
-            
-            return self.ENV_PATTERN.sub(replace_match, value)
-            
-        elif isinstance(value, dict):
-            return {k: self._substitute_variables(v) for k, v in value.items()}
+            return sub(replace, value) if "${" in value else value
+        if not isinstance(value, (dict, list)):
+            return value
+        
+        stack = deque([value])
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, item in items:
+                if isinstance(item, str):
+                    if "${" in item:
+                        container[key] = sub(replace, item)
+                elif isinstance(item, (dict, list)):
+                    stack.append(item)
+        
+        return value
+    
+    def _make_replacer(self) -> Callable[[re.Match], str]:
+        """
+        Build the ENV_PATTERN replacement callback for one substitution pass.
+        
+        Widget params take precedence over environment variables. Both are
+        looked up per match rather than merged up front, so loads with few
+        (or no) placeholders don't copy the whole environment.
+        
+        Returns:
+            Function mapping a ${VAR} / ${VAR:default} match to its value
+        """
+        widget_params = self.widget_params
+        environ = os.environ
+        
+        def replace_match(match):
+            var_name = match.group(1)
             
-        elif isinstance(value, list):
-            return [self._substitute_variables(item) for item in value]
+            resolved = widget_params.get(var_name)
+            if resolved is None:
+                resolved = environ.get(var_name)
+            if resolved is not None:
+                return resolved
             
-        return value
+            default_value = match.group(2)
+            if default_value is not None:
+                return default_value
+            raise ConfigurationError(
+                f"Environment variable '{var_name}' not found and no default provided"
+            )
+        
+        return replace_match
     
     def _merge_configs(self, base: Dict, override: Dict) -> Dict:
         """
         Deep merge two configuration dictionaries.
         
+        `base` is updated in place (callers pass freshly loaded dicts).
+        
         Args:
             base: Base configuration
             override: Override configuration
             
         Returns:
-            Merged configuration
+            Merged configuration (the updated `base`)
         """
-        result = base.copy()
+        stack = [(base, override)]
         
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
                 
-        return result
+        return base
+    
+    def _resolve_path(self, file_path: Union[str, Path]) -> Path:
+        """Resolve a relative path against base_path."""
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.base_path / path
+        return path
     
     def load_yaml(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -223,23 +468,192 @@ class ConfigLoader:
         Returns:
             Parsed and substituted configuration dictionary
         """
-        path = Path(file_path)
-        if not path.is_absolute():
-            path = self.base_path / path
+        path = self._resolve_path(file_path)
             
         if not path.exists():
             raise ConfigurationError(f"Configuration file not found: {path}")
+        
+        return self._load_parsed(path)
+    
+    def load_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply variable substitution to an in-memory configuration.
+        
+        Equivalent to `load_yaml` for a file containing `data`, without the
+        file or the YAML parser. `data` itself is left unchanged.
+        
+        Args:
+            data: Configuration dictionary, possibly containing ${VAR} placeholders
+            
+        Returns:
+            Substituted copy of the configuration dictionary
+        """
+        config: Dict[str, Any] = self._substitute_variables(copy.deepcopy(data))
+        return config
+    
+    def _load_parsed(self, path: Path, data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Parse (or fetch from cache) a YAML file and apply substitution.
+        
+        Args:
+            path: Resolved path to YAML file
+            data: File contents, if the caller has already read them
+            
+        Returns:
+            Parsed and substituted configuration dictionary
+        """
+        config: Dict[str, Any] = self._substitute_variables(
+            copy.deepcopy(self._parse_cached(path, data))
+        )
+        return config
+    
+    def _parse_cached(self, path: Path, data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Return the raw (pre-substitution) parse of a file from the cache.
+        
+        The returned document is shared; callers must not mutate it.
+        """
+        return self._parse_entry(path, data)[0]
+    
+    def _parse_entry(
+        self,
+        path: Path,
+        data: Optional[bytes] = None
+    ) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """
+        Return a file's cached raw parse and the variable names it references.
+        
+        Args:
+            path: Resolved path to YAML file
+            data: File contents, if the caller has already read them
+            
+        Returns:
+            Tuple of (shared raw document, names used in ${...} placeholders)
+        """
+        # Substitution depends on env/widgets, so only the raw parse is cached
+        key = str(path)
+        entry = _PARSE_CACHE.get(key)
+        stamp: Optional[Tuple[int, int]] = None
+        
+        if data is not None:
+            # Callers with the bytes in hand validate by content: a same-size
+            # rewrite that keeps the mtime (DBFS/workspace files) is still seen
+            if entry is not None and entry[1] == _content_digest(data):
+                return entry[2], entry[3]
+        else:
+            st = path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            if entry is not None and entry[0] == stamp:
+                return entry[2], entry[3]
+            data = path.read_bytes()
+        
+        config = self._parse_yaml(path, data)
+        variables = self._referenced_variables(config)
+        _PARSE_CACHE.put(key, (stamp, _content_digest(data), config, variables))
+        return config, variables
+    
+    @classmethod
+    def _referenced_variables(cls, value: Any) -> FrozenSet[str]:
+        """Names of all ${VAR} / ${VAR:default} placeholders in a raw document."""
+        names: Set[str] = set()
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                if "${" in item:
+                    names.update(match.group(1) for match in cls.ENV_PATTERN.finditer(item))
+            elif isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, list):
+                stack.extend(item)
+        return frozenset(names)
+    
+    def is_enabled(self, config_path: Union[str, Path]) -> bool:
+        """
+        Check a config's ``pipeline.enabled`` flag without building it.
+        
+        Only the cached raw parse is read, so no substitution or validation
+        runs. Pipelines are enabled unless the flag is explicitly false.
+        
+        Args:
+            config_path: Path to configuration file
+            
+        Returns:
+            False if the pipeline is disabled, True otherwise
+        """
+        path = self._resolve_path(config_path)
+        try:
+            config = self._parse_cached(path)
+        except (OSError, ConfigurationError):
+            # Let the full load report unreadable or malformed files
+            return True
+        pipeline = config.get("pipeline") if isinstance(config, dict) else None
+        return not (isinstance(pipeline, dict) and pipeline.get("enabled") is False)
+    
+    def _parse_yaml(self, path: Path, data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Parse a YAML file, using a JSON sidecar cache when enabled.
+        
+        Sidecar names embed a hash of the YAML content, so stale sidecars
+        are never read; the YAML file always stays authoritative.
+        
+        Args:
+            path: Resolved path to YAML file
+            data: File contents, if the caller has already read them
             
+        Returns:
+            Parsed configuration dictionary (before substitution)
+        """
+        # Single unbuffered read; libyaml then parses the bytes without a Python decode
+        if data is None:
+            data = path.read_bytes()
+        
+        sidecar = None
+        if self.sidecar_cache:
+            digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+            sidecar = path.with_suffix(f".{digest}.cache.json")
+            try:
+                cached: Dict[str, Any] = json.loads(sidecar.read_bytes())
+                return cached
+            except (OSError, ValueError):
+                pass
+        
         try:
-            with open(path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = yaml.load(data, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in {path}: {e}")
             
         if config is None:
             config = {}
-            
-        return self._substitute_variables(config)
+        
+        if sidecar is not None:
+            self._write_sidecar(sidecar, config)
+        
+        return config
+    
+    @staticmethod
+    def _write_sidecar(sidecar: Path, config: Dict[str, Any]) -> None:
+        """Best-effort write of a JSON sidecar (skipped for non-JSON-safe configs)."""
+        try:
+            payload = json.dumps(config)
+        except (TypeError, ValueError):
+            return
+        
+        # Dates and non-string keys don't survive a JSON round-trip
+        if json.loads(payload) != config:
+            return
+        
+        try:
+            sidecar.write_text(payload)
+        except OSError:
+            # Read-only locations (e.g. workspace files) simply skip the cache
+            pass
+    
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Clear the process-wide caches of parsed YAML files and built configs."""
+        _PARSE_CACHE.clear()
+        _CONFIG_CACHE.clear()
     
     def load_pipeline_config(
         self,
@@ -256,21 +670,75 @@ class ConfigLoader:
         Returns:
             Validated PipelineConfig object
         """
-        config = self.load_yaml(config_path)
+        main_path = self._resolve_path(config_path)
+        override_path = self._resolve_path(env_override_path) if env_override_path else None
         
-        # Apply environment-specific overrides if provided
-        if env_override_path:
-            env_config = self.load_yaml(env_override_path)
-            config = self._merge_configs(config, env_config)
-            
         # Look for default environment overrides
-        config_path = Path(config_path)
-        env_file = config_path.parent / f"{config_path.stem}.{self.environment}.yaml"
-        if env_file.exists():
-            env_config = self.load_yaml(env_file)
-            config = self._merge_configs(config, env_config)
+        env_file = main_path.parent / f"{main_path.stem}.{self.environment}.yaml"
+        
+        # Read each file once: the bytes feed both the cache key and the parser
+        contents = []
+        for path in (main_path, override_path):
+            if path is None:
+                continue
+            try:
+                contents.append((path, path.read_bytes()))
+            except FileNotFoundError:
+                raise ConfigurationError(f"Configuration file not found: {path}") from None
+        try:
+            contents.append((env_file, env_file.read_bytes()))
+        except FileNotFoundError:
+            pass
+        
+        # Cache key covers file contents plus the values of the variables the
+        # files reference, so unrelated env/widget changes still hit the cache
+        variables = frozenset().union(
+            *(self._parse_entry(path, data)[1] for path, data in contents)
+        )
+        cache_key = (
+            tuple((str(path), _content_digest(data)) for path, data in contents),
+            self.environment,
+            tuple(
+                (name, self.widget_params.get(name), os.environ.get(name))
+                for name in sorted(variables)
+            ),
+        )
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        # Main config first, then explicit overrides, then <stem>.<env>.yaml
+        config = self._load_parsed(*contents[0])
+        for path, data in contents[1:]:
+            config = self._merge_configs(config, self._load_parsed(path, data))
         
-        return self._dict_to_pipeline_config(config)
+        pipeline_config = self._dict_to_pipeline_config(config)
+        _CONFIG_CACHE.put(cache_key, copy.deepcopy(pipeline_config))
+        return pipeline_config
+    
+    def load_many(
+        self,
+        config_paths: List[Union[str, Path]],
+        max_workers: int = 16
+    ) -> List[PipelineConfig]:
+        """
+        Load several pipeline configurations concurrently.
+        
+        File reads overlap on a thread pool, which helps on high-latency
+        filesystems such as DBFS or workspace files.
+        
+        Args:
+            config_paths: Paths to configuration files
+            max_workers: Maximum number of loader threads
+            
+        Returns:
+            PipelineConfig objects in the same order as `config_paths`
+        """
+        if not config_paths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(config_paths))) as executor:
+            return list(executor.map(self.load_pipeline_config, config_paths))
     
     def _dict_to_pipeline_config(self, config: Dict[str, Any]) -> PipelineConfig:
         """
@@ -282,31 +750,36 @@ class ConfigLoader:
         Returns:
             PipelineConfig instance
         """
+        _validate_config_dict(config)
+        
         pipeline_data = config.get("pipeline", {})
         
         # Parse source config
         source_data = config.get("source", {})
-        source = SourceConfig(**source_data) if source_data else None
+        source = SourceConfig(**_known_fields(SourceConfig, source_data)) if source_data else None
         
         # Parse multiple sources
         sources_data = config.get("sources", [])
-        sources = [SourceConfig(**s) for s in sources_data]
+        sources = [SourceConfig(**_known_fields(SourceConfig, s)) for s in sources_data]
         
         # Parse target config
         target_data = config.get("target", {})
-        target = TargetConfig(**target_data) if target_data else None
+        target = TargetConfig(**_known_fields(TargetConfig, target_data)) if target_data else None
         
         # Parse processing config
         processing_data = config.get("processing", {})
-        processing = ProcessingConfig(**processing_data)
+        processing = ProcessingConfig(**_known_fields(ProcessingConfig, processing_data))
         
         # Parse transformations
         transformations_data = config.get("transformations", [])
-        transformations = [TransformationConfig(**t) for t in transformations_data]
+        transformations = [
+            TransformationConfig(**_known_fields(TransformationConfig, t))
+            for t in transformations_data
+        ]
         
         # Parse quality config
         quality_data = config.get("quality", {})
-        quality = QualityConfig(**quality_data)
+        quality = QualityConfig(**_known_fields(QualityConfig, quality_data))
         
         return PipelineConfig(
             name=pipeline_data.get("name", ""),
@@ -343,11 +816,14 @@ class ConfigLoader:
         if layer:
             search_path = search_path / layer
             
-        configs = list(search_path.glob(f"**/{pattern}"))
+        matches = _glob_configs(str(search_path), pattern)
         
-        # Exclude environment-specific overrides from main list
-        configs = [c for c in configs if not any(
-            c.stem.endswith(f".{env}") for env in ("dev", "qa", "prd")
-        )]
+        # Exclude environment-specific overrides (e.g. orders.dev.yaml) from main list
+        configs = []
+        for c in matches:
+            _, sep, suffix = c.stem.rpartition(".")
+            if not (sep and suffix in _ENV_SUFFIXES):
+                configs.append(c)
         
-        return sorted(configs)
+        configs.sort()
+        return configs
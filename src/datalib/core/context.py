@@ -7,9 +7,11 @@ and environment-specific configurations.
 
 from __future__ import annotations
 
+import functools
 import os
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pyspark.sql import SparkSession
@@ -22,11 +24,19 @@ class SparkContext:
     
     Provides a unified interface for Spark operations that works
     in both local and Databricks environments.
+    
+    Catalog, schema and table listings used by the existence checks are
+    cached per instance for ``metadata_ttl`` seconds; call ``invalidate``
+    after out-of-band DDL.
     """
     
     _spark: Optional["SparkSession"] = field(default=None, repr=False)
     app_name: str = "DataLib"
     config: Dict[str, str] = field(default_factory=dict)
+    metadata_ttl: float = 300.0
+    _metadata_cache: Dict[Tuple[str, ...], Tuple[float, Set[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
     
     @property
     def spark(self) -> "SparkSession":
@@ -36,20 +46,26 @@ class SparkContext:
         return self._spark
     
     def _create_spark_session(self) -> "SparkSession":
-        """Create a new Spark session."""
-        from pyspark.sql import SparkSession
+        """
+        Get the active Spark session or create one.
         
-        builder = SparkSession.builder.appName(self.app_name)
+        The configured builder is only used when no session is active.
+        ``getOrCreate`` still returns the process-wide default session when
+        one is running, and builds a new one if it was stopped.
+        """
+        from pyspark.sql import SparkSession
         
-        # Apply configuration
-        for key, value in self.config.items():
-            builder = builder.config(key, value)
+        session = SparkSession.getActiveSession()
+        if session is None:
+            builder = SparkSession.builder.appName(self.app_name)
+            
+            # Apply configuration
+            for key, value in self.config.items():
+                builder = builder.config(key, value)
+            
+            session = builder.getOrCreate()
         
-        # Try to get existing session first
-        try:
-            return SparkSession.builder.getOrCreate()
-        except Exception:
-            return builder.getOrCreate()
+        return session
     
     def read_table(self, table_name: str) -> Any:
         """Read a Delta table."""
@@ -59,41 +75,137 @@ class SparkContext:
         """Execute SQL query."""
         return self.spark.sql(query)
     
+    def _cached_names(self, key: Tuple[str, ...], fetch: Callable[[], Iterable[str]]) -> Set[str]:
+        """Return a cached name listing, refreshing it once the TTL expires."""
+        now = time.monotonic()
+        entry = self._metadata_cache.get(key)
+        if entry is not None and now - entry[0] < self.metadata_ttl:
+            return entry[1]
+        names = set(fetch())
+        self._metadata_cache[key] = (now, names)
+        return names
+    
+    def invalidate(self, catalog: Optional[str] = None, schema: Optional[str] = None) -> None:
+        """
+        Drop cached metadata listings.
+        
+        Args:
+            catalog: Limit invalidation to this catalog (all catalogs if None)
+            schema: Limit invalidation to this schema's tables
+        """
+        if catalog is None:
+            self._metadata_cache.clear()
+        elif schema is not None:
+            self._metadata_cache.pop(("tables", catalog, schema), None)
+        else:
+            for key in list(self._metadata_cache):
+                if key[0] == "catalogs" or (len(key) > 1 and key[1] == catalog):
+                    del self._metadata_cache[key]
+    
     def catalog_exists(self, catalog_name: str) -> bool:
         """Check if a catalog exists."""
         try:
-            catalogs = [row.catalog for row in self.spark.sql("SHOW CATALOGS").collect()]
-            return catalog_name in catalogs
+            return catalog_name in self._cached_names(("catalogs",), self._list_catalogs)
         except Exception:
             return False
     
+    def _list_catalogs(self) -> List[str]:
+        """List catalog names, preferring the catalog API over SQL."""
+        try:
+            return [c.name for c in self.spark.catalog.listCatalogs()]
+        except Exception:
+            # spark.catalog.listCatalogs is only available from Spark 3.4
+            rows = self.spark.sql("SHOW CATALOGS").select("catalog").collect()
+            return [row[0] for row in rows]
+    
     def schema_exists(self, catalog: str, schema: str) -> bool:
         """Check if a schema exists in a catalog."""
         try:
-            schemas = [
-                row.databaseName 
-                for row in self.spark.sql(f"SHOW SCHEMAS IN {catalog}").collect()
-            ]
-            return schema in schemas
+            return schema in self._cached_names(
+                ("schema", catalog, schema),
+                lambda: [schema] if self._database_exists(catalog, schema) else []
+            )
         except Exception:
             return False
     
+    def _database_exists(self, catalog: str, schema: str) -> bool:
+        """Check a single schema, preferring the catalog API over SQL."""
+        try:
+            return self.spark.catalog.databaseExists(f"{catalog}.{schema}")
+        except Exception:
+            rows = self.spark.sql(f"SHOW SCHEMAS IN {catalog}").select("databaseName").collect()
+            return any(row[0] == schema for row in rows)
+    
+    def _table_names(self, catalog: str, schema: str) -> Set[str]:
+        """Cached lowercased table names of a schema (one SHOW TABLES per TTL)."""
+        return self._cached_names(
+            ("tables", catalog, schema),
+            lambda: [
+                row[0].lower()
+                for row in self.spark.sql(f"SHOW TABLES IN {catalog}.{schema}")
+                .select("tableName")
+                .collect()
+            ]
+        )
+    
+    def tables_in(self, catalog: str, schema: str) -> FrozenSet[str]:
+        """
+        List the tables of a schema.
+        
+        Args:
+            catalog: Catalog name
+            schema: Schema name
+            
+        Returns:
+            Lowercased table names (empty if the schema can't be listed)
+        """
+        try:
+            return frozenset(self._table_names(catalog, schema))
+        except Exception:
+            return frozenset()
+    
     def table_exists(self, catalog: str, schema: str, table: str) -> bool:
         """Check if a table exists."""
         try:
-            return self.spark.catalog.tableExists(f"{catalog}.{schema}.{table}")
+            return table.lower() in self._table_names(catalog, schema)
         except Exception:
             return False
     
+    def tables_exist(self, catalog: str, schema: str, tables: List[str]) -> Dict[str, bool]:
+        """
+        Check several tables of one schema with a single listing.
+        
+        Args:
+            catalog: Catalog name
+            schema: Schema name
+            tables: Table names to check
+            
+        Returns:
+            Mapping of each requested name to whether it exists
+        """
+        try:
+            names = self._table_names(catalog, schema)
+        except Exception:
+            names = set()
+        return {table: table.lower() in names for table in tables}
+    
     def create_schema_if_not_exists(self, catalog: str, schema: str) -> None:
-        """Create schema if it doesn't exist."""
-        self.spark.sql(f"CREATE SCHEMA IF NOT EXISTS {catalog}.{schema}")
+        """Create schema if it doesn't exist (the DDL reruns once the TTL expires)."""
+        key = ("schema", catalog, schema)
+        
+        def create() -> List[str]:
+            self.spark.sql(f"CREATE SCHEMA IF NOT EXISTS {catalog}.{schema}")
+            return [schema]
+        
+        if schema not in self._cached_names(key, create):
+            # Fresh "missing" entry from schema_exists: create and record it
+            self._metadata_cache[key] = (time.monotonic(), set(create()))
     
     def get_table_properties(self, table_name: str) -> Dict[str, str]:
         """Get properties of a Delta table."""
         try:
-            props = self.spark.sql(f"SHOW TBLPROPERTIES {table_name}").collect()
-            return {row.key: row.value for row in props}
+            props = self.spark.sql(f"SHOW TBLPROPERTIES {table_name}").select("key", "value")
+            return dict(props.collect())
         except Exception:
             return {}
 
@@ -109,6 +221,7 @@ class DatabricksContext(SparkContext):
     
     _dbutils: Any = field(default=None, repr=False)
     environment: str = field(default_factory=lambda: os.getenv("ENVIRONMENT", "dev"))
+    widgets: Dict[str, str] = field(default_factory=dict)
     
     @property
     def dbutils(self) -> Any:
@@ -135,6 +248,17 @@ class DatabricksContext(SparkContext):
         """Check if running in Databricks environment."""
         return self.dbutils is not None
     
+    @functools.cached_property
+    def _all_widgets(self) -> Optional[Dict[str, str]]:
+        """All widget bindings fetched in one call, or None if unavailable."""
+        if not self.is_databricks:
+            return None
+        try:
+            bindings = self.dbutils.notebook.entry_point.getCurrentBindings()
+            return {key: bindings[key] for key in bindings}
+        except Exception:
+            return None
+    
     def get_widget(self, name: str, default: str = "") -> str:
         """
         Get notebook widget value.
@@ -148,6 +272,9 @@ class DatabricksContext(SparkContext):
         """
         if not self.is_databricks:
             return default
+        widgets = self._all_widgets
+        if widgets is not None and name in widgets:
+            return widgets[name]
         try:
             return self.dbutils.widgets.get(name)
         except Exception:
@@ -157,16 +284,12 @@ class DatabricksContext(SparkContext):
         """
         Get all notebook widget values.
         
+        Values are read once per context from the notebook bindings.
+        
         Returns:
             Dictionary of widget names to values
         """
-        if not self.is_databricks:
-            return {}
-        try:
-            # This is a workaround as there's no direct API to list all widgets
-            return {}
-        except Exception:
-            return {}
+        return dict(self._all_widgets or {})
     
     def get_secret(self, scope: str, key: str) -> str:
         """
@@ -183,43 +306,66 @@ class DatabricksContext(SparkContext):
             raise RuntimeError("Secrets are only available in Databricks")
         return self.dbutils.secrets.get(scope=scope, key=key)
     
+    @functools.cached_property
+    def _current_user(self) -> Optional[str]:
+        """Current user email, queried once."""
+        if not self.is_databricks:
+            return None
+        try:
+            return self.spark.sql("SELECT current_user()").collect()[0][0]
+        except Exception:
+            return None
+    
     def get_current_user(self) -> Optional[str]:
         """Get current user email."""
+        return self._current_user
+    
+    @functools.cached_property
+    def _notebook_context(self) -> Any:
+        """Notebook context from the dbutils entry point, looked up once."""
         if not self.is_databricks:
             return None
         try:
-            return self.spark.sql("SELECT current_user()").collect()[0][0]
+            return self.dbutils.notebook.entry_point.getDbutils().notebook().getContext()
+        except Exception:
+            return None
+    
+    @functools.cached_property
+    def _cluster_id(self) -> Optional[str]:
+        """Cluster ID from the runtime environment or Spark conf, looked up once."""
+        cluster_id = os.environ.get("DB_CLUSTER_ID") or os.environ.get("DATABRICKS_CLUSTER_ID")
+        if cluster_id:
+            return cluster_id
+        if not self.is_databricks:
+            return None
+        try:
+            return self.spark.conf.get("spark.databricks.clusterUsageTags.clusterId")
         except Exception:
             return None
     
     def get_workspace_url(self) -> Optional[str]:
         """Get Databricks workspace URL."""
-        if not self.is_databricks:
+        context = self._notebook_context
+        if context is None:
             return None
         try:
-            context = self.dbutils.notebook.entry_point.getDbutils().notebook().getContext()
             return context.browserHostName().get()
         except Exception:
             return None
     
     def get_notebook_path(self) -> Optional[str]:
         """Get current notebook path."""
-        if not self.is_databricks:
+        context = self._notebook_context
+        if context is None:
             return None
         try:
-            context = self.dbutils.notebook.entry_point.getDbutils().notebook().getContext()
             return context.notebookPath().get()
         except Exception:
             return None
     
     def get_cluster_id(self) -> Optional[str]:
         """Get current cluster ID."""
-        if not self.is_databricks:
-            return None
-        try:
-            return self.spark.conf.get("spark.databricks.clusterUsageTags.clusterId")
-        except Exception:
-            return None
+        return self._cluster_id
     
     def run_notebook(
         self,
@@ -288,5 +434,5 @@ class DatabricksContext(SparkContext):
             DatabricksContext instance
         """
         ctx = cls()
-        widgets = {name: ctx.get_widget(name) for name in widget_names}
+        ctx.widgets = {name: ctx.get_widget(name) for name in widget_names}
         return ctx
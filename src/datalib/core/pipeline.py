@@ -7,23 +7,51 @@ applying transformations, running quality checks, and writing output.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import importlib
+import io
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from datalib.core.config import PipelineConfig, SourceConfig, TargetConfig, TransformationConfig
+from datalib.core.config import (
+    _DATACLASS_OPTIONS,
+    ConfigLoader,
+    PipelineConfig,
+    SourceConfig,
+    TargetConfig,
+    TransformationConfig,
+)
 from datalib.core.context import DatabricksContext
 from datalib.utils.logging import get_logger
 
 if TYPE_CHECKING:
     from pyspark.sql import DataFrame
+    from datalib.io.reader import DataReader
+    from datalib.io.writer import DataWriter
 
 
 logger = get_logger(__name__)
 
+# Built-in transformations as (module, class name); imported on first use
+_DEFAULT_TRANSFORMATIONS: Dict[str, Any] = {
+    "add_timestamp": ("datalib.transformations.common", "AddTimestampColumn"),
+    "cast_columns": ("datalib.transformations.common", "CastColumns"),
+    "rename_columns": ("datalib.transformations.common", "RenameColumns"),
+    "filter_rows": ("datalib.transformations.common", "FilterRows"),
+    "deduplicate": ("datalib.transformations.common", "DeduplicateRows"),
+    "select_columns": ("datalib.transformations.common", "SelectColumns"),
+    "drop_columns": ("datalib.transformations.common", "DropColumns"),
+    "fill_nulls": ("datalib.transformations.common", "FillNulls"),
+    "standardize_strings": ("datalib.transformations.common", "StandardizeStrings"),
+}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PipelineMetrics:
     """Metrics collected during pipeline execution."""
     
@@ -39,30 +67,30 @@ class PipelineMetrics:
     quality_checks_failed: int = 0
     error_message: Optional[str] = None
     duration_seconds: float = 0.0
+    # Monotonic start for duration; start_time/end_time are for reporting
+    _start_ns: int = field(
+        default_factory=time.perf_counter_ns, init=False, repr=False, compare=False
+    )
     
     def complete(self, status: str = "success", error: Optional[str] = None) -> None:
         """Mark pipeline as complete."""
+        self.duration_seconds = (time.perf_counter_ns() - self._start_ns) / 1e9
         self.end_time = datetime.now()
         self.status = status
         self.error_message = error
-        self.duration_seconds = (self.end_time - self.start_time).total_seconds()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary."""
-        return {
-            "pipeline_name": self.pipeline_name,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
-            "status": self.status,
-            "records_read": self.records_read,
-            "records_written": self.records_written,
-            "records_failed": self.records_failed,
-            "transformations_applied": self.transformations_applied,
-            "quality_checks_passed": self.quality_checks_passed,
-            "quality_checks_failed": self.quality_checks_failed,
-            "error_message": self.error_message,
-            "duration_seconds": self.duration_seconds,
-        }
+        result = {name: getattr(self, name) for name in _METRIC_FIELDS}
+        result["start_time"] = self.start_time.isoformat()
+        result["end_time"] = self.end_time.isoformat() if self.end_time else None
+        return result
+
+
+# Public PipelineMetrics fields reported by to_dict, computed once
+_METRIC_FIELDS = tuple(
+    f.name for f in fields(PipelineMetrics) if not f.name.startswith("_")
+)
 
 
 class PipelineExecutionError(Exception):
@@ -111,30 +139,25 @@ class Pipeline:
         self._register_default_transformations()
     
     def _register_default_transformations(self) -> None:
-        """Register built-in transformation functions."""
-        from datalib.transformations.common import (
-            AddTimestampColumn,
-            CastColumns,
-            RenameColumns,
-            FilterRows,
-            DeduplicateRows,
-            SelectColumns,
-            DropColumns,
-            FillNulls,
-            StandardizeStrings,
-        )
+        """Register built-in transformations without importing them yet."""
+        self._transformations = dict(_DEFAULT_TRANSFORMATIONS)
+    
+    def _get_transformation(self, name: str) -> Optional[Callable]:
+        """
+        Look up a registered transformation, importing it on first use.
         
-        self._transformations = {
-            "add_timestamp": AddTimestampColumn,
-            "cast_columns": CastColumns,
-            "rename_columns": RenameColumns,
-            "filter_rows": FilterRows,
-            "deduplicate": DeduplicateRows,
-            "select_columns": SelectColumns,
-            "drop_columns": DropColumns,
-            "fill_nulls": FillNulls,
-            "standardize_strings": StandardizeStrings,
-        }
+        Args:
+            name: Transformation name
+            
+        Returns:
+            Transformation class or function, or None if not registered
+        """
+        entry = self._transformations.get(name)
+        if isinstance(entry, tuple):
+            module_name, attr = entry
+            entry = getattr(importlib.import_module(module_name), attr)
+            self._transformations[name] = entry
+        return entry
     
     def register_transformation(
         self,
@@ -150,6 +173,20 @@ class Pipeline:
         """
         self._transformations[name] = transformation
     
+    @functools.cached_property
+    def reader(self) -> "DataReader":
+        """Data reader shared by all sources of this pipeline."""
+        from datalib.io.reader import DataReader
+        
+        return DataReader(self.context)
+    
+    @functools.cached_property
+    def writer(self) -> "DataWriter":
+        """Data writer for this pipeline's target."""
+        from datalib.io.writer import DataWriter
+        
+        return DataWriter(self.context)
+    
     def _read_source(self, source: SourceConfig) -> "DataFrame":
         """
         Read data from a source.
@@ -160,27 +197,31 @@ class Pipeline:
         Returns:
             DataFrame with source data
         """
-        from datalib.io.reader import DataReader
-        
-        reader = DataReader(self.context)
-        return reader.read(source)
+        return self.reader.read(source)
     
     def _apply_transformations(self, df: "DataFrame") -> "DataFrame":
         """
         Apply all configured transformations.
         
+        Consecutive transformations that can be expressed as independent
+        column expressions are fused into a single ``withColumns``
+        projection; a step that reads a column produced by the pending
+        group, or that can't be fused, flushes the group first.
+        
         Args:
             df: Input DataFrame
             
         Returns:
             Transformed DataFrame
         """
+        pending: Dict[str, Any] = {}
+        
         for trans_config in self.config.transformations:
             if not trans_config.enabled:
                 logger.info(f"Skipping disabled transformation: {trans_config.type}")
                 continue
                 
-            trans_class = self._transformations.get(trans_config.type)
+            trans_class = self._get_transformation(trans_config.type)
             if trans_class is None:
                 raise PipelineExecutionError(
                     f"Unknown transformation type: {trans_config.type}",
@@ -189,9 +230,27 @@ class Pipeline:
             
             logger.info(f"Applying transformation: {trans_config.type}")
             transformation = trans_class(**trans_config.params)
-            df = transformation.transform(df)
+            
+            expressions = None
+            if hasattr(transformation, "column_expressions"):
+                inputs = transformation.input_columns()
+                if pending and (inputs is None or not inputs.isdisjoint(pending)):
+                    df = df.withColumns(pending)
+                    pending = {}
+                expressions = transformation.column_expressions(df.columns)
+            
+            if expressions is None:
+                if pending:
+                    df = df.withColumns(pending)
+                    pending = {}
+                df = transformation.transform(df)
+            else:
+                pending.update(expressions)
             self._metrics.transformations_applied += 1
         
+        if pending:
+            df = df.withColumns(pending)
+        
         return df
     
     def _run_quality_checks(self, df: "DataFrame") -> "DataFrame":
@@ -237,10 +296,7 @@ class Pipeline:
         Returns:
             Number of records written
         """
-        from datalib.io.writer import DataWriter
-        
-        writer = DataWriter(self.context)
-        return writer.write(df, target)
+        return self.writer.write(df, target)
     
     def run(self) -> PipelineMetrics:
         """
@@ -266,8 +322,10 @@ class Pipeline:
                     self._metrics
                 )
             
-            self._metrics.records_read = df.count()
-            logger.info(f"Read {self._metrics.records_read} records from source")
+            source_df = df
+            read_observation = None
+            if self._write_fills_observation(self.config.target):
+                df, read_observation = self._observe_read_count(df)
             
             # Apply transformations
             df = self._apply_transformations(df)
@@ -280,6 +338,14 @@ class Pipeline:
                 self._metrics.records_written = self._write_target(df, self.config.target)
                 logger.info(f"Wrote {self._metrics.records_written} records to target")
             
+            if read_observation is not None:
+                self._metrics.records_read = read_observation.get["cnt"]
+            else:
+                # No write filled an observation (no target, or a Delta
+                # write/MERGE that may not report one), so count explicitly
+                self._metrics.records_read = source_df.count()
+            logger.info(f"Read {self._metrics.records_read} records from source")
+            
             self._metrics.complete("success")
             logger.info(f"Pipeline completed successfully in {self._metrics.duration_seconds:.2f}s")
             
@@ -292,11 +358,54 @@ class Pipeline:
         
         return self._metrics
     
+    @staticmethod
+    def _write_fills_observation(target: Optional[TargetConfig]) -> bool:
+        """
+        Whether the target write is guaranteed to fill an observation.
+        
+        Delta writes and MERGE commands (merge/scd2 modes) may not post
+        observed metrics, and ``Observation.get`` would then block forever.
+        """
+        return (
+            target is not None
+            and target.format != "delta"
+            and target.mode.lower() in ("overwrite", "append")
+        )
+    
+    def _observe_read_count(self, df: "DataFrame") -> Tuple["DataFrame", Any]:
+        """
+        Attach a row-count observation to the source DataFrame.
+        
+        The count is collected as a side effect of the first action on the
+        DataFrame (the target write) instead of a separate scan.
+        
+        Args:
+            df: Source DataFrame
+            
+        Returns:
+            Tuple of observed DataFrame and Observation (None if unsupported)
+        """
+        try:
+            from pyspark.sql import Observation
+            from pyspark.sql import functions as F
+        except ImportError:
+            # Observation requires Spark 3.3+
+            return df, None
+        
+        # Unnamed observations get a unique name; a fixed name would also be
+        # filled by other queries on the session (e.g. parallel pipelines)
+        observation = Observation()
+        return df.observe(observation, F.count(F.lit(1)).alias("cnt")), observation
+    
     def _join_sources(self, dfs: List["DataFrame"]) -> "DataFrame":
         """
         Join multiple source DataFrames.
         
-        This is a placeholder - implement based on your join requirements.
+        Join behaviour comes from ``parameters.join``:
+        ``keys`` (required), ``type`` (default inner), ``broadcast``
+        (indices of sources to broadcast-hint) and ``strategy``
+        (``left_deep`` or ``balanced``; balanced only applies to inner joins,
+        where regrouping doesn't change the result).
         
         Args:
             dfs: List of DataFrames to join
@@ -311,25 +420,51 @@ class Pipeline:
         join_config = self.config.parameters.get("join", {})
         join_type = join_config.get("type", "inner")
         join_keys = join_config.get("keys", [])
+        strategy = join_config.get("strategy", "left_deep")
+        broadcast = set(join_config.get("broadcast", []))
         
-        result = dfs[0]
-        for i, df in enumerate(dfs[1:], 1):
-            if join_keys:
-                result = result.join(df, on=join_keys, how=join_type)
-            else:
-                raise PipelineExecutionError(
-                    "Join keys must be specified for multi-source pipelines",
-                    self._metrics
-                )
+        if not join_keys:
+            raise PipelineExecutionError(
+                "Join keys must be specified for multi-source pipelines",
+                self._metrics
+            )
         
-        return result
+        if broadcast:
+            from pyspark.sql.functions import broadcast as broadcast_hint
+            
+            dfs = [broadcast_hint(df) if i in broadcast else df for i, df in enumerate(dfs)]
+        
+        if strategy == "balanced" and join_type == "inner" and len(dfs) > 2:
+            return self._join_balanced(dfs, join_keys)
+        
+        return functools.reduce(
+            lambda left, right: left.join(right, on=join_keys, how=join_type),
+            dfs
+        )
+    
+    def _join_balanced(self, dfs: List["DataFrame"], join_keys: List[str]) -> "DataFrame":
+        """Inner-join DataFrames as a balanced tree instead of a left-deep chain."""
+        if len(dfs) == 1:
+            return dfs[0]
+        middle = len(dfs) // 2
+        return self._join_balanced(dfs[:middle], join_keys).join(
+            self._join_balanced(dfs[middle:], join_keys),
+            on=join_keys,
+            how="inner"
+        )
     
-    def dry_run(self) -> Dict[str, Any]:
+    def dry_run(self, sample_size: int = 3, verify_params: bool = False) -> Dict[str, Any]:
         """
         Perform a dry run without writing data.
         
+        Args:
+            sample_size: Number of sample rows to collect
+            verify_params: Instantiate and apply the configured transformations
+                so bad parameters fail here (slower; intended for CI)
+            
         Returns:
-            Dictionary with execution plan and sample data
+            Dictionary with the planned steps, the Spark query plan and
+            sample data (list of row dicts)
         """
         logger.info(f"Dry run for pipeline: {self.config.name}")
         
@@ -339,6 +474,7 @@ class Pipeline:
             "sources": [],
             "transformations": [],
             "target": None,
+            "plan": None,
             "sample_data": None,
         }
         
@@ -350,20 +486,20 @@ class Pipeline:
                 for s in self.config.sources
             ]
             
-            # Apply transformations
-            for trans_config in self.config.transformations:
-                if trans_config.enabled:
-                    result["transformations"].append({
-                        "type": trans_config.type,
-                        "params": trans_config.params,
-                    })
-                    trans_class = self._transformations.get(trans_config.type)
-                    if trans_class:
-                        transformation = trans_class(**trans_config.params)
-                        df = transformation.transform(df)
+            result["transformations"] = [
+                {"type": t.type, "params": t.params}
+                for t in self.config.transformations
+                if t.enabled
+            ]
+            if verify_params:
+                df = self._apply_transformations(df)
+            
+            result["plan"] = self._explain(df)
             
             # Sample data
-            result["sample_data"] = df.limit(10).toPandas().to_dict()
+            result["sample_data"] = [
+                row.asDict(recursive=True) for row in df.limit(sample_size).collect()
+            ]
         
         if self.config.target:
             result["target"] = {
@@ -374,6 +510,19 @@ class Pipeline:
         
         return result
 
+    
+    @staticmethod
+    def _explain(df: "DataFrame") -> Optional[str]:
+        """Capture the extended query plan of a DataFrame as a string."""
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                df.explain(mode="extended")
+        except Exception as e:
+            logger.warning(f"Could not explain query plan: {e}")
+            return None
+        return buffer.getvalue()
+
 
 class PipelineRunner:
     """
@@ -397,8 +546,6 @@ class PipelineRunner:
             context: Databricks context
             environment: Environment name (dev, qa, prd)
         """
-        from datalib.core.config import ConfigLoader
-        
         self.config_base_path = config_base_path
         self.context = context or DatabricksContext()
         self.environment = environment or self.context.environment
@@ -415,6 +562,9 @@ class PipelineRunner:
         """
         Run a single pipeline from configuration.
         
+        Repeated runs with unchanged files and parameters are served from
+        ConfigLoader's process-wide config cache.
+        
         Args:
             config_path: Path to configuration file (relative to base path)
             widget_params: Optional widget parameters
@@ -422,8 +572,14 @@ class PipelineRunner:
         Returns:
             Pipeline execution metrics
         """
-        self.config_loader.widget_params = widget_params or {}
-        config = self.config_loader.load_pipeline_config(config_path)
+        # A per-call loader keeps widget parameters out of shared state so
+        # pipelines can run concurrently; parse caches are process-wide.
+        config_loader = ConfigLoader(
+            base_path=self.config_base_path,
+            environment=self.environment,
+            widget_params=widget_params or {}
+        )
+        config = config_loader.load_pipeline_config(config_path)
         
         pipeline = Pipeline(config, self.context)
         return pipeline.run()
@@ -431,28 +587,93 @@ class PipelineRunner:
     def run_layer(
         self,
         layer: str,
-        parallel: bool = False
+        parallel: bool = False,
+        max_workers: int = 8,
+        fail_fast: bool = False
     ) -> List[PipelineMetrics]:
         """
         Run all pipelines in a layer.
         
+        Configs with ``pipeline.enabled: false`` are skipped without being
+        loaded.
+        
         Args:
             layer: Layer name (bronze, silver, gold)
             parallel: Run pipelines in parallel
+            max_workers: Maximum concurrent pipelines when parallel
+            fail_fast: Stop at the first failed pipeline and re-raise its
+                error; pipelines not yet started are cancelled
             
         Returns:
-            List of pipeline metrics
+            List of pipeline metrics, in config order
+            
+        Raises:
+            PipelineExecutionError: On the first failure when fail_fast is set
         """
-        configs = self.config_loader.list_configs(layer=layer)
-        results = []
+        configs = [
+            config_path
+            for config_path in self.config_loader.list_configs(layer=layer)
+            if self.config_loader.is_enabled(config_path.relative_to(self.config_base_path))
+        ]
+        
+        if parallel and len(configs) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(configs), max_workers)) as executor:
+                futures = [
+                    executor.submit(self._run_in_scheduler_pool, config_path, fail_fast)
+                    for config_path in configs
+                ]
+                _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                for future in futures:
+                    if future.done() and not future.cancelled():
+                        error = future.exception()
+                        if error is not None:
+                            raise error
+                outcomes = [future.result() for future in futures]
+        else:
+            outcomes = [
+                self._run_layer_pipeline(config_path, fail_fast) for config_path in configs
+            ]
         
-        for config_path in configs:
-            try:
-                metrics = self.run_pipeline(str(config_path.relative_to(self.config_base_path)))
-                results.append(metrics)
-            except PipelineExecutionError as e:
-                logger.error(f"Pipeline failed: {config_path}")
-                if e.metrics:
-                    results.append(e.metrics)
+        return [metrics for metrics in outcomes if metrics is not None]
+    
+    def _run_layer_pipeline(
+        self,
+        config_path: Path,
+        fail_fast: bool = False
+    ) -> Optional[PipelineMetrics]:
+        """Run one pipeline of a layer, returning failure metrics unless failing fast."""
+        try:
+            return self.run_pipeline(str(config_path.relative_to(self.config_base_path)))
+        except PipelineExecutionError as e:
+            logger.error(f"Pipeline failed: {config_path}")
+            if fail_fast:
+                raise
+            return e.metrics
+    
+    def _run_in_scheduler_pool(
+        self,
+        config_path: Path,
+        fail_fast: bool = False
+    ) -> Optional[PipelineMetrics]:
+        """
+        Run a layer pipeline in its own Spark scheduler pool.
         
-        return results
+        Pools only take effect when the cluster runs with
+        ``spark.scheduler.mode=FAIR``; otherwise jobs share the FIFO queue.
+        """
+        try:
+            spark_context = self.context.spark.sparkContext
+        except Exception:
+            # Spark Connect sessions don't expose a SparkContext
+            spark_context = None
+        
+        if spark_context is not None:
+            spark_context.setLocalProperty("spark.scheduler.pool", config_path.stem)
+        try:
+            return self._run_layer_pipeline(config_path, fail_fast)
+        finally:
+            if spark_context is not None:
+                # None unsets the property (the stub only declares str)
+                spark_context.setLocalProperty("spark.scheduler.pool", None)  # type: ignore[arg-type]
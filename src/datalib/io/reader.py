@@ -7,7 +7,8 @@ JDBC sources, and streaming sources.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+import statistics
+from typing import Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING
 
 from datalib.core.config import SourceConfig
 from datalib.utils.logging import get_logger
@@ -19,6 +20,21 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Source options interpreted by DataReader instead of being passed to Spark
+_READER_OPTIONS = frozenset(("pushdown_filter", "columns", "tune_partitioning"))
+
+# Bounds for auto-tuned file split sizes
+_MIN_PARTITION_BYTES = 128 * 1024 * 1024
+_MIN_OPEN_COST_BYTES = 1024 * 1024
+_DEFAULT_OPEN_COST_BYTES = 4 * 1024 * 1024
+
+# JDBC defaults; Spark's fetch size otherwise falls back to the driver's (often 10-100 rows)
+_DEFAULT_JDBC_FETCHSIZE = "10000"
+_DEFAULT_JDBC_PARTITIONS = 8
+
+# Micro-batch limits for Delta streaming reads; source options override them
+_DEFAULT_DELTA_STREAM_OPTIONS = {"maxFilesPerTrigger": "1000", "maxBytesPerTrigger": "1g"}
+
 
 class DataReaderError(Exception):
     """Raised when data reading fails."""
@@ -42,6 +58,17 @@ class DataReader:
         >>> df = reader.read(source_config)
     """
     
+    # Read method per source type; anything else goes through _read_generic
+    _READERS: Dict[str, str] = {
+        "delta": "_read_delta",
+        "table": "_read_table",
+        "parquet": "_read_parquet",
+        "csv": "_read_csv",
+        "json": "_read_json",
+        "jdbc": "_read_jdbc",
+        "sql": "_read_sql",
+    }
+    
     def __init__(self, context: "DatabricksContext"):
         """
         Initialize data reader.
@@ -51,6 +78,88 @@ class DataReader:
         """
         self.context = context
         self.spark = context.spark
+        
+        self._partition_tuning: Dict[str, Tuple[int, int]] = {}
+    
+    @staticmethod
+    def _apply_options(reader: Any, options: Dict[str, Any]) -> Any:
+        """Set all options on a reader in one call instead of one per option."""
+        return reader.options(**options) if options else reader
+    
+    @staticmethod
+    def _split_options(options: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Separate Spark reader options from options handled by DataReader."""
+        spark_options = {k: v for k, v in options.items() if k not in _READER_OPTIONS}
+        reader_options = {k: v for k, v in options.items() if k in _READER_OPTIONS}
+        return spark_options, reader_options
+    
+    @staticmethod
+    def _apply_pushdown(df: "DataFrame", reader_options: Dict[str, Any]) -> "DataFrame":
+        """
+        Apply the ``pushdown_filter`` and ``columns`` source options.
+        
+        Both are applied directly on the scan so Spark pushes the predicate
+        and the column pruning into the file reader. On Delta sources the
+        filter also drives data skipping, which only prunes files when it
+        references columns with collected statistics (by default the first
+        32 columns) or partition columns.
+        """
+        pushdown_filter = reader_options.get("pushdown_filter")
+        if pushdown_filter:
+            df = df.filter(pushdown_filter)
+        columns = reader_options.get("columns")
+        if columns:
+            df = df.select(*columns)
+        return df
+    
+    @staticmethod
+    def _reject_partition_tuning(reader_options: Dict[str, Any], source_kind: str) -> None:
+        """Fail on ``tune_partitioning`` for sources that aren't split from files."""
+        if reader_options.get("tune_partitioning"):
+            raise DataReaderError(
+                f"tune_partitioning is only supported for batch file sources, not {source_kind}"
+            )
+    
+    def _tune_file_partitioning(self, path: str) -> None:
+        """
+        Size file splits from the median file size under ``path``.
+        
+        Switched on by the ``tune_partitioning`` source option. Sets
+        ``spark.sql.files.maxPartitionBytes`` to the median file size (at
+        least 128MB) and ``spark.sql.files.openCostInBytes`` to the median
+        clamped to 1MB-4MB, so many small files are packed into fewer tasks.
+        
+        The tuning is session-global, not per source: Spark reads both
+        settings when the scan is planned at the first action (usually the
+        target write), so with several tuned sources (joins, parallel
+        ``run_layer``) the last one read applies to every scan. The values
+        are not restored afterwards. Only enable it for pipelines with a
+        single file source on a session they don't share.
+        
+        Args:
+            path: Directory the source files are read from
+        """
+        if path not in self._partition_tuning:
+            try:
+                sizes = [f.size for f in self.context.list_files(path) if f.size > 0]
+            except Exception as e:
+                logger.warning(f"Could not list {path} for partition tuning: {e}")
+                return
+            if not sizes:
+                return
+            median = int(statistics.median(sizes))
+            self._partition_tuning[path] = (
+                max(median, _MIN_PARTITION_BYTES),
+                min(max(median, _MIN_OPEN_COST_BYTES), _DEFAULT_OPEN_COST_BYTES),
+            )
+        
+        max_partition_bytes, open_cost = self._partition_tuning[path]
+        logger.info(
+            f"Tuning session file splits from {path}: maxPartitionBytes={max_partition_bytes}, "
+            f"openCostInBytes={open_cost}"
+        )
+        self.spark.conf.set("spark.sql.files.maxPartitionBytes", str(max_partition_bytes))
+        self.spark.conf.set("spark.sql.files.openCostInBytes", str(open_cost))
     
     def read(self, source: SourceConfig) -> "DataFrame":
         """
@@ -66,26 +175,12 @@ class DataReader:
             DataReaderError: If reading fails
         """
         source_type = source.type.lower()
+        read_method: Callable[[SourceConfig], "DataFrame"] = getattr(
+            self, self._READERS.get(source_type, "_read_generic")
+        )
         
         try:
-            if source_type == "delta":
-                return self._read_delta(source)
-            elif source_type == "table":
-                return self._read_table(source)
-            elif source_type == "parquet":
-                return self._read_parquet(source)
-            elif source_type == "csv":
-                return self._read_csv(source)
-            elif source_type == "json":
-                return self._read_json(source)
-            elif source_type == "jdbc":
-                return self._read_jdbc(source)
-            elif source_type == "sql":
-                return self._read_sql(source)
-            else:
-                # Try reading as generic format
-                return self._read_generic(source)
-                
+            return read_method(source)
         except Exception as e:
             raise DataReaderError(f"Failed to read from {source_type} source: {e}") from e
     
@@ -93,10 +188,10 @@ class DataReader:
         """Read from Delta table or path."""
         if source.path:
             logger.info(f"Reading Delta from path: {source.path}")
+            options, reader_options = self._split_options(source.options)
             reader = self.spark.read.format("delta")
-            for key, value in source.options.items():
-                reader = reader.option(key, value)
-            return reader.load(source.path)
+            reader = self._apply_options(reader, options)
+            return self._apply_pushdown(reader.load(source.path), reader_options)
         elif source.get_full_table_name():
             return self._read_table(source)
         else:
@@ -109,7 +204,13 @@ class DataReader:
             raise DataReaderError("Table source requires catalog, schema, and table")
         
         logger.info(f"Reading table: {table_name}")
-        return self.spark.table(table_name)
+        options, reader_options = self._split_options(source.options)
+        if options:
+            # e.g. versionAsOf/timestampAsOf for Delta time travel
+            df = self._apply_options(self.spark.read, options).table(table_name)
+        else:
+            df = self.spark.table(table_name)
+        return self._apply_pushdown(df, reader_options)
     
     def _read_parquet(self, source: SourceConfig) -> "DataFrame":
         """Read from Parquet files."""
@@ -117,10 +218,12 @@ class DataReader:
             raise DataReaderError("Parquet source requires path")
         
         logger.info(f"Reading Parquet from: {source.path}")
+        options, reader_options = self._split_options(source.options)
         reader = self.spark.read.format("parquet")
-        for key, value in source.options.items():
-            reader = reader.option(key, value)
-        return reader.load(source.path)
+        reader = self._apply_options(reader, options)
+        if reader_options.get("tune_partitioning"):
+            self._tune_file_partitioning(source.path)
+        return self._apply_pushdown(reader.load(source.path), reader_options)
     
     def _read_csv(self, source: SourceConfig) -> "DataFrame":
         """Read from CSV files."""
@@ -129,18 +232,21 @@ class DataReader:
         
         logger.info(f"Reading CSV from: {source.path}")
         
-        # Default CSV options
+        # Default CSV options; an explicit schema makes inference unnecessary
         default_options = {
             "header": "true",
-            "inferSchema": "true",
+            "inferSchema": "false" if source.read_schema else "true",
             "mode": "PERMISSIVE",
         }
-        options = {**default_options, **source.options}
+        options, reader_options = self._split_options({**default_options, **source.options})
         
         reader = self.spark.read.format("csv")
-        for key, value in options.items():
-            reader = reader.option(key, value)
-        return reader.load(source.path)
+        if source.read_schema:
+            reader = reader.schema(source.read_schema)
+        reader = self._apply_options(reader, options)
+        if reader_options.get("tune_partitioning"):
+            self._tune_file_partitioning(source.path)
+        return self._apply_pushdown(reader.load(source.path), reader_options)
     
     def _read_json(self, source: SourceConfig) -> "DataFrame":
         """Read from JSON files."""
@@ -154,12 +260,15 @@ class DataReader:
             "multiLine": "true",
             "mode": "PERMISSIVE",
         }
-        options = {**default_options, **source.options}
+        options, reader_options = self._split_options({**default_options, **source.options})
         
         reader = self.spark.read.format("json")
-        for key, value in options.items():
-            reader = reader.option(key, value)
-        return reader.load(source.path)
+        if source.read_schema:
+            reader = reader.schema(source.read_schema)
+        reader = self._apply_options(reader, options)
+        if reader_options.get("tune_partitioning"):
+            self._tune_file_partitioning(source.path)
+        return self._apply_pushdown(reader.load(source.path), reader_options)
     
     def _read_jdbc(self, source: SourceConfig) -> "DataFrame":
         """Read from JDBC source."""
@@ -171,18 +280,76 @@ class DataReader:
         
         logger.info(f"Reading from JDBC source")
         
-        reader = self.spark.read.format("jdbc")
-        reader = reader.option("url", source.connection_string)
-        
+        options = {"url": source.connection_string, "fetchsize": _DEFAULT_JDBC_FETCHSIZE}
         if source.table:
-            reader = reader.option("dbtable", source.table)
+            options["dbtable"] = source.table
         elif source.query:
-            reader = reader.option("query", source.query)
+            options["query"] = source.query
+        # Reader-only keys would otherwise become driver connection properties
+        source_options, reader_options = self._split_options(source.options)
+        self._reject_partition_tuning(reader_options, "jdbc")
+        options.update(source_options)
         
-        for key, value in source.options.items():
-            reader = reader.option(key, value)
+        partition_column = source.partition_column or options.get("partitionColumn")
+        if partition_column:
+            options = self._configure_jdbc_partitioning(options, partition_column)
         
-        return reader.load()
+        reader = self._apply_options(self.spark.read.format("jdbc"), options)
+        
+        # The JDBC source pushes the filter and column pruning into the query
+        return self._apply_pushdown(reader.load(), reader_options)
+    
+    def _configure_jdbc_partitioning(
+        self,
+        options: Dict[str, Any],
+        partition_column: str,
+    ) -> Dict[str, Any]:
+        """
+        Add partitioned-read options so Spark fetches the source in parallel.
+        
+        Missing ``lowerBound``/``upperBound`` are probed with a single
+        ``MIN``/``MAX`` query against the source. Spark does not allow
+        ``query`` together with ``partitionColumn``, so a query source is
+        wrapped as a derived table (aliased once; the probe reads ``dbtable``
+        as-is).
+        
+        Args:
+            options: JDBC options built from the source config
+            partition_column: Column used to split the read
+            
+        Returns:
+            Options with partitionColumn, bounds and numPartitions set
+        """
+        options = dict(options)
+        if "query" in options:
+            options["dbtable"] = f"({options.pop('query')}) jdbc_src"
+        options["partitionColumn"] = partition_column
+        options.setdefault("numPartitions", _DEFAULT_JDBC_PARTITIONS)
+        
+        if "lowerBound" not in options or "upperBound" not in options:
+            probe_options = {k: v for k, v in options.items() if k not in (
+                "dbtable", "partitionColumn", "numPartitions", "lowerBound", "upperBound"
+            )}
+            probe_options["query"] = (
+                f"SELECT MIN({partition_column}) AS lo, MAX({partition_column}) AS hi "
+                f"FROM {options['dbtable']}"
+            )
+            probe = self._apply_options(self.spark.read.format("jdbc"), probe_options)
+            lo, hi = probe.load().collect()[0]
+            if lo is None:
+                # Empty source: nothing to split, read it through one connection
+                logger.info(f"JDBC source is empty; skipping partitioning on {partition_column}")
+                return {k: v for k, v in options.items() if k not in (
+                    "partitionColumn", "numPartitions", "lowerBound", "upperBound"
+                )}
+            options.setdefault("lowerBound", str(lo))
+            options.setdefault("upperBound", str(hi))
+        
+        logger.info(
+            f"Partitioning JDBC read on {partition_column} into {options['numPartitions']} "
+            f"ranges [{options['lowerBound']}, {options['upperBound']}]"
+        )
+        return options
     
     def _read_sql(self, source: SourceConfig) -> "DataFrame":
         """Read from SQL query."""
@@ -199,10 +366,12 @@ class DataReader:
         
         logger.info(f"Reading {source.type} from: {source.path}")
         
+        options, reader_options = self._split_options(source.options)
         reader = self.spark.read.format(source.type)
-        for key, value in source.options.items():
-            reader = reader.option(key, value)
-        return reader.load(source.path)
+        reader = self._apply_options(reader, options)
+        if reader_options.get("tune_partitioning"):
+            self._tune_file_partitioning(source.path)
+        return self._apply_pushdown(reader.load(source.path), reader_options)
     
     def read_stream(self, source: SourceConfig) -> "DataFrame":
         """
@@ -215,21 +384,21 @@ class DataReader:
             Streaming DataFrame
         """
         source_type = source.type.lower()
+        options, reader_options = self._split_options(source.options)
+        self._reject_partition_tuning(reader_options, "streaming reads")
         
         if source_type == "delta":
-            if source.path:
-                reader = self.spark.readStream.format("delta")
-            else:
-                table_name = source.get_full_table_name()
-                reader = self.spark.readStream.table(table_name)
-                return reader
+            # Bound each micro-batch so an initial backfill isn't read in one go
+            options = {**_DEFAULT_DELTA_STREAM_OPTIONS, **options}
+            reader = self._apply_options(self.spark.readStream.format("delta"), options)
+            if not source.path:
+                return self._apply_pushdown(
+                    reader.table(source.get_full_table_name()), reader_options
+                )
         else:
-            reader = self.spark.readStream.format(source_type)
-        
-        for key, value in source.options.items():
-            reader = reader.option(key, value)
+            reader = self._apply_options(self.spark.readStream.format(source_type), options)
         
         if source.path:
-            return reader.load(source.path)
+            return self._apply_pushdown(reader.load(source.path), reader_options)
         
         raise DataReaderError(f"Streaming not supported for source type: {source_type}")
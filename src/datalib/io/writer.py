@@ -7,8 +7,13 @@ overwrite, append, merge, and SCD Type 2.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import contextlib
+import functools
+import time
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from pyspark import StorageLevel
+from pyspark.sql import Observation
 from pyspark.sql import functions as F
 
 from datalib.core.config import TargetConfig
@@ -21,6 +26,75 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Table property recording when DataWriter last ran OPTIMIZE (epoch seconds)
+_LAST_OPTIMIZE_PROPERTY = "datalib.lastOptimizeTimestamp"
+
+# AQE target size for rebalanced partitions, set for the duration of a write
+_ADVISORY_PARTITION_SIZE_CONF = "spark.sql.adaptive.advisoryPartitionSizeInBytes"
+
+# Delta table properties that bin-pack and compact streaming output. Set on
+# the target table (not the session) so other writes don't inherit them.
+_STREAM_COMPACTION_PROPERTIES = {
+    "delta.autoOptimize.optimizeWrite": "true",
+    "delta.autoOptimize.autoCompact": "true",
+}
+
+
+# Merge plans are cached per column layout; callers must not mutate them
+@functools.lru_cache(maxsize=128)
+def _merge_plan(
+    columns: Tuple[str, ...],
+    keys: Tuple[str, ...],
+) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+    """
+    Build the condition and column mappings for an upsert MERGE.
+    
+    Args:
+        columns: Source DataFrame columns
+        keys: Merge key columns
+        
+    Returns:
+        Tuple of (merge condition, update set, insert values)
+    """
+    merge_condition = " AND ".join(f"target.{key} = source.{key}" for key in keys)
+    update_set = {col: f"source.{col}" for col in columns if col not in keys}
+    insert_values = {col: f"source.{col}" for col in columns}
+    return merge_condition, update_set, insert_values
+
+
+@functools.lru_cache(maxsize=128)
+def _scd2_plan(
+    columns: Tuple[str, ...],
+    keys: Tuple[str, ...],
+    scd_columns: Tuple[str, ...],
+    current_flag_col: str,
+) -> Tuple[Dict[str, str], str, str]:
+    """
+    Build the staging keys and conditions for an SCD2 MERGE.
+    
+    Args:
+        columns: Source DataFrame columns, before the SCD2 columns are added
+        keys: Merge key columns
+        scd_columns: Columns compared for changes; all non-key columns if empty
+        current_flag_col: Name of the current-version flag column
+        
+    Returns:
+        Tuple of (staging key names by key, merge condition, change condition)
+    """
+    staging_keys = {key: f"_merge_key_{i}" for i, key in enumerate(keys)}
+    merge_condition = " AND ".join(
+        f"target.{key} = source.{staging}" for key, staging in staging_keys.items()
+    ) + f" AND target.{current_flag_col} = true"
+    compare_cols = scd_columns or [c for c in columns if c not in keys]
+    change_conditions = " OR ".join(f"target.{col} <> source.{col}" for col in compare_cols)
+    return staging_keys, merge_condition, change_conditions
+
+
+@functools.lru_cache(maxsize=128)
+def _insert_values(columns: Tuple[str, ...]) -> Dict[str, str]:
+    """Map every column to its source value for a MERGE insert."""
+    return {col: f"source.{col}" for col in columns}
+
 
 class DataWriterError(Exception):
     """Raised when data writing fails."""
@@ -43,6 +117,14 @@ class DataWriter:
         >>> records_written = writer.write(df, target_config)
     """
     
+    # Write method per target mode
+    _WRITERS: Dict[str, str] = {
+        "overwrite": "_write_overwrite",
+        "append": "_write_append",
+        "merge": "_write_merge",
+        "scd2": "_write_scd2",
+    }
+    
     def __init__(self, context: "DatabricksContext"):
         """
         Initialize data writer.
@@ -70,25 +152,30 @@ class DataWriter:
         mode = target.mode.lower()
         
         try:
+            write_method = self._WRITERS.get(mode)
+            if write_method is None:
+                raise DataWriterError(f"Unknown write mode: {mode}")
+            
             # Ensure schema exists
             self._ensure_schema_exists(target)
             
-            if mode == "overwrite":
-                return self._write_overwrite(df, target)
-            elif mode == "append":
-                return self._write_append(df, target)
-            elif mode == "merge":
-                return self._write_merge(df, target)
-            elif mode == "scd2":
-                return self._write_scd2(df, target)
-            else:
-                raise DataWriterError(f"Unknown write mode: {mode}")
+            with self._advisory_partition_size(target):
+                record_count: int = getattr(self, write_method)(df, target)
+            
+            # The write may have created the table; drop the cached listing
+            self.context.invalidate(target.catalog, target.schema)
+            return record_count
                 
         except Exception as e:
             raise DataWriterError(f"Failed to write to {target.get_full_table_name()}: {e}") from e
     
     def _ensure_schema_exists(self, target: TargetConfig) -> None:
-        """Ensure target schema exists."""
+        """
+        Ensure target schema exists.
+        
+        The context remembers schemas it has created, so repeated writes
+        (e.g. micro-batches) issue the CREATE SCHEMA DDL only once.
+        """
         self.context.create_schema_if_not_exists(target.catalog, target.schema)
     
     def _write_overwrite(self, df: "DataFrame", target: TargetConfig) -> int:
@@ -96,19 +183,18 @@ class DataWriter:
         table_name = target.get_full_table_name()
         logger.info(f"Writing to {table_name} with overwrite mode")
         
-        record_count = df.count()
-        
+        df, observation = self._observe_count(self._coalesce_for_write(df, target), target)
         writer = df.write.format(target.format).mode("overwrite")
         
         # Apply options
-        for key, value in target.options.items():
-            writer = writer.option(key, value)
+        writer = self._apply_options(writer, target.options)
         
         # Apply partitioning
         if target.partition_by:
             writer = writer.partitionBy(*target.partition_by)
         
         writer.saveAsTable(table_name)
+        record_count = self._written_count(observation, target)
         
         # Optimize table if configured
         self._optimize_table(target)
@@ -120,19 +206,116 @@ class DataWriter:
         table_name = target.get_full_table_name()
         logger.info(f"Appending to {table_name}")
         
-        record_count = df.count()
-        
+        df, observation = self._observe_count(self._coalesce_for_write(df, target), target)
         writer = df.write.format(target.format).mode("append")
         
-        for key, value in target.options.items():
-            writer = writer.option(key, value)
+        writer = self._apply_options(writer, target.options)
         
         if target.partition_by:
             writer = writer.partitionBy(*target.partition_by)
         
         writer.saveAsTable(table_name)
         
-        return record_count
+        return self._written_count(observation, target)
+    
+    def _coalesce_for_write(self, df: "DataFrame", target: TargetConfig) -> "DataFrame":
+        """
+        Shape output partitions so the write doesn't leave many small files.
+        
+        ``num_output_partitions`` repartitions to a fixed count. Otherwise
+        ``target_file_size_mb`` adds a rebalance hint, which lets AQE split
+        or merge partitions towards that size (see `_advisory_partition_size`).
+        
+        Args:
+            df: DataFrame to write
+            target: Target configuration
+            
+        Returns:
+            DataFrame to hand to the writer
+        """
+        num_partitions = target.options.get("num_output_partitions")
+        if num_partitions:
+            return df.repartition(int(num_partitions), *target.partition_by)
+        
+        if target.options.get("target_file_size_mb"):
+            return df.hint("rebalance", *target.partition_by)
+        
+        return df
+    
+    @contextlib.contextmanager
+    def _advisory_partition_size(self, target: TargetConfig):
+        """
+        Use ``target_file_size_mb`` as AQE's advisory partition size for one write.
+        
+        The session value is restored (or unset) once the write finishes.
+        It is still session-wide while the write runs, so pipelines writing
+        concurrently on the same session see it too.
+        
+        Args:
+            target: Target configuration
+        """
+        target_file_size_mb = target.options.get("target_file_size_mb")
+        if not target_file_size_mb or target.options.get("num_output_partitions"):
+            yield
+            return
+        
+        previous = self.spark.conf.get(_ADVISORY_PARTITION_SIZE_CONF, None)
+        self.spark.conf.set(_ADVISORY_PARTITION_SIZE_CONF, f"{int(target_file_size_mb)}m")
+        try:
+            yield
+        finally:
+            if previous is None:
+                self.spark.conf.unset(_ADVISORY_PARTITION_SIZE_CONF)
+            else:
+                self.spark.conf.set(_ADVISORY_PARTITION_SIZE_CONF, previous)
+    
+    @staticmethod
+    def _apply_options(writer: Any, options: Dict[str, Any]) -> Any:
+        """Set all options on a writer in one call instead of one per option."""
+        return writer.options(**options) if options else writer
+    
+    @staticmethod
+    def _observe_count(
+        df: "DataFrame",
+        target: TargetConfig
+    ) -> Tuple["DataFrame", Optional[Observation]]:
+        """
+        Attach a row-count observation that is filled in by the write itself.
+        
+        Delta targets get no observation: the commit records the row count,
+        and ``Observation.get`` would block forever if the write command
+        didn't report observed metrics.
+        
+        Args:
+            df: DataFrame to write
+            target: Target configuration
+            
+        Returns:
+            Tuple of (DataFrame to write, observation or None)
+        """
+        if target.format == "delta":
+            return df, None
+        # Unnamed observations get a unique name; a fixed name would also be
+        # filled by other queries on the session (e.g. parallel pipelines)
+        observation = Observation()
+        return df.observe(observation, F.count(F.lit(1)).alias("n")), observation
+    
+    def _written_count(self, observation: Optional[Observation], target: TargetConfig) -> int:
+        """Rows written, from the observation or the Delta commit metrics."""
+        if observation is not None:
+            written: int = observation.get["n"]
+            return written
+        
+        from delta.tables import DeltaTable
+        
+        delta_table = DeltaTable.forName(self.spark, target.get_full_table_name())
+        return self._last_operation_metrics(delta_table).get("numOutputRows", 0)
+    
+    @staticmethod
+    def _last_operation_metrics(delta_table: Any) -> Dict[str, int]:
+        """Operation metrics of the table's latest commit."""
+        metrics = delta_table.history(1).select("operationMetrics").collect()[0][0]
+        return {key: int(value) for key, value in metrics.items()}
     
     def _write_merge(self, df: "DataFrame", target: TargetConfig) -> int:
         """Write with merge (upsert) mode."""
@@ -149,15 +332,9 @@ class DataWriter:
             logger.info(f"Target table {table_name} doesn't exist, creating with initial data")
             return self._write_overwrite(df, target)
         
-        # Build merge condition
-        merge_condition = " AND ".join([
-            f"target.{key} = source.{key}" for key in target.merge_keys
-        ])
-        
-        # Get column list for update/insert
-        columns = [c for c in df.columns if c not in target.merge_keys]
-        update_set = {col: f"source.{col}" for col in columns}
-        insert_values = {col: f"source.{col}" for col in df.columns}
+        merge_condition, update_set, insert_values = _merge_plan(
+            tuple(df.columns), tuple(target.merge_keys)
+        )
         
         delta_table = DeltaTable.forName(self.spark, table_name)
         
@@ -170,7 +347,7 @@ class DataWriter:
         
         merge_builder.execute()
         
-        return df.count()
+        return self._last_operation_metrics(delta_table).get("numSourceRows", 0)
     
     def _write_scd2(self, df: "DataFrame", target: TargetConfig) -> int:
         """Write with SCD Type 2 mode."""
@@ -200,63 +377,111 @@ class DataWriter:
             target.mode = "overwrite"
             return self._write_overwrite(source_df, target)
         
-        # Build merge condition (only match current records)
-        merge_condition = " AND ".join([
-            f"target.{key} = source.{key}" for key in target.merge_keys
-        ]) + f" AND target.{current_flag_col} = true"
-        
-        # Determine which columns to compare for changes
-        compare_cols = target.scd_columns if target.scd_columns else [
-            c for c in df.columns if c not in target.merge_keys
-        ]
-        
-        # Build change condition
-        change_conditions = " OR ".join([
-            f"target.{col} <> source.{col}" for col in compare_cols
-        ])
-        
-        delta_table = DeltaTable.forName(self.spark, table_name)
-        
-        # First: Close expired records
-        (
-            delta_table.alias("target")
-            .merge(source_df.alias("source"), merge_condition)
-            .whenMatchedUpdate(
-                condition=change_conditions,
-                set={
-                    end_date_col: F.current_timestamp(),
-                    current_flag_col: F.lit(False)
-                }
-            )
-            .execute()
+        # Staging copies of the merge keys: rows keyed normally close the
+        # current version (or insert brand-new keys); changed rows are staged
+        # a second time with NULL keys so the same MERGE inserts their new
+        # version.
+        staging_keys, merge_condition, change_conditions = _scd2_plan(
+            tuple(df.columns),
+            tuple(target.merge_keys),
+            tuple(target.scd_columns),
+            current_flag_col,
         )
         
-        # Second: Insert new versions
-        # Filter to only records that have changes
-        existing_df = self.spark.table(table_name).filter(F.col(current_flag_col) == True)
-        
-        new_records = (
-            source_df.alias("source")
-            .join(
-                existing_df.alias("existing"),
-                on=[F.col(f"source.{k}") == F.col(f"existing.{k}") for k in target.merge_keys],
-                how="left_anti"
+        # The source is read twice (keyed rows and changed rows); keep one
+        # materialization so the effective timestamps agree
+        source_df = source_df.persist(StorageLevel.MEMORY_AND_DISK)
+        try:
+            delta_table = DeltaTable.forName(self.spark, table_name)
+            # Reuse the snapshot loaded for the MERGE instead of resolving the table again
+            current_df = delta_table.toDF().filter(F.col(current_flag_col) == True)
+            join_source = source_df
+            broadcast_side = target.options.get("broadcast_side")
+            if broadcast_side == "source":
+                join_source = F.broadcast(source_df)
+            elif broadcast_side == "existing":
+                current_df = F.broadcast(current_df)
+            
+            source_schema = source_df.schema
+            changed_rows = (
+                join_source.alias("source")
+                .join(
+                    current_df.alias("target"),
+                    on=[F.col(f"source.{k}") == F.col(f"target.{k}") for k in target.merge_keys],
+                    how="inner"
+                )
+                .where(change_conditions)
+                .select(
+                    *[
+                        F.lit(None).cast(source_schema[key].dataType).alias(staging)
+                        for key, staging in staging_keys.items()
+                    ],
+                    "source.*"
+                )
             )
-        )
-        
-        # Insert new records
-        if new_records.count() > 0:
-            new_records.write.format("delta").mode("append").saveAsTable(table_name)
+            keyed_rows = source_df.select(
+                *[F.col(key).alias(staging) for key, staging in staging_keys.items()],
+                "*"
+            )
+            staged_df = keyed_rows.unionByName(changed_rows)
+            
+            insert_values = _insert_values(tuple(source_df.columns))
+            
+            # Close changed current rows and insert new versions in one pass
+            (
+                delta_table.alias("target")
+                .merge(staged_df.alias("source"), merge_condition)
+                .whenMatchedUpdate(
+                    condition=change_conditions,
+                    set={
+                        end_date_col: F.current_timestamp(),
+                        current_flag_col: F.lit(False)
+                    }
+                )
+                .whenNotMatchedInsert(values=insert_values)
+                .execute()
+            )
+        finally:
+            source_df.unpersist()
         
-        return df.count()
+        # Each closed row was staged twice, so subtract them to get the
+        # number of incoming records
+        metrics = self._last_operation_metrics(delta_table)
+        return metrics.get("numSourceRows", 0) - metrics.get("numTargetRowsUpdated", 0)
     
     def _optimize_table(self, target: TargetConfig) -> None:
-        """Optimize Delta table after write."""
+        """
+        Optimize Delta table after write.
+        
+        OPTIMIZE (with ZORDER BY when configured) runs at most once per
+        ``optimize_min_interval_hours`` (default 24); the time of the last
+        run is kept in the ``datalib.lastOptimizeTimestamp`` table property.
+        """
         optimize = target.options.get("optimize", False)
         z_order_by = target.options.get("z_order_by", [])
         
         if optimize:
             table_name = target.get_full_table_name()
+            
+            min_interval_hours = float(target.options.get("optimize_min_interval_hours", 24))
+            properties = self.context.get_table_properties(table_name)
+            raw_last_optimized = properties.get(_LAST_OPTIMIZE_PROPERTY, 0)
+            try:
+                last_optimized = float(raw_last_optimized)
+            except (TypeError, ValueError):
+                # The data is already written; a bad property must not fail the write
+                logger.warning(
+                    f"Ignoring invalid {_LAST_OPTIMIZE_PROPERTY}={raw_last_optimized!r} "
+                    f"on {table_name}"
+                )
+                last_optimized = 0.0
+            elapsed_hours = (time.time() - last_optimized) / 3600
+            if elapsed_hours < min_interval_hours:
+                logger.info(
+                    f"Skipping OPTIMIZE of {table_name}: last run {elapsed_hours:.1f}h ago"
+                )
+                return
+            
             logger.info(f"Optimizing table {table_name}")
             
             if z_order_by:
@@ -264,6 +489,11 @@ class DataWriter:
                 self.spark.sql(f"OPTIMIZE {table_name} ZORDER BY ({z_order_cols})")
             else:
                 self.spark.sql(f"OPTIMIZE {table_name}")
+            
+            self.spark.sql(
+                f"ALTER TABLE {table_name} SET TBLPROPERTIES "
+                f"('{_LAST_OPTIMIZE_PROPERTY}' = '{int(time.time())}')"
+            )
     
     def write_stream(
         self,
@@ -287,6 +517,11 @@ class DataWriter:
         table_name = target.get_full_table_name()
         logger.info(f"Starting streaming write to {table_name}")
         
+        options = dict(target.options)
+        if target.format == "delta":
+            # Let Delta bin-pack each micro-batch's output instead of writing small files
+            options = self._enable_stream_compaction(target, options)
+        
         writer = (
             df.writeStream
             .format(target.format)
@@ -298,10 +533,44 @@ class DataWriter:
             from pyspark.sql.streaming import Trigger
             writer = writer.trigger(processingTime=trigger_interval)
         
-        for key, value in target.options.items():
-            writer = writer.option(key, value)
+        writer = self._apply_options(writer, options)
         
         if target.partition_by:
             writer = writer.partitionBy(*target.partition_by)
         
         return writer.toTable(table_name)
+    
+    def _enable_stream_compaction(
+        self,
+        target: TargetConfig,
+        options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Turn on optimized writes and auto compaction for a Delta stream target.
+        
+        Existing tables get the properties via ALTER TABLE; a table the
+        stream creates gets them as ``delta.``-prefixed writer options, which
+        Delta records as table properties. Properties already given in the
+        target options are left as configured.
+        
+        Args:
+            target: Target configuration
+            options: Writer options built from the target config
+            
+        Returns:
+            Writer options for the stream
+        """
+        properties = {
+            key: value for key, value in _STREAM_COMPACTION_PROPERTIES.items()
+            if key not in options
+        }
+        if not properties:
+            return options
+        
+        if self.context.table_exists(target.catalog, target.schema, target.table):
+            assignments = ", ".join(f"'{key}' = '{value}'" for key, value in properties.items())
+            self.spark.sql(
+                f"ALTER TABLE {target.get_full_table_name()} SET TBLPROPERTIES ({assignments})"
+            )
+            return options
+        return {**properties, **options}
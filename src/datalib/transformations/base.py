@@ -7,13 +7,18 @@ and common utilities.
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pyspark.sql import DataFrame
 
 
+# Schemas remembered per ConditionalTransformation before the cache is reset
+_CONDITION_CACHE_SIZE = 128
+
+
 class TransformationError(Exception):
     """Raised when a transformation fails."""
     pass
@@ -51,6 +56,61 @@ class Transformation(ABC):
         """
         pass
     
+    def column_expressions(self, columns: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Express the transformation as independent column expressions.
+        
+        Transformations that only add or replace columns can override this
+        so consecutive steps are fused into a single ``withColumns``
+        projection. The expressions may only read ``input_columns()``.
+        
+        Args:
+            columns: Columns of the input DataFrame
+            
+        Returns:
+            Mapping of column name to Column expression, or None if the
+            transformation must be applied with ``transform``
+        """
+        return None
+    
+    def input_columns(self) -> Optional[Set[str]]:
+        """
+        Columns read by ``column_expressions``.
+        
+        Returns:
+            Set of column names, or None if they cannot be determined
+        """
+        return None
+    
+    def column_selection(self, columns: List[str]) -> Optional[List[Tuple[str, str]]]:
+        """
+        Express the transformation as a selection of existing columns.
+        
+        Transformations that only select, drop or rename columns can
+        override this so consecutive steps in a ``ChainedTransformation``
+        are collapsed into a single ``selectExpr``.
+        
+        Args:
+            columns: Columns of the input DataFrame
+            
+        Returns:
+            Ordered (input column, output name) pairs, or None if the
+            transformation must be applied with ``transform``
+        """
+        return None
+    
+    def filter_condition(self) -> Optional[str]:
+        """
+        Express the transformation as a row filter.
+        
+        Pure filters can override this so consecutive filters in a
+        ``ChainedTransformation`` are combined into a single ``filter``.
+        
+        Returns:
+            SQL predicate, or None if the transformation is not a pure filter
+        """
+        return None
+    
     def validate(self, df: "DataFrame") -> bool:
         """
         Validate that transformation can be applied.
@@ -94,11 +154,42 @@ class ChainedTransformation(Transformation):
         self.transformations = transformations
     
     def transform(self, df: "DataFrame") -> "DataFrame":
-        """Apply all transformations in sequence."""
-        result = df
+        """
+        Apply all transformations in sequence.
+        
+        Runs of column-expression steps are fused into one ``withColumns``
+        projection, runs of filters into one ``filter`` and runs of
+        select/drop/rename steps into one ``selectExpr``, which keeps the
+        logical plan short. Other steps are applied with ``transform``.
+        """
+        pending = _PendingSteps(df)
+        
         for transformation in self.transformations:
-            result = transformation.transform(result)
-        return result
+            predicate = transformation.filter_condition()
+            if isinstance(predicate, str):
+                pending.add_filter(predicate)
+                continue
+            
+            selection = transformation.column_selection(pending.columns)
+            if isinstance(selection, list):
+                pending.add_selection(selection)
+                continue
+            
+            inputs = transformation.input_columns()
+            if pending.predicates or pending.selection is not None or (
+                pending.expressions
+                and not (isinstance(inputs, set) and inputs.isdisjoint(pending.expressions))
+            ):
+                pending.flush()
+            
+            expressions = transformation.column_expressions(pending.df.columns)
+            if isinstance(expressions, dict):
+                pending.expressions.update(expressions)
+                continue
+            
+            pending.df = transformation.transform(pending.flush())
+        
+        return pending.flush()
     
     def append(self, transformation: Transformation) -> "ChainedTransformation":
         """
@@ -114,6 +205,74 @@ class ChainedTransformation(Transformation):
         return self
 
 
+class _PendingSteps:
+    """
+    Fusable steps of a ``ChainedTransformation`` waiting to be applied.
+    
+    Only one kind of step is pending at a time; adding a different kind
+    applies the pending group first.
+    """
+    
+    def __init__(self, df: "DataFrame"):
+        self.df = df
+        self.expressions: Dict[str, Any] = {}
+        self.predicates: List[str] = []
+        self.selection: Optional[List[Tuple[str, str]]] = None
+    
+    @property
+    def columns(self) -> List[str]:
+        """Columns of the DataFrame once the pending steps are applied."""
+        if self.selection is not None:
+            return [name for _, name in self.selection]
+        columns = list(self.df.columns)
+        return columns + [c for c in self.expressions if c not in columns]
+    
+    def add_filter(self, predicate: str) -> None:
+        """Queue a SQL predicate, AND-ed with the pending ones."""
+        if self.expressions or self.selection is not None:
+            self.flush()
+        self.predicates.append(predicate)
+    
+    def add_selection(self, selection: List[Tuple[str, str]]) -> None:
+        """Queue a column selection, composed with the pending one."""
+        if self.expressions or self.predicates:
+            self.flush()
+        if self.selection is not None:
+            sources = {name: source for source, name in self.selection}
+            selection = [(sources[column], name) for column, name in selection]
+        self.selection = selection
+    
+    def flush(self) -> "DataFrame":
+        """Apply the pending steps and return the resulting DataFrame."""
+        if self.expressions:
+            self.df = self.df.withColumns(self.expressions)
+            self.expressions = {}
+        if self.predicates:
+            if len(self.predicates) == 1:
+                self.df = self.df.filter(self.predicates[0])
+            else:
+                self.df = self.df.filter(" AND ".join(f"({p})" for p in self.predicates))
+            self.predicates = []
+        if self.selection is not None:
+            self.df = self.df.selectExpr(*(
+                f"{_quote(source)} AS {_quote(name)}" for source, name in self.selection
+            ))
+            self.selection = None
+        return self.df
+
+
+def _quote(column: str) -> str:
+    """Quote a column name for use in a SQL expression."""
+    return "`" + column.replace("`", "``") + "`"
+
+
+@functools.lru_cache(maxsize=_CONDITION_CACHE_SIZE)
+def _compile_condition(expression: str) -> Callable[["DataFrame"], Any]:
+    """Compile a Python condition expression once into a predicate over `df`."""
+    code = compile(expression, f"<condition: {expression}>", "eval")
+    return lambda df: eval(code, {"df": df})
+
+
 class ConditionalTransformation(Transformation):
     """
     Apply transformation conditionally based on a predicate.
@@ -123,25 +282,47 @@ class ConditionalTransformation(Transformation):
         ...     transformation=CastColumns({"amount": "double"}),
         ...     condition=lambda df: "amount" in df.columns
         ... )
+        >>> transform = ConditionalTransformation(
+        ...     CastColumns({"amount": "double"}), '"amount" in df.columns'
+        ... )
     """
     
     def __init__(
         self,
         transformation: Transformation,
-        condition: callable
+        condition: Union[Callable[["DataFrame"], Any], str],
+        cache_by_schema: bool = False
     ):
         """
         Initialize conditional transformation.
         
         Args:
             transformation: Transformation to apply
-            condition: Callable that takes DataFrame and returns bool
+            condition: Callable that takes DataFrame and returns bool, or a
+                trusted Python expression over `df` (compiled once per process)
+            cache_by_schema: Remember the condition result per schema; only
+                valid when the condition looks at the schema, not the data
         """
         self.transformation = transformation
         self.condition = condition
+        self.cache_by_schema = cache_by_schema
+        self._predicate = condition if callable(condition) else _compile_condition(condition)
+        self._results: Dict[str, bool] = {}
+    
+    def _evaluate(self, df: "DataFrame") -> bool:
+        """Evaluate the condition, reusing the result for a known schema."""
+        if not self.cache_by_schema:
+            return bool(self._predicate(df))
+        
+        key = df.schema.simpleString()
+        if key not in self._results:
+            if len(self._results) >= _CONDITION_CACHE_SIZE:
+                self._results.clear()
+            self._results[key] = bool(self._predicate(df))
+        return self._results[key]
     
     def transform(self, df: "DataFrame") -> "DataFrame":
         """Apply transformation if condition is met."""
-        if self.condition(df):
+        if self._evaluate(df):
             return self.transformation.transform(df)
         return df
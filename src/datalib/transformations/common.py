@@ -7,8 +7,10 @@ processing operations.
 
 from __future__ import annotations
 
+import functools
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
 from pyspark.sql import functions as F
 from pyspark.sql.types import (
@@ -37,6 +39,38 @@ TYPE_MAPPING = {
     "timestamp": TimestampType(),
 }
 
+# decimal(precision,scale) type names
+_DECIMAL_PATTERN = re.compile(r"decimal\((\d+)\s*,\s*(\d+)\)")
+
+
+# Non-cryptographic HashColumn algorithms and the Spark functions computing them
+_COLUMN_HASHES = {"murmur3": "hash", "xxhash64": "xxhash64"}
+
+
+@functools.lru_cache(maxsize=128)
+def _decimal_type(precision: int, scale: int) -> DecimalType:
+    """Shared DecimalType instance per precision and scale."""
+    return DecimalType(precision, scale)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_type(type_name: str) -> Any:
+    """Map a configured type name to a Spark data type."""
+    type_name = type_name.lower()
+    target_type = TYPE_MAPPING.get(type_name)
+    if target_type is None:
+        # Try decimal with precision
+        if type_name.startswith("decimal"):
+            # Parse decimal(p,s) format
+            match = _DECIMAL_PATTERN.match(type_name)
+            if match:
+                target_type = _decimal_type(int(match.group(1)), int(match.group(2)))
+            else:
+                target_type = _decimal_type(38, 10)
+        else:
+            raise TransformationError(f"Unknown type: {type_name}")
+    return target_type
+
 
 class AddTimestampColumn(Transformation):
     """
@@ -67,12 +101,21 @@ class AddTimestampColumn(Transformation):
     
     def transform(self, df: "DataFrame") -> "DataFrame":
         """Add timestamp column to DataFrame."""
+        return df.withColumn(self.column_name, self._expression())
+    
+    def _expression(self) -> Any:
+        """Build the timestamp column expression."""
         if self.value:
-            return df.withColumn(
-                self.column_name,
-                F.lit(self.value).cast(TimestampType())
-            )
-        return df.withColumn(self.column_name, F.current_timestamp())
+            return F.lit(self.value).cast(TimestampType())
+        return F.current_timestamp()
+    
+    def column_expressions(self, columns: List[str]) -> Optional[Dict[str, Any]]:
+        """Timestamp column as a fusable expression."""
+        return {self.column_name: self._expression()}
+    
+    def input_columns(self) -> Optional[Set[str]]:
+        """The timestamp reads no columns."""
+        return set()
 
 
 class CastColumns(Transformation):
@@ -102,33 +145,32 @@ class CastColumns(Transformation):
         """
         self.column_types = column_types
         self.strict = strict
+        # Resolve type names once; unknown types fail at construction
+        self._target_types = {
+            column: _resolve_type(type_name)
+            for column, type_name in column_types.items()
+        }
     
     def transform(self, df: "DataFrame") -> "DataFrame":
-        """Cast columns to specified types."""
-        for column, type_name in self.column_types.items():
-            if column not in df.columns:
+        """Cast columns to specified types in a single projection."""
+        expressions = self.column_expressions(df.columns)
+        return df.withColumns(expressions) if expressions else df
+    
+    def column_expressions(self, columns: List[str]) -> Optional[Dict[str, Any]]:
+        """Casts as fusable expressions."""
+        existing = set(columns)
+        expressions = {}
+        for column, target_type in self._target_types.items():
+            if column not in existing:
                 if self.strict:
                     raise TransformationError(f"Column not found: {column}")
                 continue
-            
-            target_type = TYPE_MAPPING.get(type_name.lower())
-            if target_type is None:
-                # Try decimal with precision
-                if type_name.lower().startswith("decimal"):
-                    # Parse decimal(p,s) format
-                    import re
-                    match = re.match(r"decimal\((\d+),(\d+)\)", type_name.lower())
-                    if match:
-                        precision, scale = int(match.group(1)), int(match.group(2))
-                        target_type = DecimalType(precision, scale)
-                    else:
-                        target_type = DecimalType(38, 10)
-                else:
-                    raise TransformationError(f"Unknown type: {type_name}")
-            
-            df = df.withColumn(column, F.col(column).cast(target_type))
-        
-        return df
+            expressions[column] = F.col(column).cast(target_type)
+        return expressions
+    
+    def input_columns(self) -> Optional[Set[str]]:
+        """Casts read the columns they replace."""
+        return set(self.column_types)
 
 
 class RenameColumns(Transformation):
@@ -159,20 +201,38 @@ class RenameColumns(Transformation):
         self.strict = strict
     
     def transform(self, df: "DataFrame") -> "DataFrame":
-        """Rename columns according to mapping."""
+        """Rename columns according to mapping in a single projection."""
+        # Resolve chained renames (a -> b, b -> c) in mapping order first;
+        # withColumnsRenamed applies every entry to the original columns
+        renames = {old: new for old, new in self._renamed(df.columns) if old != new}
+        return df.withColumnsRenamed(renames) if renames else df
+    
+    def column_selection(self, columns: List[str]) -> Optional[List[Tuple[str, str]]]:
+        """Renames as a fusable selection, applied in mapping order."""
+        return self._renamed(columns)
+    
+    def _renamed(self, columns: List[str]) -> List[Tuple[str, str]]:
+        """Pair each column with its name after applying the mapping in order."""
+        names = list(columns)
         for old_name, new_name in self.column_mapping.items():
-            if old_name not in df.columns:
+            if old_name not in names:
                 if self.strict:
                     raise TransformationError(f"Column not found: {old_name}")
                 continue
-            df = df.withColumnRenamed(old_name, new_name)
-        return df
+            names = [new_name if name == old_name else name for name in names]
+        return list(zip(columns, names))
 
 
 class FilterRows(Transformation):
     """
     Filter rows based on a SQL expression.
     
+    The condition is handed to Spark as a single predicate. Catalyst splits
+    it on top-level AND, pushes each deterministic conjunct below projections
+    and into Parquet/Delta scans (partition pruning, row-group and file
+    skipping), and keeps the rest as a residual filter, so conditions on
+    partition or statistics columns prune without any hints.
+    
     Example:
         >>> trans = FilterRows("amount > 0 AND status = 'active'")
         >>> df = trans.transform(df)
@@ -198,6 +258,12 @@ class FilterRows(Transformation):
         if self.negate:
             return df.filter(~F.expr(self.condition))
         return df.filter(self.condition)
+    
+    def filter_condition(self) -> Optional[str]:
+        """Condition as a SQL predicate so adjacent filters can be combined."""
+        if self.negate:
+            return f"NOT ({self.condition})"
+        return self.condition
 
 
 class DeduplicateRows(Transformation):
@@ -218,7 +284,10 @@ class DeduplicateRows(Transformation):
         subset: Optional[List[str]] = None,
         keep: str = "first",
         order_by: Optional[List[str]] = None,
-        order_desc: bool = True
+        order_desc: bool = True,
+        prefilter: Optional[str] = None,
+        drop_nulls: bool = False,
+        strategy: str = "auto"
     ):
         """
         Initialize transformation.
@@ -228,14 +297,36 @@ class DeduplicateRows(Transformation):
             keep: Which duplicate to keep ('first', 'last', 'none')
             order_by: Columns to order by when keeping first/last
             order_desc: Order descending (for keeping latest)
+            prefilter: SQL filter applied before deduplicating, so rows it
+                removes never reach the shuffle
+            drop_nulls: Drop rows with a NULL in any ``subset`` column
+                before deduplicating
+            strategy: How first/last rows are picked: 'window' (row_number),
+                'agg' (max/min aggregate, no sort) or 'auto' (agg unless a
+                column holds a map, which can't be compared)
         """
         self.subset = subset
         self.keep = keep
         self.order_by = order_by
         self.order_desc = order_desc
+        self.prefilter = prefilter
+        self.drop_nulls = drop_nulls
+        self.strategy = strategy
+    
+    def _prefilter_condition(self, columns: List[str]) -> Optional[str]:
+        """Combine ``prefilter`` and the ``drop_nulls`` checks into one predicate."""
+        conditions = [f"({self.prefilter})"] if self.prefilter else []
+        if self.drop_nulls:
+            conditions.extend(f"`{c}` IS NOT NULL" for c in (self.subset or columns))
+        return " AND ".join(conditions) or None
     
     def transform(self, df: "DataFrame") -> "DataFrame":
         """Remove duplicate rows."""
+        condition = self._prefilter_condition(df.columns)
+        if condition:
+            # Filter below the window/aggregate; Spark can't push it past them
+            df = df.filter(condition)
+        
         if self.keep == "none":
             return df.dropDuplicates(self.subset)
         
@@ -243,6 +334,9 @@ class DeduplicateRows(Transformation):
             from pyspark.sql.window import Window
             
             partition_cols = self.subset or df.columns
+            if self._use_aggregate(df):
+                return self._keep_by_aggregate(df, partition_cols, self.order_by)
+            
             window = Window.partitionBy(partition_cols)
             
             order_cols = [
@@ -264,7 +358,47 @@ class DeduplicateRows(Transformation):
                 .drop("_row_num")
             )
         
+        # Planned as a partial HashAggregate (first() of the other columns)
+        # before the exchange, so each task ships at most one row per key;
+        # packing the other columns into a struct or repartitioning by the
+        # subset first would only add work.
         return df.dropDuplicates(self.subset)
+    
+    def _use_aggregate(self, df: "DataFrame") -> bool:
+        """Whether to pick first/last rows with an aggregate instead of a window."""
+        if self.strategy == "auto":
+            return not any("map<" in dtype for _, dtype in df.dtypes)
+        return self.strategy == "agg"
+    
+    def _keep_by_aggregate(
+        self,
+        df: "DataFrame",
+        partition_cols: List[str],
+        order_by: List[str]
+    ) -> "DataFrame":
+        """
+        Keep one row per key as the max/min of a struct led by the order columns.
+        
+        Struct comparison orders by the leading fields first, so this picks
+        the same row as the row_number window without sorting each partition.
+        """
+        keys = set(partition_cols)
+        others = [c for c in df.columns if c not in keys]
+        ordering = F.struct(
+            *[F.col(c).alias(f"_order_{i}") for i, c in enumerate(order_by)],
+            *[F.col(c) for c in others],
+        )
+        # 'first' of a descending order is the max, 'last' of it the min
+        pick = F.max if (self.keep == "first") == self.order_desc else F.min
+        
+        return (
+            df.groupBy(*partition_cols)
+            .agg(pick(ordering).alias("_kept"))
+            .select(*[
+                F.col(c) if c in keys else F.col("_kept").getField(c).alias(c)
+                for c in df.columns
+            ])
+        )
 
 
 class SelectColumns(Transformation):
@@ -300,6 +434,14 @@ class SelectColumns(Transformation):
         
         existing_columns = [c for c in self.columns if c in df.columns]
         return df.select(existing_columns)
+    
+    def column_selection(self, columns: List[str]) -> Optional[List[Tuple[str, str]]]:
+        """Selected columns as a fusable selection."""
+        if self.strict:
+            missing = set(self.columns) - set(columns)
+            if missing:
+                raise TransformationError(f"Columns not found: {missing}")
+        return [(c, c) for c in self.columns if c in columns]
 
 
 class DropColumns(Transformation):
@@ -327,13 +469,24 @@ class DropColumns(Transformation):
         self.ignore_missing = ignore_missing
     
     def transform(self, df: "DataFrame") -> "DataFrame":
-        """Drop specified columns."""
-        for column in self.columns:
-            if column in df.columns:
-                df = df.drop(column)
-            elif not self.ignore_missing:
-                raise TransformationError(f"Column not found: {column}")
-        return df
+        """Drop specified columns in a single projection."""
+        existing = set(df.columns)
+        if not self.ignore_missing:
+            missing = [c for c in self.columns if c not in existing]
+            if missing:
+                raise TransformationError(f"Column not found: {missing[0]}")
+        
+        to_drop = [c for c in self.columns if c in existing]
+        return df.drop(*to_drop) if to_drop else df
+    
+    def column_selection(self, columns: List[str]) -> Optional[List[Tuple[str, str]]]:
+        """Remaining columns as a fusable selection."""
+        if not self.ignore_missing:
+            for column in self.columns:
+                if column not in columns:
+                    raise TransformationError(f"Column not found: {column}")
+        dropped = set(self.columns)
+        return [(c, c) for c in columns if c not in dropped]
 
 
 class FillNulls(Transformation):
@@ -363,18 +516,20 @@ class FillNulls(Transformation):
         """
         self.fill_values = fill_values
         self.subset = subset
+        
+        # Both inputs are fixed, so restrict to the subset once
+        if subset:
+            subset_columns = set(subset)
+            self._fill_values = {
+                k: v for k, v in fill_values.items()
+                if k in subset_columns
+            }
+        else:
+            self._fill_values = fill_values
     
     def transform(self, df: "DataFrame") -> "DataFrame":
         """Fill null values."""
-        if self.subset:
-            fill_values = {
-                k: v for k, v in self.fill_values.items()
-                if k in self.subset
-            }
-        else:
-            fill_values = self.fill_values
-        
-        return df.fillna(fill_values)
+        return df.fillna(self._fill_values)
 
 
 class StandardizeStrings(Transformation):
@@ -415,27 +570,35 @@ class StandardizeStrings(Transformation):
         self.remove_extra_spaces = remove_extra_spaces
     
     def transform(self, df: "DataFrame") -> "DataFrame":
-        """Standardize string columns."""
-        for column in self.columns:
-            if column not in df.columns:
-                continue
-            
-            col_expr = F.col(column)
-            
-            if self.trim:
-                col_expr = F.trim(col_expr)
-            
-            if self.lowercase:
-                col_expr = F.lower(col_expr)
-            elif self.uppercase:
-                col_expr = F.upper(col_expr)
-            
-            if self.remove_extra_spaces:
-                col_expr = F.regexp_replace(col_expr, r"\s+", " ")
-            
-            df = df.withColumn(column, col_expr)
+        """Standardize string columns in a single projection."""
+        expressions = self.column_expressions(df.columns)
+        return df.withColumns(expressions) if expressions else df
+    
+    def _expression(self, column: str) -> Any:
+        """Build the standardization expression for a column."""
+        col_expr = F.col(column)
+        
+        if self.trim:
+            col_expr = F.trim(col_expr)
         
-        return df
+        if self.lowercase:
+            col_expr = F.lower(col_expr)
+        elif self.uppercase:
+            col_expr = F.upper(col_expr)
+        
+        if self.remove_extra_spaces:
+            col_expr = F.regexp_replace(col_expr, r"\s+", " ")
+        
+        return col_expr
+    
+    def column_expressions(self, columns: List[str]) -> Optional[Dict[str, Any]]:
+        """Standardizations as fusable expressions."""
+        existing = set(columns)
+        return {c: self._expression(c) for c in self.columns if c in existing}
+    
+    def input_columns(self) -> Optional[Set[str]]:
+        """Standardization reads the columns it replaces."""
+        return set(self.columns)
 
 
 class AddDerivedColumn(Transformation):
@@ -468,6 +631,10 @@ class AddDerivedColumn(Transformation):
     def transform(self, df: "DataFrame") -> "DataFrame":
         """Add derived column."""
         return df.withColumn(self.column_name, F.expr(self.expression))
+    
+    def column_expressions(self, columns: List[str]) -> Optional[Dict[str, Any]]:
+        """Derived column as a fusable expression."""
+        return {self.column_name: F.expr(self.expression)}
 
 
 class HashColumn(Transformation):
@@ -497,18 +664,48 @@ class HashColumn(Transformation):
         Args:
             column_name: Name of hash column
             source_columns: Columns to include in hash
-            algorithm: Hash algorithm (md5, sha1, sha256)
+            algorithm: Hash algorithm (md5, sha1, sha256, or the
+                non-cryptographic murmur3 (int) and xxhash64 (bigint), which
+                are much cheaper and fine for change detection but not for
+                anything security-related)
         """
         self.column_name = column_name
         self.source_columns = source_columns
         self.algorithm = algorithm
+        self._hash_expr = None
     
     def transform(self, df: "DataFrame") -> "DataFrame":
         """Create hash column."""
+        return df.withColumn(self.column_name, self._expression())
+    
+    def column_expressions(self, columns: List[str]) -> Optional[Dict[str, Any]]:
+        """Hash column as a fusable expression."""
+        return {self.column_name: self._expression()}
+    
+    def input_columns(self) -> Optional[Set[str]]:
+        """The hash reads its source columns."""
+        return set(self.source_columns)
+    
+    def _expression(self) -> Any:
+        """Hash expression, built once and reused across calls."""
+        if self._hash_expr is None:
+            self._hash_expr = self._build_expression()
+        return self._hash_expr
+    
+    def _build_expression(self) -> Any:
+        """Build the hash expression."""
+        if self.algorithm in _COLUMN_HASHES:
+            # Hashes the typed values directly, without building a string.
+            # NULLs don't feed the hash, so null flags keep their position.
+            return getattr(F, _COLUMN_HASHES[self.algorithm])(
+                *[F.col(c) for c in self.source_columns],
+                *[F.col(c).isNull() for c in self.source_columns]
+            )
+        
         # Concatenate source columns
         concat_cols = F.concat_ws(
             "|",
-            *[F.coalesce(F.col(c).cast("string"), F.lit("")) for c in self.source_columns]
+            *[F.coalesce(F.col(c).cast(StringType()), F.lit("")) for c in self.source_columns]
         )
         
         # Apply hash function
@@ -519,4 +716,4 @@ class HashColumn(Transformation):
         else:  # sha256
             hash_expr = F.sha2(concat_cols, 256)
         
-        return df.withColumn(self.column_name, hash_expr)
+        return hash_expr
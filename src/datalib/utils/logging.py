@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 from typing import Optional
 
 
@@ -16,6 +17,9 @@ from typing import Optional
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Serializes handler setup so concurrent callers don't both attach one
+_configure_lock = threading.Lock()
+
 
 def get_logger(
     name: str,
@@ -35,22 +39,24 @@ def get_logger(
     """
     logger = logging.getLogger(name)
     
-    # Only configure if no handlers exist
+    # Only configure if no handlers exist; re-checked under the lock
     if not logger.handlers:
-        logger.setLevel(level)
-        
-        # Create console handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(level)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            format_string or LOG_FORMAT,
-            datefmt=DATE_FORMAT
-        )
-        handler.setFormatter(formatter)
-        
-        logger.addHandler(handler)
+        with _configure_lock:
+            if not logger.handlers:
+                logger.setLevel(level)
+                
+                # Create console handler
+                handler = logging.StreamHandler(sys.stdout)
+                handler.setLevel(level)
+                
+                # Create formatter
+                formatter = logging.Formatter(
+                    format_string or LOG_FORMAT,
+                    datefmt=DATE_FORMAT
+                )
+                handler.setFormatter(formatter)
+                
+                logger.addHandler(handler)
     
     return logger
 
@@ -81,6 +87,7 @@ class PipelineLogger:
         self.layer = layer
         self.run_id = run_id or self._generate_run_id()
         self._logger = get_logger(f"datalib.pipeline.{pipeline_name}")
+        self._prefix = f"[{layer}][{pipeline_name}][{self.run_id}] "
     
     def _generate_run_id(self) -> str:
         """Generate a unique run ID."""
@@ -90,25 +97,32 @@ class PipelineLogger:
     
     def _format_message(self, message: str) -> str:
         """Format message with pipeline context."""
-        return f"[{self.layer}][{self.pipeline_name}][{self.run_id}] {message}"
+        return self._prefix + message
+    
+    def _log(self, level: int, message: str, **kwargs) -> None:
+        """Log with context, skipping the formatting when the level is disabled."""
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, self._format_message(message), **kwargs)
     
     def info(self, message: str, **kwargs) -> None:
         """Log info message."""
-        self._logger.info(self._format_message(message), **kwargs)
+        self._log(logging.INFO, message, **kwargs)
     
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message."""
-        self._logger.warning(self._format_message(message), **kwargs)
+        self._log(logging.WARNING, message, **kwargs)
     
     def error(self, message: str, **kwargs) -> None:
         """Log error message."""
-        self._logger.error(self._format_message(message), **kwargs)
+        self._log(logging.ERROR, message, **kwargs)
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
-        self._logger.debug(self._format_message(message), **kwargs)
+        self._log(logging.DEBUG, message, **kwargs)
     
     def log_metrics(self, metrics: dict) -> None:
         """Log pipeline metrics."""
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         metrics_str = ", ".join(f"{k}={v}" for k, v in metrics.items())
         self.info(f"Metrics: {metrics_str}")
@@ -7,7 +7,8 @@ and data quality checks.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import functools
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from datalib.utils.logging import get_logger
 
@@ -24,6 +25,12 @@ class ValidationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=256)
+def _split_path(field: str) -> Tuple[str, ...]:
+    """Split a dotted field name into its parts."""
+    return tuple(field.split("."))
+
+
 def validate_config(config: Dict[str, Any], required_fields: List[str]) -> bool:
     """
     Validate configuration has required fields.
@@ -41,15 +48,12 @@ def validate_config(config: Dict[str, Any], required_fields: List[str]) -> bool:
     missing = []
     
     for field in required_fields:
-        parts = field.split(".")
         value = config
-        
-        for part in parts:
-            if isinstance(value, dict) and part in value:
+        try:
+            for part in _split_path(field):
                 value = value[part]
-            else:
-                missing.append(field)
-                break
+        except (KeyError, TypeError):
+            missing.append(field)
     
     if missing:
         raise ValidationError(f"Missing required fields: {missing}")
@@ -83,12 +87,13 @@ def validate_schema(
         "type_mismatches": [],
     }
     
-    # Check for missing columns
+    # Check for missing columns; DataTypes compare directly, strings are
+    # only built for the mismatch report
     for name, dtype in expected_fields.items():
         if name not in actual_fields:
             result["missing_columns"].append(name)
             result["valid"] = False
-        elif str(actual_fields[name]) != str(dtype):
+        elif actual_fields[name] != dtype:
             result["type_mismatches"].append({
                 "column": name,
                 "expected": str(dtype),
@@ -99,14 +104,145 @@ def validate_schema(
     
     # Check for extra columns
     if strict:
-        for name in actual_fields:
-            if name not in expected_fields:
-                result["extra_columns"].append(name)
-                result["valid"] = False
+        extra = actual_fields.keys() - expected_fields.keys()
+        result["extra_columns"] = [name for name in actual_fields if name in extra]
+        if extra:
+            result["valid"] = False
     
     return result
 
 
+def _failure_counter(check: Dict[str, Any]) -> Optional[Any]:
+    """
+    Build the aggregate counting rows that fail a row-level check.
+    
+    Args:
+        check: Check configuration
+        
+    Returns:
+        Aggregate Column, or None for checks that aren't row-level
+    """
+    from pyspark.sql import functions as F
+    
+    if check.get("type") == "not_null":
+        # count(column) already skips NULLs, so no per-row predicate is needed
+        return F.count(F.lit(1)) - F.count(F.col(check.get("column")))
+    
+    condition = _failure_condition(check)
+    if condition is None:
+        return None
+    return F.count(F.when(condition, True))
+
+
+def _failure_condition(check: Dict[str, Any]) -> Optional[Any]:
+    """
+    Build the predicate matching rows that fail a row-level check.
+    
+    Args:
+        check: Check configuration
+        
+    Returns:
+        Column predicate, or None for checks without one
+    """
+    from pyspark.sql import functions as F
+    
+    check_type = check.get("type")
+    column = check.get("column")
+    
+    if check_type == "range":
+        min_val = check.get("min")
+        max_val = check.get("max")
+        
+        condition = F.lit(True)
+        if min_val is not None:
+            condition = condition & (F.col(column) >= min_val)
+        if max_val is not None:
+            condition = condition & (F.col(column) <= max_val)
+        return ~condition
+    
+    if check_type == "regex":
+        return ~F.col(column).rlike(check.get("pattern"))
+    
+    if check_type == "values":
+        # Lists longer than spark.sql.optimizer.inSetConversionThreshold (10)
+        # are planned as InSet, a hash-set probe, so large allow-lists stay
+        # O(1) per row and keep the check inside the fused aggregation
+        return ~F.col(column).isin(check.get("allowed", []))
+    
+    if check_type == "custom":
+        return ~F.expr(check.get("expression"))
+    
+    return None
+
+
+def _failure_message(check: Dict[str, Any], failed_count: int) -> str:
+    """Describe the result of a row-level check."""
+    check_type = check.get("type")
+    if check_type == "not_null":
+        return f"{failed_count} null values found"
+    if check_type == "range":
+        return f"{failed_count} values out of range [{check.get('min')}, {check.get('max')}]"
+    if check_type == "regex":
+        return f"{failed_count} values don't match pattern"
+    if check_type == "values":
+        return f"{failed_count} values not in allowed list"
+    return f"{failed_count} rows failed custom check"
+
+
+def _count_failures(
+    df: "DataFrame",
+    counters: Dict[int, Any],
+    need_total: bool = True
+) -> Tuple[Optional[int], Dict[int, Any]]:
+    """
+    Evaluate every failure counter, plus the row total, in one job.
+    
+    If the combined aggregation fails (e.g. a check names a missing
+    column), each counter is evaluated on its own so only the broken
+    check reports the error.
+    
+    Args:
+        df: DataFrame to validate
+        counters: Failure-count aggregates keyed by check index
+        need_total: Whether the caller needs the row count; without it and
+            without counters no job is run
+        
+    Returns:
+        Tuple of (total rows or None, failed count or exception per check index)
+    """
+    from pyspark.sql import functions as F
+    
+    if not counters and not need_total:
+        return None, {}
+    
+    aggregates = [F.count(F.lit(1)).alias("_total")] + [
+        counter.alias(f"_check_{index}") for index, counter in counters.items()
+    ]
+    try:
+        row = df.agg(*aggregates).first()
+        # A global aggregation always returns exactly one row
+        assert row is not None
+        return row["_total"], {index: row[f"_check_{index}"] for index in counters}
+    except Exception:
+        if not counters:
+            raise
+    
+    failure_counts = {}
+    for index, counter in counters.items():
+        try:
+            row = df.agg(counter).first()
+            assert row is not None
+            failure_counts[index] = row[0]
+        except Exception as e:
+            failure_counts[index] = e
+    return (df.count() if need_total else None), failure_counts
+
+
+def _positive_number(value: Any) -> bool:
+    """Whether a check option is a number greater than zero."""
+    return isinstance(value, (int, float)) and value > 0
+
+
 def run_quality_checks(
     df: "DataFrame",
     checks: List[Dict[str, Any]],
@@ -123,6 +259,9 @@ def run_quality_checks(
     - values: Check values in allowed list
     - custom: Custom SQL expression
     
+    All checks except ``unique`` are evaluated together with the row count
+    in a single aggregation over the DataFrame.
+    
     Args:
         df: DataFrame to validate
         checks: List of check configurations
@@ -140,9 +279,28 @@ def run_quality_checks(
         "validated_df": df,
     }
     
-    total_rows = df.count()
+    # Row-level checks are counted together with the row total in one pass
+    counters = {}
+    counter_errors = {}
+    for index, check in enumerate(checks):
+        try:
+            counter = _failure_counter(check)
+        except Exception as e:
+            counter_errors[index] = e
+            continue
+        if counter is not None:
+            counters[index] = counter
     
-    for check in checks:
+    # The row count is only needed for row_count checks and thresholds
+    # (malformed thresholds are reported per check below, not raised here)
+    need_total = any(
+        check.get("type") == "row_count" or _positive_number(check.get("threshold", 0))
+        for check in checks
+    )
+    total_rows, failure_counts = _count_failures(df, counters, need_total)
+    failure_counts.update(counter_errors)
+    
+    for index, check in enumerate(checks):
         check_type = check.get("type")
         column = check.get("column")
         check_name = check.get("name", f"{check_type}_{column}")
@@ -157,11 +315,13 @@ def run_quality_checks(
         }
         
         try:
-            if check_type == "not_null":
-                failed_count = df.filter(F.col(column).isNull()).count()
+            if index in failure_counts:
+                failed_count = failure_counts[index]
+                if isinstance(failed_count, Exception):
+                    raise failed_count
                 check_result["passed"] = failed_count == 0
                 check_result["failed_count"] = failed_count
-                check_result["message"] = f"{failed_count} null values found"
+                check_result["message"] = _failure_message(check, failed_count)
                 
             elif check_type == "unique":
                 duplicate_count = df.groupBy(column).count().filter(F.col("count") > 1).count()
@@ -169,42 +329,6 @@ def run_quality_checks(
                 check_result["failed_count"] = duplicate_count
                 check_result["message"] = f"{duplicate_count} duplicate groups found"
                 
-            elif check_type == "range":
-                min_val = check.get("min")
-                max_val = check.get("max")
-                
-                condition = F.lit(True)
-                if min_val is not None:
-                    condition = condition & (F.col(column) >= min_val)
-                if max_val is not None:
-                    condition = condition & (F.col(column) <= max_val)
-                
-                failed_count = df.filter(~condition).count()
-                check_result["passed"] = failed_count == 0
-                check_result["failed_count"] = failed_count
-                check_result["message"] = f"{failed_count} values out of range [{min_val}, {max_val}]"
-                
-            elif check_type == "regex":
-                pattern = check.get("pattern")
-                failed_count = df.filter(~F.col(column).rlike(pattern)).count()
-                check_result["passed"] = failed_count == 0
-                check_result["failed_count"] = failed_count
-                check_result["message"] = f"{failed_count} values don't match pattern"
-                
-            elif check_type == "values":
-                allowed_values = check.get("allowed", [])
-                failed_count = df.filter(~F.col(column).isin(allowed_values)).count()
-                check_result["passed"] = failed_count == 0
-                check_result["failed_count"] = failed_count
-                check_result["message"] = f"{failed_count} values not in allowed list"
-                
-            elif check_type == "custom":
-                expression = check.get("expression")
-                failed_count = df.filter(~F.expr(expression)).count()
-                check_result["passed"] = failed_count == 0
-                check_result["failed_count"] = failed_count
-                check_result["message"] = f"{failed_count} rows failed custom check"
-                
             elif check_type == "row_count":
                 min_rows = check.get("min", 0)
                 max_rows = check.get("max", float("inf"))
@@ -260,8 +384,13 @@ def check_data_freshness(
     
     cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
     
-    latest_record = df.agg(F.max(timestamp_column)).collect()[0][0]
-    oldest_record = df.agg(F.min(timestamp_column)).collect()[0][0]
+    bounds = df.agg(
+        F.max(timestamp_column).alias("latest"),
+        F.min(timestamp_column).alias("oldest"),
+    ).first()
+    # A global aggregation always returns exactly one row
+    assert bounds is not None
+    latest_record, oldest_record = bounds["latest"], bounds["oldest"]
     
     is_fresh = latest_record and latest_record >= cutoff_time
     
@@ -2,14 +2,20 @@
 Pytest configuration and fixtures for datalib tests.
 """
 
-import os
+import contextlib
+import copy
 import pytest
+import types
 from unittest.mock import MagicMock, patch
 
 
-# Set test environment
-os.environ["ENVIRONMENT"] = "test"
-os.environ["CATALOG_NAME"] = "test_catalog"
+@pytest.fixture(scope="session", autouse=True)
+def _test_environment():
+    """Set the test environment variables for the session and restore them after."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ENVIRONMENT", "test")
+        mp.setenv("CATALOG_NAME", "test_catalog")
+        yield
 
 
 @pytest.fixture
@@ -36,65 +42,174 @@ def mock_context(mock_spark, mock_dbutils):
     """Create a mock Databricks context."""
     from datalib.core.context import DatabricksContext
     
-    with patch.object(DatabricksContext, '_create_spark_session', return_value=mock_spark):
-        with patch.object(DatabricksContext, '_get_dbutils', return_value=mock_dbutils):
-            context = DatabricksContext(environment="test")
-            context._spark = mock_spark
-            context._dbutils = mock_dbutils
-            yield context
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            patch.object(DatabricksContext, '_create_spark_session', return_value=mock_spark)
+        )
+        stack.enter_context(
+            patch.object(DatabricksContext, '_get_dbutils', return_value=mock_dbutils)
+        )
+        context = DatabricksContext(environment="test")
+        context._spark = mock_spark
+        context._dbutils = mock_dbutils
+        yield context
+
+
+# DataFrame methods that return a new DataFrame; df_mock returns itself from
+# each so transformation chains stay on one mock
+_CHAINED_DF_METHODS = (
+    "withColumn",
+    "withColumns",
+    "withColumnRenamed",
+    "withColumnsRenamed",
+    "filter",
+    "dropDuplicates",
+    "select",
+    "selectExpr",
+    "drop",
+    "fillna",
+)
 
 
 @pytest.fixture
-def sample_config_dict():
-    """Sample pipeline configuration dictionary."""
-    return {
-        "pipeline": {
-            "name": "test_pipeline",
-            "layer": "bronze",
-            "description": "Test pipeline",
-            "version": "1.0.0",
-            "owner": "test-team",
-        },
-        "source": {
-            "type": "table",
-            "catalog": "test_catalog",
-            "schema": "source_schema",
-            "table": "source_table",
+def df_mock():
+    """Create a mock DataFrame whose transformation methods return itself."""
+    mock = MagicMock()
+    for method in _CHAINED_DF_METHODS:
+        getattr(mock, method).return_value = mock
+    return mock
+
+
+class FakeDataFrame:
+    """Plain-object DataFrame double that records chained method calls."""
+    
+    __slots__ = ("columns", "calls")
+    
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.calls = []
+    
+    def __getattr__(self, name):
+        # Only chainable methods are faked; anything else is a test bug
+        if name not in _CHAINED_DF_METHODS:
+            raise AttributeError(name)
+        
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        
+        return record
+    
+    def calls_to(self, name):
+        """Return the recorded (args, kwargs) of every call to a method."""
+        return [(args, kwargs) for method, args, kwargs in self.calls if method == name]
+
+
+@pytest.fixture
+def fake_df():
+    """Factory building a FakeDataFrame with the given columns."""
+    return FakeDataFrame
+
+
+# Built once per session and read-only; fixtures hand out copies so tests
+# can mutate freely
+_SAMPLE_CONFIG = types.MappingProxyType({
+    "pipeline": {
+        "name": "test_pipeline",
+        "layer": "bronze",
+        "description": "Test pipeline",
+        "version": "1.0.0",
+        "owner": "test-team",
+    },
+    "source": {
+        "type": "table",
+        "catalog": "test_catalog",
+        "schema": "source_schema",
+        "table": "source_table",
+    },
+    "target": {
+        "catalog": "test_catalog",
+        "schema": "target_schema",
+        "table": "target_table",
+        "mode": "overwrite",
+        "format": "delta",
+    },
+    "transformations": [
+        {
+            "type": "add_timestamp",
+            "params": {"column_name": "ingestion_ts"},
         },
-        "target": {
-            "catalog": "test_catalog",
-            "schema": "target_schema",
-            "table": "target_table",
-            "mode": "overwrite",
-            "format": "delta",
+        {
+            "type": "cast_columns",
+            "params": {"column_types": {"id": "string"}},
         },
-        "transformations": [
-            {
-                "type": "add_timestamp",
-                "params": {"column_name": "ingestion_ts"},
-            },
-            {
-                "type": "cast_columns",
-                "params": {"column_types": {"id": "string"}},
-            },
+    ],
+    "quality": {
+        "enabled": True,
+        "fail_on_error": False,
+        "checks": [
+            {"type": "not_null", "column": "id"},
         ],
-        "quality": {
-            "enabled": True,
-            "fail_on_error": False,
-            "checks": [
-                {"type": "not_null", "column": "id"},
-            ],
-        },
-    }
+    },
+})
 
 
 @pytest.fixture
-def temp_config_file(tmp_path, sample_config_dict):
-    """Create a temporary YAML config file."""
+def sample_config_dict():
+    """Sample pipeline configuration dictionary."""
+    return copy.deepcopy(dict(_SAMPLE_CONFIG))
+
+
+# _SAMPLE_CONFIG as YAML text, so the session file is written without the emitter
+_SAMPLE_YAML = """\
+pipeline:
+  name: test_pipeline
+  layer: bronze
+  description: Test pipeline
+  version: 1.0.0
+  owner: test-team
+source:
+  type: table
+  catalog: test_catalog
+  schema: source_schema
+  table: source_table
+target:
+  catalog: test_catalog
+  schema: target_schema
+  table: target_table
+  mode: overwrite
+  format: delta
+transformations:
+  - type: add_timestamp
+    params: {column_name: ingestion_ts}
+  - type: cast_columns
+    params: {column_types: {id: string}}
+quality:
+  enabled: true
+  fail_on_error: false
+  checks:
+    - {type: not_null, column: id}
+"""
+
+
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
+    """Create a temporary YAML config file, written once per session."""
+    # Imported here so runs that never touch config don't load PyYAML
     import yaml
     
-    config_file = tmp_path / "test_config.yaml"
-    with open(config_file, 'w') as f:
-        yaml.dump(sample_config_dict, f)
+    # Keep the literal in sync with the dict the other fixtures hand out
+    assert yaml.safe_load(_SAMPLE_YAML) == dict(_SAMPLE_CONFIG)
+    
+    config_file = tmp_path_factory.mktemp("cfg") / "test_config.yaml"
+    config_file.write_text(_SAMPLE_YAML)
     
     return config_file
+
+
+@pytest.fixture(scope="session")
+def shared_loader(temp_config_file):
+    """ConfigLoader rooted at the shared config file's directory."""
+    from datalib.core.config import ConfigLoader
+    
+    return ConfigLoader(base_path=temp_config_file.parent)
@@ -4,8 +4,9 @@ Unit tests for the configuration module.
 
 import os
 import pytest
-import yaml
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 from datalib.core.config import (
     ConfigLoader,
@@ -16,6 +17,17 @@ from datalib.core.config import (
 )
 
 
+@pytest.fixture(scope="session")
+def substitution_configs(tmp_path_factory):
+    """Directory holding a static YAML file with a placeholder, written once."""
+    config_dir = tmp_path_factory.mktemp("substitution")
+    (config_dir / "env_var.yaml").write_text(
+        "pipeline: {name: test, layer: bronze}\n"
+        "source: {type: jdbc, connection_string: '${TEST_VAR}'}\n"
+    )
+    return config_dir
+
+
 class TestSourceConfig:
     """Tests for SourceConfig dataclass."""
     
@@ -47,6 +59,16 @@ class TestSourceConfig:
         """Test full table name when no table specified."""
         source = SourceConfig(type="parquet", path="/data/file.parquet")
         assert source.get_full_table_name() is None
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_slots_layout(self):
+        """Test that config dataclasses are slotted (no per-instance __dict__)."""
+        source = SourceConfig(type="table")
+        target = TargetConfig(catalog="main", schema="silver", table="test")
+        config = PipelineConfig(name="test", layer="bronze", source=source)
+        
+        for instance in (source, target, config):
+            assert not hasattr(instance, "__dict__")
 
 
 class TestTargetConfig:
@@ -110,10 +132,9 @@ class TestPipelineConfig:
 class TestConfigLoader:
     """Tests for ConfigLoader class."""
     
-    def test_load_yaml(self, temp_config_file):
+    def test_load_yaml(self, shared_loader, temp_config_file):
         """Test loading YAML file."""
-        loader = ConfigLoader(base_path=temp_config_file.parent)
-        config = loader.load_yaml(temp_config_file.name)
+        config = shared_loader.load_yaml(temp_config_file.name)
         
         assert config["pipeline"]["name"] == "test_pipeline"
         assert config["pipeline"]["layer"] == "bronze"
@@ -126,77 +147,46 @@ class TestConfigLoader:
             loader.load_yaml("nonexistent.yaml")
         assert "not found" in str(exc_info.value)
     
-    def test_environment_variable_substitution(self, tmp_path):
-        """Test environment variable substitution."""
-        # Set environment variable
-        os.environ["TEST_VAR"] = "test_value"
-        
-        # Create config with variable
-        config_dict = {
-            "pipeline": {
-                "name": "test",
-                "layer": "bronze",
-            },
-            "source": {
-                "type": "jdbc",
-                "connection_string": "${TEST_VAR}",
-            },
-        }
+    @pytest.mark.parametrize("env, widgets, template, expected", [
+        ({"TEST_VAR": "test_value"}, None, "${TEST_VAR}", "test_value"),
+        ({}, None, "${UNDEFINED_VAR:default_catalog}", "default_catalog"),
+        ({}, {"WIDGET_CATALOG": "widget_value"}, "${WIDGET_CATALOG}", "widget_value"),
+        ({"WIDGET_CATALOG": "env_value"}, {"WIDGET_CATALOG": "widget_value"}, "${WIDGET_CATALOG}", "widget_value"),
+    ], ids=["env_var", "default", "widget", "widget_over_env"])
+    def test_substitution(self, tmp_path, monkeypatch, env, widgets, template, expected):
+        """Test env var, default and widget substitution (widgets win over env)."""
+        monkeypatch.delenv("UNDEFINED_VAR", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        data = {"source": {"value": template}}
         
-        config_file = tmp_path / "test.yaml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_dict, f)
-        
-        loader = ConfigLoader(base_path=tmp_path)
-        config = loader.load_yaml("test.yaml")
-        
-        assert config["source"]["connection_string"] == "test_value"
-        
-        # Cleanup
-        del os.environ["TEST_VAR"]
-    
-    def test_default_value_substitution(self, tmp_path):
-        """Test default value when env var not set."""
-        config_dict = {
-            "pipeline": {
-                "name": "test",
-                "layer": "bronze",
-            },
-            "source": {
-                "type": "table",
-                "catalog": "${UNDEFINED_VAR:default_catalog}",
-            },
-        }
+        loader = ConfigLoader(base_path=tmp_path, widget_params=widgets)
+        config = loader.load_dict(data)
         
-        config_file = tmp_path / "test.yaml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_dict, f)
-        
-        loader = ConfigLoader(base_path=tmp_path)
-        config = loader.load_yaml("test.yaml")
-        
-        assert config["source"]["catalog"] == "default_catalog"
+        assert config["source"]["value"] == expected
+        assert data["source"]["value"] == template
     
-    def test_missing_env_var_no_default(self, tmp_path):
+    def test_missing_env_var_no_default(self, tmp_path, monkeypatch):
         """Test error when env var missing and no default."""
-        config_dict = {
-            "value": "${UNDEFINED_VAR_NO_DEFAULT}",
-        }
-        
-        config_file = tmp_path / "test.yaml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_dict, f)
-        
+        monkeypatch.delenv("UNDEFINED_VAR_NO_DEFAULT", raising=False)
         loader = ConfigLoader(base_path=tmp_path)
         
         with pytest.raises(ConfigurationError) as exc_info:
-            loader.load_yaml("test.yaml")
+            loader.load_dict({"value": "${UNDEFINED_VAR_NO_DEFAULT}"})
         assert "not found" in str(exc_info.value)
     
-    def test_load_pipeline_config(self, temp_config_file):
+    def test_load_yaml_substitutes_variables(self, substitution_configs, monkeypatch):
+        """Test that substitution also applies to configs loaded from YAML."""
+        monkeypatch.setenv("TEST_VAR", "test_value")
+        
+        loader = ConfigLoader(base_path=substitution_configs)
+        config = loader.load_yaml("env_var.yaml")
+        
+        assert config["source"]["connection_string"] == "test_value"
+    
+    def test_load_pipeline_config(self, shared_loader, temp_config_file):
         """Test loading full pipeline config."""
-        loader = ConfigLoader(base_path=temp_config_file.parent)
-        config = loader.load_pipeline_config(temp_config_file.name)
+        config = shared_loader.load_pipeline_config(temp_config_file.name)
         
         assert isinstance(config, PipelineConfig)
         assert config.name == "test_pipeline"
@@ -205,31 +195,6 @@ class TestConfigLoader:
         assert config.target is not None
         assert len(config.transformations) == 2
     
-    def test_widget_params_substitution(self, tmp_path):
-        """Test widget parameter substitution."""
-        config_dict = {
-            "pipeline": {
-                "name": "test",
-                "layer": "bronze",
-            },
-            "source": {
-                "type": "table",
-                "catalog": "${WIDGET_CATALOG}",
-            },
-        }
-        
-        config_file = tmp_path / "test.yaml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_dict, f)
-        
-        loader = ConfigLoader(
-            base_path=tmp_path,
-            widget_params={"WIDGET_CATALOG": "widget_value"}
-        )
-        config = loader.load_yaml("test.yaml")
-        
-        assert config["source"]["catalog"] == "widget_value"
-    
     def test_list_configs(self, tmp_path):
         """Test listing configuration files."""
         # Create directory structure
@@ -246,3 +211,195 @@ class TestConfigLoader:
         assert len(configs) == 2
         assert all(c.suffix == ".yaml" for c in configs)
         assert not any("dev" in c.stem for c in configs)
+    
+    def test_load_yaml_cache_reflects_file_changes(self, tmp_path):
+        """Test that cached parses are invalidated when the file changes."""
+        ConfigLoader.invalidate_cache()
+        config_file = tmp_path / "cached.yaml"
+        config_file.write_text("value: 1\n")
+        
+        loader = ConfigLoader(base_path=tmp_path)
+        first = loader.load_yaml("cached.yaml")
+        first["value"] = 99  # Mutating a result must not leak into the cache
+        assert loader.load_yaml("cached.yaml") == {"value": 1}
+        
+        config_file.write_text("value: 22\n")
+        assert loader.load_yaml("cached.yaml") == {"value": 22}
+    
+    def test_parse_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test that edits replace a file's cache entry and old files are evicted."""
+        from datalib.core import config as config_module
+        
+        ConfigLoader.invalidate_cache()
+        monkeypatch.setattr(config_module._PARSE_CACHE, "maxsize", 2)
+        loader = ConfigLoader(base_path=tmp_path)
+        
+        edited = tmp_path / "edited.yaml"
+        for value in range(3):
+            edited.write_text(f"value: {value}{'0' * value}\n")
+            loader.load_yaml("edited.yaml")
+        assert len(config_module._PARSE_CACHE) == 1
+        
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.yaml").write_text("value: 1\n")
+            loader.load_yaml(f"{name}.yaml")
+        assert len(config_module._PARSE_CACHE) == 2
+    
+    def test_loader_instances_share_parse_cache(self, temp_config_file):
+        """Test that a fresh loader reuses the parse made by another instance."""
+        ConfigLoader.invalidate_cache()
+        ConfigLoader(base_path=temp_config_file.parent).load_yaml(temp_config_file.name)
+        
+        with patch.object(ConfigLoader, "_parse_yaml") as parse:
+            config = ConfigLoader(base_path=temp_config_file.parent).load_yaml(temp_config_file.name)
+        
+        parse.assert_not_called()
+        assert config["pipeline"]["name"] == "test_pipeline"
+    
+    def test_sidecar_cache(self, tmp_path):
+        """Test that a JSON sidecar is written and reused for unchanged YAML."""
+        ConfigLoader.invalidate_cache()
+        (tmp_path / "sidecar.yaml").write_text("pipeline:\n  name: test\n")
+        
+        loader = ConfigLoader(base_path=tmp_path, sidecar_cache=True)
+        assert loader.load_yaml("sidecar.yaml") == {"pipeline": {"name": "test"}}
+        
+        sidecars = list(tmp_path.glob("sidecar.*.cache.json"))
+        assert len(sidecars) == 1
+        
+        ConfigLoader.invalidate_cache()
+        assert loader.load_yaml("sidecar.yaml") == {"pipeline": {"name": "test"}}
+    
+    def test_nested_list_substitution(self, tmp_path, monkeypatch):
+        """Test substitution inside nested lists while other leaves are untouched."""
+        monkeypatch.setenv("NESTED_VAR", "nested")
+        (tmp_path / "nested.yaml").write_text(
+            "items:\n"
+            "  - name: ${NESTED_VAR}\n"
+            "    size: 3\n"
+            "  - [plain, '${NESTED_VAR}-suffix']\n"
+        )
+        
+        loader = ConfigLoader(base_path=tmp_path)
+        config = loader.load_yaml("nested.yaml")
+        
+        assert config["items"][0] == {"name": "nested", "size": 3}
+        assert config["items"][1] == ["plain", "nested-suffix"]
+    
+    def test_merge_configs_deep(self, tmp_path):
+        """Test nested override merging keeps untouched keys."""
+        loader = ConfigLoader(base_path=tmp_path)
+        base = {"target": {"table": "t", "options": {"a": 1, "b": 2}}, "name": "x"}
+        override = {"target": {"options": {"b": 3}}, "extra": True}
+        
+        merged = loader._merge_configs(base, override)
+        
+        assert merged == {
+            "target": {"table": "t", "options": {"a": 1, "b": 3}},
+            "name": "x",
+            "extra": True,
+        }
+    
+    def test_list_configs_sees_new_files(self, tmp_path):
+        """Test that listings pick up files added in subdirectories."""
+        silver_dir = tmp_path / "silver"
+        silver_dir.mkdir()
+        (silver_dir / "first.yaml").write_text("test: 1")
+        
+        loader = ConfigLoader(base_path=tmp_path)
+        assert len(loader.list_configs()) == 1
+        
+        (silver_dir / "second.yaml").write_text("test: 2")
+        assert len(loader.list_configs()) == 2
+    
+    def test_list_configs_repeat_calls_independent(self, tmp_path):
+        """Test that repeat listings agree, reflect removals and don't share lists."""
+        (tmp_path / "bronze").mkdir()
+        (tmp_path / "bronze" / "orders.yaml").write_text("test: 1")
+        (tmp_path / "bronze" / "users.yaml").write_text("test: 1")
+        loader = ConfigLoader(base_path=tmp_path)
+        
+        first = loader.list_configs(layer="bronze")
+        first.clear()
+        names = [c.name for c in loader.list_configs(layer="bronze")]
+        assert names == ["orders.yaml", "users.yaml"]
+        
+        (tmp_path / "bronze" / "users.yaml").unlink()
+        assert [c.name for c in loader.list_configs(layer="bronze")] == ["orders.yaml"]
+    
+    def test_load_many_preserves_order(self, tmp_path):
+        """Test loading several configs concurrently."""
+        for name in ("first", "second", "third"):
+            (tmp_path / f"{name}.yaml").write_text(
+                f"pipeline:\n  name: {name}\n  layer: silver\n"
+            )
+        
+        loader = ConfigLoader(base_path=tmp_path)
+        configs = loader.load_many(["first.yaml", "second.yaml", "third.yaml"])
+        
+        assert [c.name for c in configs] == ["first", "second", "third"]
+        assert loader.load_many([]) == []
+    
+    def test_unknown_keys_are_ignored(self, tmp_path):
+        """Test that extra metadata keys don't break dataclass construction."""
+        (tmp_path / "extra.yaml").write_text(
+            "pipeline:\n  name: extra\n  layer: bronze\n"
+            "source:\n  type: table\n  table: src\n  comment: metadata only\n"
+        )
+        
+        loader = ConfigLoader(base_path=tmp_path)
+        config = loader.load_pipeline_config("extra.yaml")
+        
+        assert config.source.table == "src"
+    
+    def test_load_pipeline_config_cache_returns_copies(self, temp_config_file):
+        """Test that cached configs are independent copies and track env overrides."""
+        ConfigLoader.invalidate_cache()
+        loader = ConfigLoader(base_path=temp_config_file.parent, environment="qa")
+        
+        first = loader.load_pipeline_config(temp_config_file.name)
+        first.target.mode = "append"
+        second = loader.load_pipeline_config(temp_config_file.name)
+        assert second.target.mode == "overwrite"
+        
+        env_file = temp_config_file.parent / f"{temp_config_file.stem}.qa.yaml"
+        env_file.write_text("target:\n  mode: merge\n")
+        assert loader.load_pipeline_config(temp_config_file.name).target.mode == "merge"
+        
+        # Cleanup: the config file is shared across the session
+        env_file.unlink()
+    
+    def test_load_pipeline_config_sees_same_size_rewrite(self, tmp_path):
+        """Test that a rewrite keeping size and mtime isn't served from the parse cache."""
+        ConfigLoader.invalidate_cache()
+        config_file = tmp_path / "same.yaml"
+        config_file.write_text("pipeline:\n  name: aaa\n  layer: bronze\n")
+        stat = config_file.stat()
+        loader = ConfigLoader(base_path=tmp_path)
+        assert loader.load_pipeline_config("same.yaml").name == "aaa"
+        
+        config_file.write_text("pipeline:\n  name: bbb\n  layer: bronze\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        assert loader.load_pipeline_config("same.yaml").name == "bbb"
+    
+    def test_invalid_structure_raises_configuration_error(self, tmp_path):
+        """Test that structural problems surface as ConfigurationError."""
+        (tmp_path / "no_table.yaml").write_text(
+            "pipeline:\n  name: bad\n  layer: bronze\n"
+            "target:\n  catalog: main\n  schema: bronze\n"
+        )
+        (tmp_path / "bad_list.yaml").write_text(
+            "pipeline:\n  name: bad\n  layer: bronze\n"
+            "transformations:\n  type: add_timestamp\n"
+        )
+        
+        loader = ConfigLoader(base_path=tmp_path)
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            loader.load_pipeline_config("no_table.yaml")
+        assert "table" in str(exc_info.value)
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            loader.load_pipeline_config("bad_list.yaml")
+        assert "must be a list" in str(exc_info.value)
@@ -0,0 +1,159 @@
+"""
+Unit tests for the context module.
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+def _rows(**columns):
+    """Build single-column result rows (rows index like tuples)."""
+    (_, values), = columns.items()
+    return [(value,) for value in values]
+
+
+class TestMetadataCache:
+    """Tests for cached catalog/schema/table existence checks."""
+    
+    def test_table_listing_cached_per_schema(self, mock_context, mock_spark):
+        """Test that SHOW TABLES runs once per schema."""
+        mock_spark.sql.return_value.select.return_value.collect.return_value = _rows(tableName=["a", "b"])
+        
+        assert mock_context.table_exists("cat", "sch", "a")
+        assert mock_context.table_exists("cat", "sch", "b")
+        assert not mock_context.table_exists("cat", "sch", "c")
+        
+        mock_spark.sql.assert_called_once_with("SHOW TABLES IN cat.sch")
+    
+    def test_tables_exist_batch(self, mock_context, mock_spark):
+        """Test batch existence checks share one case-insensitive listing."""
+        mock_spark.sql.return_value.select.return_value.collect.return_value = _rows(tableName=["orders", "customers"])
+        
+        result = mock_context.tables_exist("cat", "sch", ["Orders", "returns"])
+        
+        assert result == {"Orders": True, "returns": False}
+        assert mock_context.tables_in("cat", "sch") == frozenset({"orders", "customers"})
+        mock_spark.sql.assert_called_once()
+    
+    def test_invalidate_refreshes_listing(self, mock_context, mock_spark):
+        """Test that invalidate forces a new lookup."""
+        mock_spark.sql.return_value.select.return_value.collect.return_value = _rows(tableName=["a"])
+        assert not mock_context.table_exists("cat", "sch", "new")
+        
+        mock_spark.sql.return_value.select.return_value.collect.return_value = _rows(tableName=["a", "new"])
+        mock_context.invalidate("cat", "sch")
+        
+        assert mock_context.table_exists("cat", "sch", "new")
+        assert mock_spark.sql.call_count == 2
+    
+    def test_create_schema_updates_cache(self, mock_context, mock_spark):
+        """Test that a created schema is visible without another lookup."""
+        mock_spark.catalog.databaseExists.return_value = False
+        assert not mock_context.schema_exists("cat", "silver")
+        
+        mock_context.create_schema_if_not_exists("cat", "silver")
+        mock_context.create_schema_if_not_exists("cat", "silver")
+        
+        assert mock_context.schema_exists("cat", "silver")
+        mock_spark.catalog.databaseExists.assert_called_once_with("cat.silver")
+        mock_spark.sql.assert_called_once_with("CREATE SCHEMA IF NOT EXISTS cat.silver")
+    
+    def test_create_schema_reruns_after_ttl(self, mock_context, mock_spark):
+        """Test that a schema dropped externally is recreated once the TTL expires."""
+        with patch("datalib.core.context.time.monotonic", return_value=1000.0):
+            mock_context.create_schema_if_not_exists("cat", "silver")
+            mock_context.create_schema_if_not_exists("cat", "silver")
+        assert mock_spark.sql.call_count == 1
+        
+        expired = 1000.0 + mock_context.metadata_ttl
+        with patch("datalib.core.context.time.monotonic", return_value=expired):
+            mock_context.create_schema_if_not_exists("cat", "silver")
+        assert mock_spark.sql.call_count == 2
+    
+    def test_catalog_listing_uses_catalog_api(self, mock_context, mock_spark):
+        """Test that catalogs are listed through spark.catalog."""
+        main = MagicMock()
+        main.name = "main"
+        mock_spark.catalog.listCatalogs.return_value = [main]
+        
+        assert mock_context.catalog_exists("main")
+        assert not mock_context.catalog_exists("other")
+        
+        mock_spark.catalog.listCatalogs.assert_called_once()
+        mock_spark.sql.assert_not_called()
+
+
+class TestNotebookContext:
+    """Tests for memoized notebook context lookups."""
+    
+    def test_notebook_context_fetched_once(self, mock_context, mock_dbutils):
+        """Test that the dbutils context chain is traversed once."""
+        get_context = mock_dbutils.notebook.entry_point.getDbutils.return_value.notebook.return_value.getContext
+        get_context.return_value.notebookPath.return_value.get.return_value = "/Repos/nb"
+        
+        assert mock_context.get_notebook_path() == "/Repos/nb"
+        mock_context.get_workspace_url()
+        mock_context.get_notebook_path()
+        
+        get_context.assert_called_once()
+    
+    def test_cluster_id_from_environment(self, mock_context, mock_spark, monkeypatch):
+        """Test that DB_CLUSTER_ID avoids the Spark conf lookup."""
+        monkeypatch.setenv("DB_CLUSTER_ID", "env-cluster")
+        
+        assert mock_context.get_cluster_id() == "env-cluster"
+        mock_spark.conf.get.assert_not_called()
+    
+    def test_cluster_id_cached(self, mock_context, mock_spark, monkeypatch):
+        """Test that the cluster ID conf lookup happens once."""
+        monkeypatch.delenv("DB_CLUSTER_ID", raising=False)
+        monkeypatch.delenv("DATABRICKS_CLUSTER_ID", raising=False)
+        mock_spark.conf.get.return_value = "0101-abc"
+        
+        assert mock_context.get_cluster_id() == "0101-abc"
+        assert mock_context.get_cluster_id() == "0101-abc"
+        
+        mock_spark.conf.get.assert_called_once()
+
+
+class TestWidgets:
+    """Tests for widget access."""
+    
+    def test_widgets_read_from_bindings_once(self, mock_context, mock_dbutils):
+        """Test that widget values come from a single bindings lookup."""
+        bindings = mock_dbutils.notebook.entry_point.getCurrentBindings
+        bindings.return_value = {"config_path": "bronze/a.yaml", "environment": "qa"}
+        
+        assert mock_context.get_widget("config_path") == "bronze/a.yaml"
+        assert mock_context.get_widget("environment") == "qa"
+        assert mock_context.get_all_widgets() == {
+            "config_path": "bronze/a.yaml",
+            "environment": "qa",
+        }
+        
+        bindings.assert_called_once()
+        mock_dbutils.widgets.get.assert_not_called()
+    
+    def test_missing_binding_falls_back_to_widget_get(self, mock_context, mock_dbutils):
+        """Test fallback to dbutils.widgets.get for unknown names."""
+        mock_dbutils.notebook.entry_point.getCurrentBindings.return_value = {}
+        
+        assert mock_context.get_widget("other") == "test_value"
+        mock_dbutils.widgets.get.assert_called_once_with("other")
+
+
+class TestSparkSession:
+    """Tests for Spark session creation."""
+    
+    def test_stopped_session_not_reused(self):
+        """Test that a context created after spark.stop() builds a fresh session."""
+        from datalib.core.context import SparkContext
+        
+        with patch("pyspark.sql.SparkSession", create=True) as session_cls:
+            session_cls.getActiveSession.return_value = None
+            builder = session_cls.builder.appName.return_value
+            builder.getOrCreate.side_effect = ["first", "second"]
+            
+            assert SparkContext().spark == "first"
+            assert SparkContext().spark == "second"
+        
+        assert builder.getOrCreate.call_count == 2
@@ -0,0 +1,382 @@
+"""
+Unit tests for the pipeline module.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from datalib.core.config import PipelineConfig
+from datalib.core.pipeline import Pipeline
+
+
+class TestTransformationRegistry:
+    """Tests for the lazy transformation registry."""
+    
+    def test_default_transformations_resolved_on_lookup(self, mock_context):
+        """Test that built-ins are stored unresolved until first lookup."""
+        pytest.importorskip("pyspark")
+        pipeline = Pipeline(PipelineConfig(name="p", layer="bronze"), mock_context)
+        
+        assert isinstance(pipeline._transformations["add_timestamp"], tuple)
+        
+        resolved = pipeline._get_transformation("add_timestamp")
+        
+        assert resolved.__name__ == "AddTimestampColumn"
+        assert pipeline._transformations["add_timestamp"] is resolved
+    
+    def test_registered_transformation_returned_as_is(self, mock_context):
+        """Test that custom registrations bypass resolution."""
+        pipeline = Pipeline(PipelineConfig(name="p", layer="bronze"), mock_context)
+        custom = MagicMock()
+        
+        pipeline.register_transformation("custom", custom)
+        
+        assert pipeline._get_transformation("custom") is custom
+        assert pipeline._get_transformation("missing") is None
+
+
+class TestPipelineRunner:
+    """Tests for PipelineRunner."""
+    
+    def test_run_layer_parallel_preserves_order(self, mock_context, tmp_path):
+        """Test that parallel layer runs return metrics in config order."""
+        from datalib.core.pipeline import PipelineExecutionError, PipelineMetrics, PipelineRunner
+        
+        (tmp_path / "bronze").mkdir()
+        for name in ("a", "b", "c"):
+            (tmp_path / "bronze" / f"{name}.yaml").write_text(f"pipeline:\n  name: {name}\n")
+        
+        runner = PipelineRunner(str(tmp_path), context=mock_context)
+        
+        def fake_run(config_path, widget_params=None):
+            name = config_path.split("/")[-1].split(".")[0]
+            if name == "b":
+                raise PipelineExecutionError("boom", PipelineMetrics(pipeline_name=name))
+            return PipelineMetrics(pipeline_name=name)
+        
+        runner.run_pipeline = fake_run
+        
+        results = runner.run_layer("bronze", parallel=True)
+        
+        assert [m.pipeline_name for m in results] == ["a", "b", "c"]
+
+
+class _AddColumn:
+    """Fusable test transformation adding a constant column."""
+    
+    def __init__(self, name, reads=()):
+        self.name = name
+        self.reads = set(reads)
+    
+    def column_expressions(self, columns):
+        return {self.name: f"expr_{self.name}"}
+    
+    def input_columns(self):
+        return self.reads
+    
+    def transform(self, df):
+        return df.withColumn(self.name, f"expr_{self.name}")
+
+
+class _Filter:
+    """Non-fusable test transformation."""
+    
+    def __init__(self):
+        pass
+    
+    def transform(self, df):
+        return df.filter("x")
+
+
+class TestTransformationFusion:
+    """Tests for fusing column transformations in _apply_transformations."""
+    
+    def _pipeline(self, mock_context, steps):
+        from datalib.core.config import TransformationConfig
+        
+        config = PipelineConfig(
+            name="p",
+            layer="bronze",
+            transformations=[
+                TransformationConfig(type=t, params=p) for t, p in steps
+            ],
+        )
+        pipeline = Pipeline(config, mock_context)
+        pipeline.register_transformation("add", _AddColumn)
+        pipeline.register_transformation("filter", _Filter)
+        return pipeline
+    
+    def test_independent_columns_fused(self, mock_context):
+        """Test that independent column steps become one withColumns call."""
+        pipeline = self._pipeline(mock_context, [
+            ("add", {"name": "a"}),
+            ("add", {"name": "b"}),
+        ])
+        df = MagicMock()
+        df.columns = ["id"]
+        
+        pipeline._apply_transformations(df)
+        
+        df.withColumns.assert_called_once_with({"a": "expr_a", "b": "expr_b"})
+        assert pipeline._metrics.transformations_applied == 2
+    
+    def test_dependent_and_unfusable_steps_flush(self, mock_context):
+        """Test that reading a pending column or a filter flushes the group."""
+        pipeline = self._pipeline(mock_context, [
+            ("add", {"name": "a"}),
+            ("add", {"name": "b", "reads": ["a"]}),
+            ("filter", {}),
+        ])
+        df = MagicMock()
+        df.columns = ["id"]
+        df.withColumns.return_value = df
+        df.filter.return_value = df
+        
+        pipeline._apply_transformations(df)
+        
+        assert df.withColumns.call_args_list[0][0][0] == {"a": "expr_a"}
+        assert df.withColumns.call_args_list[1][0][0] == {"b": "expr_b"}
+        df.filter.assert_called_once_with("x")
+
+
+class TestDryRun:
+    """Tests for Pipeline.dry_run."""
+    
+    def test_dry_run_skips_transformations_by_default(self, mock_context, sample_config_dict):
+        """Test that transformations are listed but not applied unless verifying."""
+        from datalib.core.config import ConfigLoader
+        
+        config = ConfigLoader()._dict_to_pipeline_config(sample_config_dict)
+        pipeline = Pipeline(config, mock_context)
+        df = MagicMock()
+        pipeline._read_source = MagicMock(return_value=df)
+        pipeline._apply_transformations = MagicMock(return_value=df)
+        
+        result = pipeline.dry_run()
+        
+        assert [t["type"] for t in result["transformations"]] == ["add_timestamp", "cast_columns"]
+        pipeline._apply_transformations.assert_not_called()
+        df.limit.assert_called_once_with(3)
+        
+        pipeline.dry_run(verify_params=True)
+        pipeline._apply_transformations.assert_called_once_with(df)
+    
+    def test_run_pipeline_reuses_loaded_config(self, mock_context, tmp_path, monkeypatch):
+        """Test that repeated runs hit the process-wide config cache."""
+        from datalib.core.config import ConfigLoader
+        from datalib.core.pipeline import PipelineMetrics, PipelineRunner
+        
+        ConfigLoader.invalidate_cache()
+        (tmp_path / "p.yaml").write_text(
+            "pipeline:\n  name: p\n  layer: bronze\n  description: run ${RUN}\n"
+        )
+        built = MagicMock(side_effect=ConfigLoader._dict_to_pipeline_config)
+        monkeypatch.setattr(
+            ConfigLoader, "_dict_to_pipeline_config",
+            lambda self, config: built(self, config)
+        )
+        monkeypatch.setattr(Pipeline, "run", lambda self: PipelineMetrics(self.config.name))
+        
+        runner = PipelineRunner(str(tmp_path), context=mock_context)
+        runner.run_pipeline("p.yaml", {"RUN": "1"})
+        runner.run_pipeline("p.yaml", {"RUN": "1"})
+        runner.run_pipeline("p.yaml", {"RUN": "2"})
+        runner.run_pipeline("p.yaml", {"RUN": "2", "UNUSED": "x"})
+        monkeypatch.setenv("DATALIB_UNRELATED", "changed")
+        runner.run_pipeline("p.yaml", {"RUN": "2"})
+        
+        assert built.call_count == 2
+
+
+class TestReadCount:
+    """Tests for counting source records."""
+    
+    def test_no_target_counts_without_observation(self, mock_context):
+        """Test that pipelines without a target skip the observation and count directly."""
+        from datalib.core.config import SourceConfig
+        
+        config = PipelineConfig(name="p", layer="bronze", source=SourceConfig(type="table", table="t"))
+        pipeline = Pipeline(config, mock_context)
+        df = MagicMock()
+        df.count.return_value = 5
+        pipeline._read_source = MagicMock(return_value=df)
+        
+        metrics = pipeline.run()
+        
+        assert metrics.records_read == 5
+        df.observe.assert_not_called()
+    
+    def _targeted(self, mock_context, target):
+        from datalib.core.config import SourceConfig
+        
+        config = PipelineConfig(
+            name="p", layer="bronze", source=SourceConfig(type="table", table="t"), target=target
+        )
+        pipeline = Pipeline(config, mock_context)
+        df = MagicMock()
+        df.count.return_value = 5
+        pipeline._read_source = MagicMock(return_value=df)
+        pipeline._apply_transformations = lambda df: df
+        pipeline._run_quality_checks = lambda df: df
+        pipeline._write_target = MagicMock(return_value=4)
+        return pipeline, df
+    
+    @pytest.mark.parametrize("target_format, mode", [
+        ("delta", "overwrite"),
+        ("parquet", "merge"),
+        ("parquet", "scd2"),
+    ])
+    def test_delta_target_counts_without_observation(self, mock_context, target_format, mode):
+        """Test that Delta writes and MERGEs never wait on an observation."""
+        from datalib.core.config import TargetConfig
+        
+        target = TargetConfig(
+            catalog="c", schema="s", table="t", format=target_format, mode=mode, merge_keys=["id"]
+        )
+        pipeline, df = self._targeted(mock_context, target)
+        
+        metrics = pipeline.run()
+        
+        assert metrics.records_read == 5
+        assert metrics.records_written == 4
+        df.observe.assert_not_called()
+    
+    def test_file_target_reads_count_from_observation(self, mock_context):
+        """Test that a plain file write fills the read-count observation."""
+        from datalib.core.config import TargetConfig
+        
+        target = TargetConfig(catalog="c", schema="s", table="t", format="parquet", mode="append")
+        pipeline, df = self._targeted(mock_context, target)
+        observation = MagicMock()
+        observation.get = {"cnt": 7}
+        
+        with patch("pyspark.sql.Observation", return_value=observation, create=True):
+            metrics = pipeline.run()
+        
+        assert metrics.records_read == 7
+        df.count.assert_not_called()
+        pipeline._write_target.assert_called_once_with(df.observe.return_value, target)
+
+
+class TestJoinSources:
+    """Tests for multi-source joins."""
+    
+    def _pipeline(self, mock_context, join):
+        return Pipeline(
+            PipelineConfig(name="p", layer="silver", parameters={"join": join}),
+            mock_context
+        )
+    
+    def test_left_deep_join(self, mock_context):
+        """Test the default left-deep join chain."""
+        pipeline = self._pipeline(mock_context, {"keys": ["id"], "type": "left"})
+        a, b, c = MagicMock(), MagicMock(), MagicMock()
+        
+        result = pipeline._join_sources([a, b, c])
+        
+        a.join.assert_called_once_with(b, on=["id"], how="left")
+        a.join.return_value.join.assert_called_once_with(c, on=["id"], how="left")
+        assert result is a.join.return_value.join.return_value
+    
+    def test_balanced_inner_join(self, mock_context):
+        """Test that balanced strategy pairs sources into a bushy tree."""
+        pipeline = self._pipeline(mock_context, {"keys": ["id"], "strategy": "balanced"})
+        a, b, c, d = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+        
+        pipeline._join_sources([a, b, c, d])
+        
+        a.join.assert_called_once_with(b, on=["id"], how="inner")
+        c.join.assert_called_once_with(d, on=["id"], how="inner")
+        a.join.return_value.join.assert_called_once_with(
+            c.join.return_value, on=["id"], how="inner"
+        )
+    
+    def test_missing_keys_raise(self, mock_context):
+        """Test that joins without keys are rejected."""
+        from datalib.core.pipeline import PipelineExecutionError
+        
+        pipeline = self._pipeline(mock_context, {})
+        
+        with pytest.raises(PipelineExecutionError):
+            pipeline._join_sources([MagicMock(), MagicMock()])
+
+
+class TestPipelineMetrics:
+    """Tests for PipelineMetrics."""
+    
+    def test_complete_sets_duration(self):
+        """Test that completing metrics records status and duration."""
+        from datalib.core.pipeline import PipelineMetrics
+        
+        metrics = PipelineMetrics(pipeline_name="p")
+        metrics.complete("failed", "boom")
+        
+        assert metrics.status == "failed"
+        assert metrics.error_message == "boom"
+        assert metrics.duration_seconds >= 0
+        assert metrics.to_dict()["end_time"] is not None
+
+
+class TestRunLayerFailFast:
+    """Tests for run_layer fail_fast and disabled configs."""
+    
+    def _runner(self, mock_context, tmp_path, failing, disabled=()):
+        from datalib.core.pipeline import PipelineExecutionError, PipelineMetrics, PipelineRunner
+        
+        (tmp_path / "bronze").mkdir()
+        for name in ("a", "b", "c"):
+            enabled = "false" if name in disabled else "true"
+            (tmp_path / "bronze" / f"{name}.yaml").write_text(
+                f"pipeline:\n  name: {name}\n  enabled: {enabled}\n"
+            )
+        
+        runner = PipelineRunner(str(tmp_path), context=mock_context)
+        ran = []
+        
+        def fake_run(config_path, widget_params=None):
+            name = config_path.split("/")[-1].split(".")[0]
+            ran.append(name)
+            if name in failing:
+                raise PipelineExecutionError("boom", PipelineMetrics(pipeline_name=name))
+            return PipelineMetrics(pipeline_name=name)
+        
+        runner.run_pipeline = fake_run
+        return runner, ran
+    
+    def test_fail_fast_stops_serial_run(self, mock_context, tmp_path):
+        """Test that the first failure is raised and later configs don't run."""
+        from datalib.core.pipeline import PipelineExecutionError
+        
+        runner, ran = self._runner(mock_context, tmp_path, failing={"a"})
+        
+        with pytest.raises(PipelineExecutionError):
+            runner.run_layer("bronze", fail_fast=True)
+        assert ran == ["a"]
+    
+    def test_fail_fast_parallel_raises(self, mock_context, tmp_path):
+        """Test that parallel fail_fast surfaces the failure."""
+        from datalib.core.pipeline import PipelineExecutionError
+        
+        runner, _ = self._runner(mock_context, tmp_path, failing={"b"})
+        
+        with pytest.raises(PipelineExecutionError):
+            runner.run_layer("bronze", parallel=True, fail_fast=True)
+    
+    def test_disabled_configs_skipped(self, mock_context, tmp_path):
+        """Test that pipeline.enabled: false configs are not run."""
+        runner, ran = self._runner(mock_context, tmp_path, failing=(), disabled={"b"})
+        
+        results = runner.run_layer("bronze")
+        
+        assert [m.pipeline_name for m in results] == ["a", "c"]
+        assert ran == ["a", "c"]
+    
+    def test_malformed_config_left_to_full_load(self, mock_context, tmp_path):
+        """Test that a malformed config doesn't abort the enabled filter."""
+        runner, ran = self._runner(mock_context, tmp_path, failing=())
+        (tmp_path / "bronze" / "b.yaml").write_text("pipeline: [unclosed\n")
+        
+        results = runner.run_layer("bronze")
+        
+        assert ran == ["a", "b", "c"]
+        assert len(results) == 3
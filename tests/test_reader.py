@@ -0,0 +1,204 @@
+"""
+Unit tests for the data reader.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from datalib.core.config import SourceConfig
+from datalib.io.reader import DataReader, DataReaderError
+
+
+class TestPushdownOptions:
+    """Tests for the pushdown_filter and columns source options."""
+    
+    def test_parquet_pushdown_applied_on_scan(self, mock_context, mock_spark):
+        """Test that pushdown options filter and prune instead of reaching Spark."""
+        reader = DataReader(mock_context)
+        source = SourceConfig(
+            type="parquet",
+            path="/mnt/data",
+            options={"mergeSchema": "true", "pushdown_filter": "amount > 0", "columns": ["id"]},
+        )
+        
+        result = reader.read(source)
+        
+        format_reader = mock_spark.read.format.return_value
+        format_reader.options.assert_called_once_with(mergeSchema="true")
+        loaded = format_reader.options.return_value.load.return_value
+        loaded.filter.assert_called_once_with("amount > 0")
+        loaded.filter.return_value.select.assert_called_once_with("id")
+        assert result is loaded.filter.return_value.select.return_value
+    
+    def test_session_confs_untouched(self, mock_context, mock_spark):
+        """Test that constructing a reader leaves session settings alone."""
+        DataReader(mock_context)
+        
+        mock_spark.conf.set.assert_not_called()
+
+
+class TestFileSchemas:
+    """Tests for explicit schemas on CSV/JSON sources."""
+    
+    def test_csv_schema_disables_inference(self, mock_context, mock_spark):
+        """Test that read_schema is applied and inferSchema turned off."""
+        format_reader = mock_spark.read.format.return_value
+        reader = DataReader(mock_context)
+        source = SourceConfig(type="csv", path="/mnt/in", read_schema="id INT, name STRING")
+        
+        reader.read(source)
+        
+        format_reader.schema.assert_called_once_with("id INT, name STRING")
+        format_reader.schema.return_value.options.assert_called_once_with(
+            header="true", inferSchema="false", mode="PERMISSIVE"
+        )
+
+
+class TestPartitionTuning:
+    """Tests for the tune_partitioning source option."""
+    
+    def test_split_sizes_from_median_file_size(self, mock_context, mock_spark, mock_dbutils):
+        """Test that small files raise the open cost but keep a 128MB floor."""
+        mock_dbutils.fs.ls.return_value = [
+            MagicMock(size=2 * 1024 * 1024),
+            MagicMock(size=3 * 1024 * 1024),
+            MagicMock(size=5 * 1024 * 1024),
+        ]
+        reader = DataReader(mock_context)
+        source = SourceConfig(type="parquet", path="/mnt/small", options={"tune_partitioning": True})
+        
+        reader.read(source)
+        reader.read(source)
+        
+        mock_dbutils.fs.ls.assert_called_once_with("/mnt/small")
+        mock_spark.conf.set.assert_any_call("spark.sql.files.maxPartitionBytes", str(128 * 1024 * 1024))
+        mock_spark.conf.set.assert_any_call("spark.sql.files.openCostInBytes", str(3 * 1024 * 1024))
+        mock_spark.read.format.return_value.options.assert_not_called()
+
+
+class TestJdbcPartitioning:
+    """Tests for parallel JDBC reads."""
+    
+    @pytest.mark.parametrize("table, query, dbtable", [
+        ("orders", None, "orders"),
+        (None, "SELECT * FROM orders", "(SELECT * FROM orders) jdbc_src"),
+    ])
+    def test_bounds_probed_for_partition_column(
+        self, mock_context, mock_spark, table, query, dbtable
+    ):
+        """Test that missing bounds are probed and a query is wrapped as a table once."""
+        format_reader = mock_spark.read.format.return_value
+        format_reader.options.return_value.load.return_value.collect.return_value = [(1, 500)]
+        reader = DataReader(mock_context)
+        source = SourceConfig(
+            type="jdbc",
+            connection_string="jdbc:postgresql://db/app",
+            table=table,
+            query=query,
+            partition_column="order_id",
+            options={"numPartitions": 4},
+        )
+        
+        reader.read(source)
+        
+        probe_call, read_call = format_reader.options.call_args_list
+        assert probe_call.kwargs == {
+            "url": "jdbc:postgresql://db/app",
+            "fetchsize": "10000",
+            "query": f"SELECT MIN(order_id) AS lo, MAX(order_id) AS hi FROM {dbtable}",
+        }
+        assert read_call.kwargs == {
+            "url": "jdbc:postgresql://db/app",
+            "fetchsize": "10000",
+            "dbtable": dbtable,
+            "partitionColumn": "order_id",
+            "numPartitions": 4,
+            "lowerBound": "1",
+            "upperBound": "500",
+        }
+
+
+    def test_reader_options_not_sent_to_driver(self, mock_context, mock_spark):
+        """Test that pushdown options are applied on the scan, not passed as JDBC options."""
+        reader = DataReader(mock_context)
+        source = SourceConfig(
+            type="jdbc",
+            connection_string="jdbc:postgresql://db/app",
+            table="orders",
+            options={"pushdown_filter": "id > 5", "columns": ["id"], "user": "etl"},
+        )
+        
+        result = reader.read(source)
+        
+        format_reader = mock_spark.read.format.return_value
+        format_reader.options.assert_called_once_with(
+            url="jdbc:postgresql://db/app", fetchsize="10000", dbtable="orders", user="etl"
+        )
+        loaded = format_reader.options.return_value.load.return_value
+        loaded.filter.assert_called_once_with("id > 5")
+        assert result is loaded.filter.return_value.select.return_value
+    
+    def test_partition_tuning_rejected(self, mock_context):
+        """Test that tune_partitioning fails instead of being ignored."""
+        source = SourceConfig(
+            type="jdbc",
+            connection_string="jdbc:postgresql://db/app",
+            table="orders",
+            options={"tune_partitioning": True},
+        )
+        
+        with pytest.raises(DataReaderError, match="tune_partitioning"):
+            DataReader(mock_context).read(source)
+
+
+class TestReadStream:
+    """Tests for streaming reads."""
+    
+    def test_delta_table_stream_bounded(self, mock_context, mock_spark):
+        """Test that Delta streams default the per-trigger limits and honour overrides."""
+        reader = DataReader(mock_context)
+        source = SourceConfig(
+            type="delta", catalog="c", schema="s", table="t",
+            options={"maxFilesPerTrigger": "50"},
+        )
+        
+        reader.read_stream(source)
+        
+        stream_reader = mock_spark.readStream.format.return_value
+        stream_reader.options.assert_called_once_with(maxFilesPerTrigger="50", maxBytesPerTrigger="1g")
+        stream_reader.options.return_value.table.assert_called_once_with("c.s.t")
+    
+    def test_stream_reader_options_applied(self, mock_context, mock_spark):
+        """Test that pushdown options filter the stream instead of reaching Spark."""
+        reader = DataReader(mock_context)
+        source = SourceConfig(
+            type="json", path="/mnt/events",
+            options={"pushdown_filter": "ok", "maxFilesPerTrigger": "5"},
+        )
+        
+        result = reader.read_stream(source)
+        
+        stream_reader = mock_spark.readStream.format.return_value
+        stream_reader.options.assert_called_once_with(maxFilesPerTrigger="5")
+        loaded = stream_reader.options.return_value.load.return_value
+        assert result is loaded.filter.return_value
+        loaded.filter.assert_called_once_with("ok")
+
+
+class TestDeltaTimeTravel:
+    """Tests for Delta version/timestamp reads."""
+    
+    def test_table_read_passes_version(self, mock_context, mock_spark):
+        """Test that time-travel options reach a table read."""
+        reader = DataReader(mock_context)
+        source = SourceConfig(
+            type="delta", catalog="c", schema="s", table="t",
+            options={"versionAsOf": 3, "pushdown_filter": "dt = '2024-01-01'"},
+        )
+        
+        result = reader.read(source)
+        
+        mock_spark.read.options.assert_called_once_with(versionAsOf=3)
+        table_df = mock_spark.read.options.return_value.table.return_value
+        mock_spark.read.options.return_value.table.assert_called_once_with("c.s.t")
+        assert result is table_df.filter.return_value
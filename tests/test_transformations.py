@@ -4,7 +4,6 @@ Unit tests for the transformations module.
 
 import pytest
 from unittest.mock import MagicMock, patch
-from pyspark.sql import functions as F
 
 from datalib.transformations.base import (
     Transformation,
@@ -22,279 +21,396 @@ from datalib.transformations.common import (
     DropColumns,
     FillNulls,
     StandardizeStrings,
+    HashColumn,
 )
 
 
+class _StubTransformation(Transformation):
+    """Hand-written test double recording the DataFrames it receives."""
+    
+    def __init__(self, out=None):
+        self.out = out
+        self.calls = []
+    
+    def transform(self, df):
+        self.calls.append(df)
+        return self.out if self.out is not None else df
+
+
 class TestAddTimestampColumn:
     """Tests for AddTimestampColumn transformation."""
     
-    def test_add_default_timestamp(self):
+    def test_add_default_timestamp(self, df_mock):
         """Test adding timestamp with default column name."""
-        mock_df = MagicMock()
-        mock_df.withColumn.return_value = mock_df
-        
         transform = AddTimestampColumn()
-        result = transform.transform(mock_df)
+        result = transform.transform(df_mock)
         
-        mock_df.withColumn.assert_called_once()
-        call_args = mock_df.withColumn.call_args
+        df_mock.withColumn.assert_called_once()
+        call_args = df_mock.withColumn.call_args
         assert call_args[0][0] == "ingestion_timestamp"
     
-    def test_add_custom_column_name(self):
+    def test_add_custom_column_name(self, df_mock):
         """Test adding timestamp with custom column name."""
-        mock_df = MagicMock()
-        mock_df.withColumn.return_value = mock_df
-        
         transform = AddTimestampColumn(column_name="created_at")
-        result = transform.transform(mock_df)
+        result = transform.transform(df_mock)
         
-        call_args = mock_df.withColumn.call_args
+        call_args = df_mock.withColumn.call_args
         assert call_args[0][0] == "created_at"
 
 
 class TestCastColumns:
     """Tests for CastColumns transformation."""
     
-    def test_cast_single_column(self):
-        """Test casting a single column."""
-        mock_df = MagicMock()
-        mock_df.columns = ["id", "name"]
-        mock_df.withColumn.return_value = mock_df
-        
-        transform = CastColumns({"id": "string"})
-        result = transform.transform(mock_df)
-        
-        mock_df.withColumn.assert_called_once()
-    
-    def test_cast_multiple_columns(self):
-        """Test casting multiple columns."""
-        mock_df = MagicMock()
-        mock_df.columns = ["id", "amount", "count"]
-        mock_df.withColumn.return_value = mock_df
-        
-        transform = CastColumns({
-            "id": "string",
-            "amount": "double",
-            "count": "integer"
-        })
-        result = transform.transform(mock_df)
-        
-        assert mock_df.withColumn.call_count == 3
+    @pytest.mark.parametrize("column_types", [
+        {"id": "string"},
+        {"id": "string", "amount": "double", "count": "integer"},
+    ])
+    def test_cast_columns(self, fake_df, column_types):
+        """Test casting one or more columns."""
+        df = fake_df(list(column_types) + ["name"])
+        
+        transform = CastColumns(column_types)
+        result = transform.transform(df)
+        
+        # All casts land in one projection
+        [(args, _)] = df.calls_to("withColumns")
+        assert list(args[0]) == list(column_types)
+        assert df.calls_to("withColumn") == []
     
-    def test_cast_missing_column_not_strict(self):
+    def test_cast_missing_column_not_strict(self, fake_df):
         """Test that missing column is skipped when not strict."""
-        mock_df = MagicMock()
-        mock_df.columns = ["id"]
-        mock_df.withColumn.return_value = mock_df
+        df = fake_df(["id"])
         
         transform = CastColumns({"missing_col": "string"}, strict=False)
-        result = transform.transform(mock_df)
+        result = transform.transform(df)
         
-        mock_df.withColumn.assert_not_called()
+        assert df.calls == []
+        assert result is df
+    
+    def test_unknown_type_rejected_at_construction(self):
+        """Test that an unknown type name fails before any DataFrame is touched."""
+        with pytest.raises(TransformationError):
+            CastColumns({"id": "uuid"})
     
-    def test_cast_missing_column_strict(self):
+    def test_cast_missing_column_strict(self, fake_df):
         """Test that missing column raises error when strict."""
-        mock_df = MagicMock()
-        mock_df.columns = ["id"]
+        df = fake_df(["id"])
         
         transform = CastColumns({"missing_col": "string"}, strict=True)
         
         with pytest.raises(TransformationError) as exc_info:
-            transform.transform(mock_df)
+            transform.transform(df)
         assert "not found" in str(exc_info.value)
+    
+    def test_column_expressions_skip_missing(self):
+        """Test fusable expressions cover only existing columns."""
+        transform = CastColumns({"id": "string", "missing_col": "double"})
+        
+        expressions = transform.column_expressions(["id", "name"])
+        
+        assert list(expressions) == ["id"]
+        assert transform.input_columns() == {"id", "missing_col"}
 
 
 class TestRenameColumns:
     """Tests for RenameColumns transformation."""
     
-    def test_rename_single_column(self):
-        """Test renaming a single column."""
-        mock_df = MagicMock()
-        mock_df.columns = ["old_name"]
-        mock_df.withColumnRenamed.return_value = mock_df
+    @pytest.mark.parametrize("mapping", [
+        {"old_name": "new_name"},
+        {"col1": "new_col1", "col2": "new_col2"},
+    ])
+    def test_rename_columns(self, fake_df, mapping):
+        """Test renaming one or more columns."""
+        df = fake_df(list(mapping))
+        
+        transform = RenameColumns(mapping)
+        result = transform.transform(df)
+        
+        # All renames land in one projection
+        assert df.calls == [("withColumnsRenamed", (mapping,), {})]
+    
+    def test_rename_missing_column_strict(self, fake_df):
+        """Test that a missing column raises before anything is renamed."""
+        df = fake_df(["col1"])
         
-        transform = RenameColumns({"old_name": "new_name"})
-        result = transform.transform(mock_df)
+        transform = RenameColumns({"col1": "a", "missing": "b"}, strict=True)
         
-        mock_df.withColumnRenamed.assert_called_once_with("old_name", "new_name")
+        with pytest.raises(TransformationError):
+            transform.transform(df)
+        assert df.calls == []
     
-    def test_rename_multiple_columns(self):
-        """Test renaming multiple columns."""
-        mock_df = MagicMock()
-        mock_df.columns = ["col1", "col2"]
-        mock_df.withColumnRenamed.return_value = mock_df
+    @pytest.mark.parametrize("strict", [False, True])
+    def test_chained_renames_applied_in_order(self, fake_df, strict):
+        """Test that a -> b, b -> c renames a to c, matching column_selection."""
+        df = fake_df(["a", "x"])
+        transform = RenameColumns({"a": "b", "b": "c"}, strict=strict)
         
-        transform = RenameColumns({
-            "col1": "new_col1",
-            "col2": "new_col2"
-        })
-        result = transform.transform(mock_df)
+        transform.transform(df)
         
-        assert mock_df.withColumnRenamed.call_count == 2
+        assert df.calls == [("withColumnsRenamed", ({"a": "c"},), {})]
+        assert transform.column_selection(["a", "x"]) == [("a", "c"), ("x", "x")]
 
 
 class TestFilterRows:
     """Tests for FilterRows transformation."""
     
-    def test_filter_with_condition(self):
-        """Test filtering with a condition."""
-        mock_df = MagicMock()
-        mock_df.filter.return_value = mock_df
-        
-        transform = FilterRows("amount > 0")
-        result = transform.transform(mock_df)
-        
-        mock_df.filter.assert_called_once_with("amount > 0")
-    
-    def test_filter_negated(self):
-        """Test filtering with negated condition."""
-        mock_df = MagicMock()
-        mock_df.filter.return_value = mock_df
-        
-        transform = FilterRows("status = 'deleted'", negate=True)
-        result = transform.transform(mock_df)
-        
-        mock_df.filter.assert_called_once()
+    @pytest.mark.parametrize("negate, expected", [
+        (False, "amount > 0"),
+        (True, "NOT (amount > 0)"),
+    ])
+    def test_filter(self, fake_df, negate, expected):
+        """Test filtering with a plain or negated condition."""
+        df = fake_df(["amount"])
+        
+        transform = FilterRows("amount > 0", negate=negate)
+        result = transform.transform(df)
+        
+        assert len(df.calls_to("filter")) == 1
+        assert transform.filter_condition() == expected
 
 
 class TestDeduplicateRows:
     """Tests for DeduplicateRows transformation."""
     
-    def test_deduplicate_all_columns(self):
+    def test_deduplicate_all_columns(self, df_mock):
         """Test deduplication on all columns."""
-        mock_df = MagicMock()
-        mock_df.dropDuplicates.return_value = mock_df
-        
         transform = DeduplicateRows(keep="none")
-        result = transform.transform(mock_df)
+        result = transform.transform(df_mock)
         
-        mock_df.dropDuplicates.assert_called_once()
+        df_mock.dropDuplicates.assert_called_once()
     
-    def test_deduplicate_subset(self):
+    def test_deduplicate_subset(self, df_mock):
         """Test deduplication on subset of columns."""
-        mock_df = MagicMock()
-        mock_df.dropDuplicates.return_value = mock_df
-        
         transform = DeduplicateRows(subset=["id", "name"], keep="none")
-        result = transform.transform(mock_df)
+        result = transform.transform(df_mock)
         
-        mock_df.dropDuplicates.assert_called_once_with(["id", "name"])
+        df_mock.dropDuplicates.assert_called_once_with(["id", "name"])
+    
+    def test_prefilter_applied_before_dedup(self, df_mock):
+        """Test that prefilter and drop_nulls filter rows ahead of deduplication."""
+        df_mock.columns = ["id", "name"]
+        
+        transform = DeduplicateRows(subset=["id"], keep="none", prefilter="name <> ''", drop_nulls=True)
+        result = transform.transform(df_mock)
+        
+        df_mock.filter.assert_called_once_with("(name <> '') AND `id` IS NOT NULL")
+        df_mock.dropDuplicates.assert_called_once_with(["id"])
+    
+    def test_keep_latest_by_aggregate(self, df_mock):
+        """Test that keep='first' with order_by uses an aggregate, not a window."""
+        df_mock.columns = ["id", "updated_at", "name"]
+        df_mock.dtypes = [("id", "int"), ("updated_at", "timestamp"), ("name", "string")]
+        
+        with patch("datalib.transformations.common.F") as functions:
+            transform = DeduplicateRows(subset=["id"], keep="first", order_by=["updated_at"])
+            transform.transform(df_mock)
+        
+        df_mock.groupBy.assert_called_once_with("id")
+        functions.max.assert_called_once()
+        functions.min.assert_not_called()
+        df_mock.withColumn.assert_not_called()
 
 
 class TestSelectColumns:
     """Tests for SelectColumns transformation."""
     
-    def test_select_existing_columns(self):
+    def test_select_existing_columns(self, df_mock):
         """Test selecting existing columns."""
-        mock_df = MagicMock()
-        mock_df.columns = ["id", "name", "email"]
-        mock_df.select.return_value = mock_df
+        df_mock.columns = ["id", "name", "email"]
         
         transform = SelectColumns(["id", "name"])
-        result = transform.transform(mock_df)
+        result = transform.transform(df_mock)
         
-        mock_df.select.assert_called_once_with(["id", "name"])
+        df_mock.select.assert_called_once_with(["id", "name"])
     
-    def test_select_missing_column_strict(self):
+    def test_select_missing_column_strict(self, df_mock):
         """Test error when selecting missing column in strict mode."""
-        mock_df = MagicMock()
-        mock_df.columns = ["id"]
+        df_mock.columns = ["id"]
         
         transform = SelectColumns(["id", "missing"], strict=True)
         
         with pytest.raises(TransformationError):
-            transform.transform(mock_df)
+            transform.transform(df_mock)
 
 
 class TestDropColumns:
     """Tests for DropColumns transformation."""
     
-    def test_drop_existing_columns(self):
-        """Test dropping existing columns."""
-        mock_df = MagicMock()
-        mock_df.columns = ["id", "temp", "internal"]
-        mock_df.drop.return_value = mock_df
-        
-        transform = DropColumns(["temp", "internal"])
-        result = transform.transform(mock_df)
+    @pytest.mark.parametrize("columns, expected_calls", [
+        (["temp", "internal"], [(("temp", "internal"), {})]),
+        (["missing"], []),
+    ])
+    def test_drop_columns(self, fake_df, columns, expected_calls):
+        """Test dropping existing columns; missing ones are ignored by default."""
+        df = fake_df(["id", "temp", "internal"])
+        
+        transform = DropColumns(columns)
+        result = transform.transform(df)
+        
+        assert df.calls_to("drop") == expected_calls
+
+
+class TestFillNulls:
+    """Tests for FillNulls transformation."""
+    
+    def test_fill_restricted_to_subset(self, df_mock):
+        """Test that only subset columns are filled."""
+        transform = FillNulls({"amount": 0, "status": "unknown"}, subset=["status"])
+        transform.transform(df_mock)
         
-        assert mock_df.drop.call_count == 2
+        df_mock.fillna.assert_called_once_with({"status": "unknown"})
+
+
+class TestStandardizeStrings:
+    """Tests for StandardizeStrings transformation."""
     
-    def test_drop_missing_column_ignored(self):
-        """Test that missing column is ignored by default."""
-        mock_df = MagicMock()
-        mock_df.columns = ["id"]
-        mock_df.drop.return_value = mock_df
+    def test_standardize_in_one_projection(self, df_mock):
+        """Test that all existing columns are standardized in one projection."""
+        df_mock.columns = ["name", "email"]
         
-        transform = DropColumns(["missing"])
-        result = transform.transform(mock_df)
+        transform = StandardizeStrings(["name", "email", "missing"], lowercase=True)
+        transform.transform(df_mock)
         
-        mock_df.drop.assert_not_called()
+        df_mock.withColumn.assert_not_called()
+        df_mock.withColumns.assert_called_once()
+        assert list(df_mock.withColumns.call_args[0][0]) == ["name", "email"]
 
 
 class TestChainedTransformation:
     """Tests for ChainedTransformation."""
     
-    def test_chain_multiple_transformations(self):
+    def test_chain_multiple_transformations(self, df_mock):
         """Test chaining multiple transformations."""
-        mock_df = MagicMock()
-        
         # Create mock transformations
-        trans1 = MagicMock(spec=Transformation)
-        trans1.transform.return_value = mock_df
-        
-        trans2 = MagicMock(spec=Transformation)
-        trans2.transform.return_value = mock_df
+        trans1 = _StubTransformation(out=df_mock)
+        trans2 = _StubTransformation(out=df_mock)
         
         chain = ChainedTransformation([trans1, trans2])
-        result = chain.transform(mock_df)
+        result = chain.transform(df_mock)
         
-        trans1.transform.assert_called_once()
-        trans2.transform.assert_called_once()
+        assert trans1.calls == [df_mock]
+        assert trans2.calls == [df_mock]
     
     def test_append_transformation(self):
         """Test appending transformation to chain."""
-        trans1 = MagicMock(spec=Transformation)
+        trans1 = _StubTransformation()
         chain = ChainedTransformation([trans1])
         
-        trans2 = MagicMock(spec=Transformation)
+        trans2 = _StubTransformation()
         result = chain.append(trans2)
         
         assert len(chain.transformations) == 2
         assert result == chain  # Returns self for chaining
+    
+    def test_adjacent_steps_fused(self, df_mock):
+        """Test that filters and casts collapse into one filter and one projection."""
+        df_mock.columns = ["id", "amount"]
+        
+        chain = ChainedTransformation([
+            FilterRows("amount > 0"),
+            FilterRows("status = 'deleted'", negate=True),
+            CastColumns({"id": "string"}),
+            CastColumns({"amount": "double"}),
+        ])
+        chain.transform(df_mock)
+        
+        df_mock.filter.assert_called_once_with("(amount > 0) AND (NOT (status = 'deleted'))")
+        df_mock.withColumns.assert_called_once()
+        assert list(df_mock.withColumns.call_args[0][0]) == ["id", "amount"]
+    
+    def test_select_rename_drop_collapse_to_select_expr(self, df_mock):
+        """Test that column selections compose into a single selectExpr."""
+        df_mock.columns = ["id", "name", "temp"]
+        
+        chain = ChainedTransformation([
+            RenameColumns({"name": "full_name"}),
+            DropColumns(["temp"]),
+            SelectColumns(["full_name", "id"]),
+        ])
+        chain.transform(df_mock)
+        
+        df_mock.selectExpr.assert_called_once_with("`name` AS `full_name`", "`id` AS `id`")
+        df_mock.withColumnRenamed.assert_not_called()
+        df_mock.drop.assert_not_called()
 
 
 class TestConditionalTransformation:
     """Tests for ConditionalTransformation."""
     
-    def test_apply_when_condition_true(self):
+    def test_apply_when_condition_true(self, df_mock):
         """Test transformation applied when condition is true."""
-        mock_df = MagicMock()
-        mock_df.columns = ["target_col"]
+        df_mock.columns = ["target_col"]
         
-        inner_trans = MagicMock(spec=Transformation)
-        inner_trans.transform.return_value = mock_df
+        inner_trans = _StubTransformation(out=df_mock)
         
         conditional = ConditionalTransformation(
             transformation=inner_trans,
             condition=lambda df: "target_col" in df.columns
         )
-        result = conditional.transform(mock_df)
+        result = conditional.transform(df_mock)
+        
+        assert len(inner_trans.calls) == 1
+    
+    def test_apply_when_string_condition_true(self, df_mock):
+        """Test that a string condition behaves like the equivalent lambda."""
+        df_mock.columns = ["target_col"]
+        inner_trans = _StubTransformation(out=df_mock)
+        
+        conditional = ConditionalTransformation(inner_trans, '"target_col" in df.columns')
+        conditional.transform(df_mock)
+        
+        df_mock.columns = ["other_col"]
+        conditional.transform(df_mock)
         
-        inner_trans.transform.assert_called_once()
+        assert len(inner_trans.calls) == 1
     
-    def test_skip_when_condition_false(self):
+    def test_skip_when_condition_false(self, df_mock):
         """Test transformation skipped when condition is false."""
-        mock_df = MagicMock()
-        mock_df.columns = ["other_col"]
+        df_mock.columns = ["other_col"]
         
-        inner_trans = MagicMock(spec=Transformation)
+        inner_trans = _StubTransformation()
         
         conditional = ConditionalTransformation(
             transformation=inner_trans,
             condition=lambda df: "target_col" in df.columns
         )
-        result = conditional.transform(mock_df)
+        result = conditional.transform(df_mock)
+        
+        assert inner_trans.calls == []
+        assert result == df_mock
+    
+    def test_condition_cached_by_schema(self, df_mock):
+        """Test that the condition runs once per schema when caching."""
+        df_mock.schema.simpleString.return_value = "struct<target_col:int>"
+        condition = MagicMock(return_value=True)
+        inner_trans = _StubTransformation(out=df_mock)
+        
+        conditional = ConditionalTransformation(inner_trans, condition, cache_by_schema=True)
+        conditional.transform(df_mock)
+        conditional.transform(df_mock)
+        
+        condition.assert_called_once_with(df_mock)
+        assert len(inner_trans.calls) == 2
+
+
+class TestHashColumn:
+    """Tests for HashColumn transformation."""
+    
+    def test_xxhash64_hashes_columns_directly(self, df_mock):
+        """Test that xxhash64 skips string building and the expression is reused."""
+        with patch("datalib.transformations.common.F") as functions:
+            transform = HashColumn("row_hash", ["id", "name"], algorithm="xxhash64")
+            transform.transform(df_mock)
+            transform.transform(df_mock)
+        
+        functions.xxhash64.assert_called_once()
+        functions.concat_ws.assert_not_called()
+        df_mock.withColumn.assert_called_with("row_hash", functions.xxhash64.return_value)
+    
+    def test_murmur3_uses_spark_hash(self, df_mock):
+        """Test that murmur3 maps to Spark's built-in hash function."""
+        with patch("datalib.transformations.common.F") as functions:
+            HashColumn("row_hash", ["id"], algorithm="murmur3").transform(df_mock)
         
-        inner_trans.transform.assert_not_called()
-        assert result == mock_df
+        functions.hash.assert_called_once()
+        functions.sha2.assert_not_called()
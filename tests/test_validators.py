@@ -0,0 +1,138 @@
+"""
+Unit tests for the validators module.
+"""
+
+from datetime import datetime
+
+import pytest
+from unittest.mock import MagicMock
+
+from datalib.utils.validators import (
+    ValidationError,
+    check_data_freshness,
+    run_quality_checks,
+    validate_config,
+    validate_schema,
+)
+
+
+class TestValidateConfig:
+    """Tests for validate_config."""
+    
+    def test_nested_fields_present(self):
+        """Test that dotted paths resolve through nested dicts."""
+        config = {"pipeline": {"name": "orders"}, "target": {"table": "t"}}
+        
+        assert validate_config(config, ["pipeline.name", "target"]) is True
+    
+    def test_missing_and_non_dict_paths_reported(self):
+        """Test that absent keys and paths through scalars are both missing."""
+        config = {"pipeline": {"name": "orders"}}
+        
+        with pytest.raises(ValidationError) as exc_info:
+            validate_config(config, ["pipeline.owner", "pipeline.name.first", "pipeline.name"])
+        
+        assert "['pipeline.owner', 'pipeline.name.first']" in str(exc_info.value)
+
+
+
+class TestValidateSchema:
+    """Tests for validate_schema."""
+    
+    @staticmethod
+    def _schema(*fields):
+        schema = MagicMock()
+        schema.fields = [MagicMock(dataType=dtype) for _, dtype in fields]
+        for field, (name, _) in zip(schema.fields, fields):
+            field.name = name
+        return schema
+    
+    def test_strict_reports_missing_extra_and_mismatched(self):
+        """Test that strict validation reports every kind of difference."""
+        df = MagicMock()
+        df.schema = self._schema(("id", "int"), ("name", "varchar"), ("extra", "int"))
+        expected = self._schema(("id", "int"), ("name", "string"), ("email", "string"))
+        
+        result = validate_schema(df, expected, strict=True)
+        
+        assert result["valid"] is False
+        assert result["missing_columns"] == ["email"]
+        assert result["extra_columns"] == ["extra"]
+        assert result["type_mismatches"] == [
+            {"column": "name", "expected": "string", "actual": "varchar"}
+        ]
+
+
+class TestRunQualityChecks:
+    """Tests for run_quality_checks."""
+    
+    def test_row_checks_share_one_aggregation(self):
+        """Test that row-level checks and the row count come from one job."""
+        df = MagicMock()
+        df.agg.return_value.first.return_value = {"_total": 100, "_check_0": 0, "_check_1": 5}
+        checks = [
+            {"type": "not_null", "column": "id"},
+            {"type": "values", "column": "status", "allowed": ["a", "b"], "threshold": 0.1},
+            {"type": "row_count", "min": 1},
+        ]
+        
+        results = run_quality_checks(df, checks)
+        
+        df.agg.assert_called_once()
+        df.count.assert_not_called()
+        assert results["passed"] == 3
+        assert [c["failed_count"] for c in results["checks"]] == [0, 5, 0]
+    
+    def test_failing_check_isolated_when_combined_job_fails(self):
+        """Test that a broken check errors alone when the fused job fails."""
+        df = MagicMock()
+        df.agg.return_value.first.side_effect = [Exception("boom"), (0,), Exception("no column")]
+        df.count.return_value = 10
+        checks = [
+            {"type": "not_null", "column": "id"},
+            {"type": "not_null", "column": "missing"},
+        ]
+        
+        results = run_quality_checks(df, checks)
+        
+        assert results["checks"][0]["passed"] is True
+        assert results["checks"][1]["message"] == "Check error: no column"
+    
+    def test_no_count_without_row_level_checks_or_thresholds(self):
+        """Test that a unique-only run doesn't scan for the row count."""
+        df = MagicMock()
+        
+        run_quality_checks(df, [{"type": "unique", "column": "id"}])
+        
+        df.agg.assert_not_called()
+        df.count.assert_not_called()
+    
+    def test_malformed_threshold_reported_per_check(self):
+        """Test that a null threshold errors only its own check."""
+        df = MagicMock()
+        df.agg.return_value.first.return_value = {"_total": 10, "_check_0": 2, "_check_1": 0}
+        checks = [
+            {"type": "not_null", "column": "id", "threshold": None},
+            {"type": "not_null", "column": "name"},
+        ]
+        
+        results = run_quality_checks(df, checks)
+        
+        assert results["checks"][0]["message"].startswith("Check error:")
+        assert results["checks"][1]["passed"] is True
+
+
+class TestCheckDataFreshness:
+    """Tests for check_data_freshness."""
+    
+    def test_bounds_from_one_aggregation(self):
+        """Test that latest and oldest timestamps come from a single job."""
+        now = datetime.now()
+        df = MagicMock()
+        df.agg.return_value.first.return_value = {"latest": now, "oldest": datetime(2020, 1, 1)}
+        
+        result = check_data_freshness(df, "updated_at", max_age_hours=1)
+        
+        df.agg.assert_called_once()
+        assert result["is_fresh"]
+        assert result["oldest_record"] == "2020-01-01 00:00:00"
@@ -0,0 +1,172 @@
+"""
+Unit tests for the data writer.
+"""
+
+import sys
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from datalib.core.config import TargetConfig
+from datalib.io.writer import DataWriter, _merge_plan
+
+
+@pytest.fixture(autouse=True)
+def delta_table():
+    """Stand-in for delta.tables.DeltaTable whose last commit wrote 7 rows."""
+    tables = MagicMock()
+    history = tables.DeltaTable.forName.return_value.history.return_value
+    history.select.return_value.collect.return_value = [[{"numOutputRows": "7"}]]
+    with patch.dict(sys.modules, {"delta": MagicMock(tables=tables), "delta.tables": tables}):
+        yield tables.DeltaTable
+
+
+class TestWriteCounts:
+    """Tests for record counting during writes."""
+    
+    def test_overwrite_counts_via_observation(self, mock_context):
+        """Test that non-Delta writes read the count from an unnamed observation."""
+        df = MagicMock()
+        observation = MagicMock()
+        observation.get = {"n": 42}
+        target = TargetConfig(catalog="c", schema="s", table="t", format="parquet")
+        
+        with patch("datalib.io.writer.Observation", return_value=observation) as factory:
+            count = DataWriter(mock_context).write(df, target)
+        
+        assert count == 42
+        factory.assert_called_once_with()
+        df.count.assert_not_called()
+        df.observe.return_value.write.format.assert_called_once_with("parquet")
+    
+    def test_delta_counts_from_commit_metrics(self, mock_context, delta_table):
+        """Test that Delta writes take the count from the commit, not an observation."""
+        df = MagicMock()
+        target = TargetConfig(catalog="c", schema="s", table="t", mode="append")
+        
+        with patch("datalib.io.writer.Observation") as factory:
+            count = DataWriter(mock_context).write(df, target)
+        
+        assert count == 7
+        factory.assert_not_called()
+        df.observe.assert_not_called()
+        delta_table.forName.assert_called_once_with(mock_context.spark, "c.s.t")
+    
+    def test_fixed_output_partitions(self, mock_context):
+        """Test that num_output_partitions repartitions before the write."""
+        df = MagicMock()
+        target = TargetConfig(
+            catalog="c", schema="s", table="t",
+            mode="append", partition_by=["dt"], options={"num_output_partitions": 4},
+        )
+        
+        DataWriter(mock_context).write(df, target)
+        
+        df.repartition.assert_called_once_with(4, "dt")
+        df.repartition.return_value.write.format.assert_called_once_with("delta")
+    
+    def test_target_file_size_restored_after_write(self, mock_context, mock_spark):
+        """Test that the advisory partition size only applies during the write."""
+        mock_spark.conf.get.return_value = "64m"
+        df = MagicMock()
+        target = TargetConfig(
+            catalog="c", schema="s", table="t",
+            mode="append", options={"target_file_size_mb": 256},
+        )
+        
+        DataWriter(mock_context).write(df, target)
+        
+        df.hint.assert_called_once_with("rebalance")
+        key = "spark.sql.adaptive.advisoryPartitionSizeInBytes"
+        assert mock_spark.conf.set.call_args_list[-2:] == [((key, "256m"),), ((key, "64m"),)]
+    
+    def test_schema_created_once(self, mock_context, mock_spark):
+        """Test that repeated writes issue the CREATE SCHEMA DDL once."""
+        target = TargetConfig(catalog="c", schema="s", table="t", mode="append")
+        writer = DataWriter(mock_context)
+        
+        writer.write(MagicMock(), target)
+        writer.write(MagicMock(), target)
+        
+        ddl = [c for c in mock_spark.sql.call_args_list if "CREATE SCHEMA" in c[0][0]]
+        assert len(ddl) == 1
+
+
+class TestWriteStream:
+    """Tests for streaming writes."""
+    
+    def test_new_delta_table_gets_compaction_properties(self, mock_context, mock_spark):
+        """Test that compaction is requested per table, not via session confs."""
+        df = MagicMock()
+        target = TargetConfig(
+            catalog="c", schema="s", table="t",
+            options={"delta.autoOptimize.autoCompact": "false"},
+        )
+        
+        with patch.object(mock_context, "table_exists", return_value=False):
+            DataWriter(mock_context).write_stream(df, target, "/chk")
+        
+        writer = df.writeStream.format.return_value.outputMode.return_value.option.return_value
+        writer.options.assert_called_once_with(**{
+            "delta.autoOptimize.optimizeWrite": "true",
+            "delta.autoOptimize.autoCompact": "false",
+        })
+        mock_spark.conf.set.assert_not_called()
+        mock_spark.sql.assert_not_called()
+    
+    def test_existing_delta_table_altered(self, mock_context, mock_spark):
+        """Test that an existing target gets the properties set on the table."""
+        df = MagicMock()
+        target = TargetConfig(catalog="c", schema="s", table="t")
+        
+        with patch.object(mock_context, "table_exists", return_value=True):
+            DataWriter(mock_context).write_stream(df, target, "/chk")
+        
+        mock_spark.sql.assert_called_once_with(
+            "ALTER TABLE c.s.t SET TBLPROPERTIES ("
+            "'delta.autoOptimize.optimizeWrite' = 'true', "
+            "'delta.autoOptimize.autoCompact' = 'true')"
+        )
+        mock_spark.conf.set.assert_not_called()
+
+
+class TestOptimize:
+    """Tests for the post-write OPTIMIZE gate."""
+    
+    def test_recent_optimize_skipped(self, mock_context, mock_spark):
+        """Test that OPTIMIZE is skipped within the minimum interval."""
+        target = TargetConfig(catalog="c", schema="s", table="t", options={"optimize": True})
+        
+        with patch.object(
+            type(mock_context), "get_table_properties",
+            return_value={"datalib.lastOptimizeTimestamp": str(int(time.time()) - 3600)},
+        ):
+            DataWriter(mock_context)._optimize_table(target)
+        
+        mock_spark.sql.assert_not_called()
+    
+    def test_invalid_timestamp_property_optimizes(self, mock_context, mock_spark):
+        """Test that a non-numeric last-optimize property is treated as never optimized."""
+        target = TargetConfig(catalog="c", schema="s", table="t", options={"optimize": True})
+        
+        with patch.object(
+            type(mock_context), "get_table_properties",
+            return_value={"datalib.lastOptimizeTimestamp": "yesterday"},
+        ):
+            DataWriter(mock_context)._optimize_table(target)
+        
+        mock_spark.sql.assert_any_call("OPTIMIZE c.s.t")
+
+
+class TestMergePlan:
+    """Tests for the cached MERGE plan."""
+    
+    def test_plan_built_once_per_layout(self):
+        """Test that the merge plan is reused for the same columns and keys."""
+        plan = _merge_plan(("id", "name"), ("id",))
+        
+        assert plan[0] == "target.id = source.id"
+        assert plan[1] == {"name": "source.name"}
+        assert plan[2] == {"id": "source.id", "name": "source.name"}
+        assert _merge_plan(("id", "name"), ("id",)) is plan